@@ -0,0 +1,65 @@
+"""
+Micro-benchmark of the boolean converters.
+
+Compares the table-driven converter returned by make_boolean with the former
+closure-based implementation for exact hits, normalized hits and misses.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_boolean.py``.
+"""
+
+import timeit
+
+from fancy import config as cfg
+from fancy.config.process.boolean import TRUE_CHOICES, FALSE_CHOICES
+
+
+def closure_boolean(value, true_choices=None, false_choices=None):
+    if true_choices is None:
+        true_choices = TRUE_CHOICES
+    if false_choices is None:
+        false_choices = FALSE_CHOICES
+
+    if isinstance(value, str):
+        _value = value.strip().lower()
+        if _value in true_choices:
+            return True
+        if _value in false_choices:
+            return False
+        raise ValueError(
+            f"unexpected value: {value}, expected choices:"
+            f" {str(set(true_choices).union(false_choices))}"
+        )
+    return bool(value)
+
+
+def make_closure_boolean(true_choices=None, false_choices=None):
+    def _inner(value):
+        return closure_boolean(value, true_choices, false_choices)
+
+    return _inner
+
+
+def convert_all(converter, values):
+    try:
+        for value in values:
+            converter(value)
+    except ValueError:
+        pass
+
+
+def main():
+    size = 200_000
+    converters = {"closure": make_closure_boolean(), "table": cfg.make_boolean()}
+    for case, value in (("hit", "true"), ("normalized hit", " yEs "), ("miss", "maybe")):
+        # a miss raises, so it is measured per call
+        values = [value] * (size if case != "miss" else 1)
+        number = 1 if case != "miss" else size
+        results = {
+            name: min(timeit.repeat(lambda: convert_all(converter, values), number=number, repeat=5))
+            for name, converter in converters.items()
+        }
+        print(f"{case} x{size}: " + ", ".join(f"{name} {t * 1000:.1f}ms" for name, t in results.items()))
+
+
+if __name__ == "__main__":
+    main()
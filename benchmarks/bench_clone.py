@@ -0,0 +1,53 @@
+"""
+Benchmark of copying config trees.
+
+Copies a cluster config with 10^3 server sub-configs with ``copy.deepcopy``, with
+``clone()`` and with ``clone()`` of the frozen config, which shares the sub-configs,
+overriding one option in the clones.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_clone.py``.
+"""
+
+import copy
+import time
+
+from fancy import config as cfg
+
+NUMBER = 1_000
+REPEAT = 20
+
+
+class ServerConfig(cfg.BaseConfig):
+    host = cfg.Option(type=str, required=True)
+    port = cfg.Option(type=int, default=80)
+    tags = cfg.Option(type=[str], default=[])
+
+
+class ClusterConfig(cfg.BaseConfig):
+    name = cfg.Option(type=str, default="cluster")
+    servers = cfg.Option(type=[ServerConfig])
+
+
+def _timed(name, fn):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    print(f"{name} x{REPEAT}: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+def _deepcopy(config):
+    new = copy.deepcopy(config)
+    new.name = "variant"
+    return new
+
+
+def main():
+    config = ClusterConfig({"servers": [{"host": f"host{i}", "tags": ["a", "b"]} for i in range(NUMBER)]})
+    frozen = ClusterConfig({"servers": [{"host": f"host{i}", "tags": ["a", "b"]} for i in range(NUMBER)]}).freeze()
+    _timed("deepcopy", lambda: _deepcopy(config))
+    _timed("clone", lambda: config.clone(name="variant"))
+    _timed("clone (frozen)", lambda: frozen.clone(name="variant"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark of creating configurations which mostly use default values.
+
+Reads all options of 10^5 configurations for the first time, which assigns the
+default values, and compares it with converting the defaults for every instance.
+The sub-config defaults, which are cloned instead of loaded, are measured on their own too.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_defaults.py``.
+"""
+
+import time
+
+from fancy import config as cfg
+
+NUMBER = 100_000
+
+
+class SubConfig(cfg.BaseConfig):
+    a = cfg.Option(type=int, default=0)
+
+
+class MyConfig(cfg.BaseConfig):
+    port = cfg.Option(type=int, default=8080)
+    host = cfg.Option(type=str, default="localhost")
+    debug = cfg.Option(type=bool, default="off")
+    ratios = cfg.Option(type=tuple, default=(0.5, 0.5))
+    tags = cfg.Option(type=[str], default=["a", "b", "c"])
+    sub = cfg.Option(type=SubConfig, default={})
+
+
+def _read(configs):
+    for config in configs:
+        _ = config.port, config.host, config.debug, config.ratios, config.tags, config.sub
+
+
+def _read_sub(configs):
+    for config in configs:
+        _ = config.sub
+
+
+def _without_shared_defaults(configs, read=_read):
+    options = MyConfig.get_all_options().values()
+    original = {option: option._assign_default for option in options}
+    for option in options:
+        option._assign_default = lambda instance, option=option: option.__set__(instance, option._default)
+    try:
+        read(configs)
+    finally:
+        for option, assign_default in original.items():
+            option._assign_default = assign_default
+
+
+def main():
+    benchmarks = {
+        "shared defaults": _read,
+        "converted per instance": _without_shared_defaults,
+        "cloned sub-configs": _read_sub,
+        "sub-configs loaded per instance": lambda configs: _without_shared_defaults(configs, _read_sub),
+    }
+    for name, fn in benchmarks.items():
+        configs = [MyConfig({}) for _ in range(NUMBER)]
+        start = time.perf_counter()
+        fn(configs)
+        print(f"{name} x{NUMBER}: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
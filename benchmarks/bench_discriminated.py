@@ -0,0 +1,57 @@
+"""
+Benchmark of loading heterogeneous lists of sub-configs.
+
+Loads a list of 10^4 storage configs whose classes are selected by their ``kind``
+field, with a discriminated element type and with the manual approach of loading
+plain dicts and creating the configs through ConfigFactory afterwards.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_discriminated.py``.
+"""
+
+import time
+
+from fancy import config as cfg
+
+NUMBER = 10_000
+
+
+class StorageConfig(cfg.BaseConfig):
+    kind = cfg.Option(type=str, required=True)
+
+
+class S3StorageConfig(StorageConfig):
+    bucket = cfg.Option(type=str, required=True)
+
+
+class LocalStorageConfig(StorageConfig):
+    root = cfg.Option(type=str, default="/var/data")
+
+
+class DiscriminatedConfig(cfg.BaseConfig):
+    storages = cfg.Option(type=[cfg.discriminated({"s3": S3StorageConfig, "local": LocalStorageConfig})])
+
+
+class ManualConfig(cfg.BaseConfig):
+    storages = cfg.Option(type=list)
+
+
+def _manual(raw):
+    config = ManualConfig({"storages": raw})
+    names = {"s3": "S3Storage", "local": "LocalStorage"}
+    return [cfg.ConfigFactory.create_config(names[item["kind"]], cfg.DictConfigLoader(item)) for item in config.storages]
+
+
+def main():
+    raw = [{"kind": "s3", "bucket": f"bucket{i}"} if i % 2 else {"kind": "local"} for i in range(NUMBER)]
+    cases = {
+        "discriminated": lambda: DiscriminatedConfig({"storages": raw}),
+        "manual ConfigFactory": lambda: _manual(raw),
+    }
+    for name, fn in cases.items():
+        start = time.perf_counter()
+        fn()
+        print(f"{name} x{NUMBER}: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
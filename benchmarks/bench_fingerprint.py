@@ -0,0 +1,46 @@
+"""
+Benchmark of fingerprinting a config tree.
+
+Computes the fingerprint of a cluster config with 10^4 server sub-configs from scratch,
+again without changes, and after changing a single server, compared with hashing the
+JSON dump of ``to_dict()``.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_fingerprint.py``.
+"""
+
+import hashlib
+import json
+import time
+
+from fancy import config as cfg
+
+NUMBER = 10_000
+
+
+class ServerConfig(cfg.BaseConfig):
+    host = cfg.Option(type=str, required=True)
+    port = cfg.Option(type=int, default=80)
+    tags = cfg.Option(type=[str], default=[])
+
+
+class ClusterConfig(cfg.BaseConfig):
+    servers = cfg.Option(type=[ServerConfig])
+
+
+def _timed(name, fn):
+    start = time.perf_counter()
+    fn()
+    print(f"{name}: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+def main():
+    config = ClusterConfig({"servers": [{"host": f"host{i}", "tags": ["a", "b"]} for i in range(NUMBER)]})
+    _timed("json dump of to_dict()", lambda: hashlib.blake2b(json.dumps(config.to_dict(), sort_keys=True).encode()))
+    _timed("fingerprint (cold)", config.fingerprint)
+    _timed("fingerprint (cached)", config.fingerprint)
+    config.servers[NUMBER // 2].port = 8080
+    _timed("fingerprint (one server changed)", config.fingerprint)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark of the memory used by flag_container.
+
+Processes a large container where only a few subtrees contain flagged strings,
+with the former deepcopy-based implementation, the copy-on-write default,
+the in-place mode and the streaming variant, measuring the peak memory with tracemalloc.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_flag_container.py``.
+"""
+
+import time
+import tracemalloc
+from copy import deepcopy
+from typing import MutableMapping, MutableSequence
+
+from fancy.config.process import flag_container, flag_string, iter_flag_container
+
+
+def deepcopy_flag_container(container):
+    result = deepcopy(container)
+    opening = [result]
+    while len(opening) > 0:
+        container = opening.pop()
+        keys = container.keys() if isinstance(container, MutableMapping) else range(len(container))
+        for k in keys:
+            if isinstance(container[k], (MutableMapping, MutableSequence)):
+                opening.append(container[k])
+            else:
+                container[k] = flag_string(container[k])
+    return result
+
+
+def make_container(size):
+    return {
+        f"tenant{i}": {
+            "hosts": [f"host{j}.example.com" for j in range(10)],
+            "limits": {"rps": 100, "burst": 200},
+            "port": "!int:8080" if i % 100 == 0 else 8080,
+        }
+        for i in range(size)
+    }
+
+
+def measure(name, fn):
+    container = make_container(20_000)
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(container)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name}: {elapsed * 1000:.1f}ms, peak {peak / 2 ** 20:.2f}MiB")
+
+
+def main():
+    measure("deepcopy", deepcopy_flag_container)
+    measure("copy-on-write", flag_container)
+    measure("in-place", lambda c: flag_container(c, inplace=True))
+    measure("streaming", lambda c: sum(1 for _ in iter_flag_container(c)))
+
+
+if __name__ == "__main__":
+    main()
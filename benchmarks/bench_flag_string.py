@@ -0,0 +1,57 @@
+"""
+Benchmark of flag_string over a large flagged container.
+
+Compares the registry-based flag_string with the former ``eval``-based
+implementation on a container with tens of thousands of flagged values.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_flag_string.py``.
+"""
+
+import time
+
+from fancy.config.process import boolean, flag_container, flag_string
+
+
+def eval_flag_string(value):
+    if not isinstance(value, str):
+        return value
+    if value.startswith("!"):
+        type_name, real_val = value[1:].split(":", maxsplit=1)
+        cls = eval(type_name)
+        if type(cls) is not type:
+            raise TypeError(f"{type_name} is not a type")
+        if cls is bool:
+            return boolean(real_val)
+        return cls(real_val)
+    return value
+
+
+def make_container(size):
+    return {
+        f"tenant{i}": {"port": f"!int:{8000 + i}", "ratio": f"!float:0.{i}", "enabled": "!bool:yes", "name": "plain"}
+        for i in range(size)
+    }
+
+
+def main():
+    container = make_container(10_000)
+    leaves = [value for tenant in container.values() for value in tenant.values()]
+
+    start = time.perf_counter()
+    expected = [eval_flag_string(value) for value in leaves]
+    eval_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = [flag_string(value) for value in leaves]
+    registry_time = time.perf_counter() - start
+
+    assert result == expected
+    print(f"{len(leaves)} leaves: eval {eval_time * 1000:.1f}ms, registry {registry_time * 1000:.1f}ms")
+
+    start = time.perf_counter()
+    flag_container(container)
+    print(f"flag_container: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
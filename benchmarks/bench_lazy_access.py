@@ -0,0 +1,61 @@
+"""
+Benchmark of accesses to computed lazy values.
+
+Runs 10^6 accesses to a cached value of a plain and a thread-safe Lazy, and
+measures how many times a slow value is computed when 8 threads access it at once.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_lazy_access.py``.
+"""
+
+import threading
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+from fancy import config as cfg
+
+NUMBER = 1_000_000
+N_THREADS = 8
+
+
+def _slow_value(config):
+    config.calls += 1
+    time.sleep(0.1)
+    return 42
+
+
+class MyConfig(cfg.BaseConfig):
+    plain = cfg.Lazy(lambda c: 42)
+    thread_safe = cfg.Lazy(lambda c: 42, thread_safe=True)
+    slow = cfg.Lazy(_slow_value)
+    slow_thread_safe = cfg.Lazy(_slow_value, thread_safe=True)
+
+    calls = 0
+
+
+def _count_computations(name):
+    config = MyConfig()
+    barrier = threading.Barrier(N_THREADS)
+
+    def access():
+        barrier.wait()
+        return getattr(config, name)
+
+    with ThreadPoolExecutor(N_THREADS) as executor:
+        for _ in range(N_THREADS):
+            executor.submit(access)
+    return config.calls
+
+
+def main():
+    config = MyConfig()
+    for name in ("plain", "thread_safe"):
+        getattr(config, name)
+        elapsed = min(timeit.repeat(lambda: getattr(config, name), number=NUMBER, repeat=3))
+        print(f"cached {name} x{NUMBER}: {elapsed * 1000:.1f}ms")
+    for name in ("slow", "slow_thread_safe"):
+        print(f"{name} with {N_THREADS} threads: computed {_count_computations(name)} times")
+
+
+if __name__ == "__main__":
+    main()
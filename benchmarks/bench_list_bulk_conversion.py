@@ -0,0 +1,36 @@
+"""
+Benchmark of the bulk conversion of scalar elements in ConfigListStructure.
+
+Loads lists of 10^5 and 10^6 scalars with the bulk conversion and with the
+generic per-element pipeline.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_list_bulk_conversion.py``.
+"""
+
+import time
+
+from fancy import config as cfg
+
+
+class Context(cfg.BaseConfig):
+    pass
+
+
+def load(typ, data, bulk):
+    structure = cfg.ConfigListStructure(typ)
+    structure._is_scalar = bulk
+    start = time.perf_counter()
+    structure.load_by_context(Context(), data)
+    return time.perf_counter() - start
+
+
+def main():
+    for size in (10 ** 5, 10 ** 6):
+        for typ, data in ((int, list(range(size))), (str, [str(i) for i in range(size)]), (bool, ["yes"] * size)):
+            generic = load(typ, data, bulk=False)
+            bulk = load(typ, data, bulk=True)
+            print(f"[{typ.__name__}] x{size}: generic {generic * 1000:.1f}ms, bulk {bulk * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
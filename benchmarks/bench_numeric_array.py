@@ -0,0 +1,47 @@
+"""
+Benchmark of numeric array options against list options of numbers.
+
+Loads 1M-element numeric vectors through `Option(type=[float])` and
+`Option(type=numeric_array(float))`, and reports the time and the peak memory.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_numeric_array.py``.
+"""
+
+import time
+import tracemalloc
+
+from fancy import config as cfg
+
+SIZE = 1_000_000
+
+
+class ListConfig(cfg.BaseConfig):
+    weights = cfg.Option(type=[float])
+
+
+class ArrayConfig(cfg.BaseConfig):
+    weights = cfg.Option(type=cfg.numeric_array(float))
+
+
+def measure(config_type, data):
+    start = time.perf_counter()
+    config_type(weights=data)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    config = config_type(weights=data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del config
+    return elapsed, peak
+
+
+def main():
+    data = [i * 0.5 for i in range(SIZE)]
+    for config_type in (ListConfig, ArrayConfig):
+        elapsed, peak = measure(config_type, data)
+        print(f"{config_type.__name__}: {elapsed * 1000:.1f}ms, peak {peak / 2 ** 20:.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
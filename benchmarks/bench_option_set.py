@@ -0,0 +1,45 @@
+"""
+Benchmark of assignments to options.
+
+Runs 10^6 assignments to scalar, nullable and sub-config options, and compares
+the specialized scalar setter with the generic auto_process_value path.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_option_set.py``.
+"""
+
+import timeit
+
+from fancy import config as cfg
+
+NUMBER = 1_000_000
+
+
+class SubConfig(cfg.BaseConfig):
+    a = cfg.Option(type=int, default=0)
+
+
+class MyConfig(cfg.BaseConfig):
+    port = cfg.Option(type=int)
+    name = cfg.Option(type=str)
+    ratio = cfg.Option(type=float, nullable=True)
+    sub = cfg.Option(type=SubConfig)
+
+
+def main():
+    config = MyConfig()
+    sub = SubConfig(a=1)
+    port_option = MyConfig.__dict__["port"]
+    cases = {
+        "int (specialized)": lambda: setattr(config, "port", 8080),
+        "int (generic path)": lambda: port_option._set_structure(config, 8080),
+        "str": lambda: setattr(config, "name", "service"),
+        "nullable float (None)": lambda: setattr(config, "ratio", None),
+        "sub-config instance": lambda: setattr(config, "sub", sub),
+    }
+    for name, fn in cases.items():
+        elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3))
+        print(f"{name} x{NUMBER}: {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of the parallel loading of lists of sub-configs.
+
+Loads a list of sub-configs whose ``post_load`` is CPU-heavy or I/O-heavy,
+serially and with thread and process pools of different sizes.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_parallel_config_list.py``.
+"""
+
+import os
+import re
+import time
+
+from fancy import config as cfg
+
+SIZE = 400
+
+
+class CpuServiceConfig(cfg.BaseConfig):
+    name = cfg.Option(type=str)
+
+    def post_load(self):
+        # compile uncached regexes to simulate CPU-heavy work
+        for i in range(20):
+            re.compile(f"^{self.name}-{i}-(a|b|c)+[0-9]{{2,4}}$", re.IGNORECASE)
+        re.purge()
+
+
+class IoServiceConfig(cfg.BaseConfig):
+    name = cfg.Option(type=str)
+
+    def post_load(self):
+        time.sleep(0.002)  # simulate resolving hosts from a file
+
+
+def make_config_type(element_type, **kwargs):
+    typ = [element_type] if not kwargs else cfg.parallel_config_list(element_type, **kwargs)
+
+    class ClusterConfig(cfg.BaseConfig):
+        services = cfg.Option(type=typ)
+
+    return ClusterConfig
+
+
+def measure(config_type, data):
+    start = time.perf_counter()
+    config_type(services=data)
+    return time.perf_counter() - start
+
+
+def main():
+    data = [{"name": f"service{i}"} for i in range(SIZE)]
+    print(f"cpu count: {os.cpu_count()}")
+    for element_type in (CpuServiceConfig, IoServiceConfig):
+        print(f"{element_type.__name__} x{SIZE}:")
+        print(f"  serial: {measure(make_config_type(element_type), data) * 1000:.1f}ms")
+        for executor in ("thread", "process"):
+            for workers in (2, 4, 8):
+                config_type = make_config_type(element_type, executor=executor, max_workers=workers, chunk_size=25)
+                print(f"  {executor} x{workers}: {measure(config_type, data) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark of accessing config values by paths.
+
+Reads ``db.replicas[2].host`` 10^5 times with ``get_path``, with a manual resolution which
+parses the path and goes through ``__getitem__`` at each level, and with attribute accesses.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_paths.py``.
+"""
+
+import re
+import time
+
+from fancy import config as cfg
+
+NUMBER = 100_000
+PATH = "db.replicas[2].host"
+
+
+class ReplicaConfig(cfg.BaseConfig):
+    host = cfg.Option(type=str, required=True)
+
+
+class DbConfig(cfg.BaseConfig):
+    replicas = cfg.Option(type=[ReplicaConfig], default=[])
+
+
+class AppConfig(cfg.BaseConfig):
+    db = cfg.Option(type=DbConfig, default={})
+
+
+def _manual(config, path):
+    value = config
+    for name, index in re.findall(r"([^.\[\]]+)|\[(\d+)\]", path):
+        value = value[name] if name else value[int(index)]
+    return value
+
+
+def main():
+    config = AppConfig({"db": {"replicas": [{"host": f"host{i}"} for i in range(4)]}})
+    cases = {
+        "get_path": lambda: config.get_path(PATH),
+        "manual __getitem__": lambda: _manual(config, PATH),
+        "attributes": lambda: config.db.replicas[2].host,
+    }
+    for name, fn in cases.items():
+        start = time.perf_counter()
+        for _ in range(NUMBER):
+            fn()
+        print(f"{name} x{NUMBER}: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
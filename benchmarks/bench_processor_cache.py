@@ -0,0 +1,49 @@
+"""
+Benchmark of the processor cache of `auto_process_typ`.
+
+Loads a config containing many lists of sub-configs and resolves list processors
+with and without the memoized processors.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_processor_cache.py``.
+"""
+
+import sys
+import timeit
+
+from fancy import config as cfg
+
+
+class LeafConfig(cfg.BaseConfig):
+    a = cfg.Option(type=int)
+
+
+class ItemConfig(cfg.BaseConfig):
+    leaves = cfg.Option(type=[LeafConfig])
+    matrix = cfg.Option(type=[[int]])
+
+
+class RootConfig(cfg.BaseConfig):
+    items = cfg.Option(type=[ItemConfig])
+
+
+DATA = {"items": [{"leaves": [{"a": 1}], "matrix": [[1], [2]]} for _ in range(2000)]}
+
+
+def uncached_process_typ(typ):
+    if isinstance(typ, list):
+        return sys.modules["fancy.config.process.auto_process_typ"]._process_typ(typ)
+    return cfg.process.auto_process_typ(typ)
+
+
+def main():
+    number = 20000
+    cached = timeit.timeit(lambda: cfg.process.auto_process_typ([[LeafConfig]]), number=number)
+    uncached = timeit.timeit(lambda: uncached_process_typ([[LeafConfig]]), number=number)
+    print(f"resolve [[LeafConfig]] x{number}: cached {cached:.4f}s, uncached {uncached:.4f}s")
+
+    load = min(timeit.repeat(lambda: RootConfig(DATA), number=5, repeat=3)) / 5
+    print(f"load {len(DATA['items'])} items with 3 lists each: {load * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,22 +9,43 @@ Key components:
 - BaseConfig: Base class for creating configuration classes
 - Option: For defining configuration options with validation and type conversion
 - PlaceHolder and Lazy: For defining computed or placeholder values
+- AsyncLazy: For defining computed values which require I/O, awaited in asyncio
+- MemoizedLazy: For defining computed values shared by the configs with the same inputs
+- TimedLazy: For defining computed values which are refreshed in the background
 - ConfigLoaders: For loading configuration from different sources
+
+The modules which depend on heavy standard libraries or third-party packages (asyncio,
+concurrent.futures, PyYAML) are imported when one of their names is first accessed.
 """
 
 __all__ = [
     "attribute_setters",
     "process",
     "config_list",
+    "parallel_config_list",
+    "config_dict",
+    "discriminated",
     "make_boolean",
     "identical",
+    "numeric_array",
     "ConfigContext",
     "ConfigStructure",
     "ConfigStructureVisitor",
     "PlaceHolder",
     "Lazy",
+    "AsyncLazy",
+    "MemoizedLazy",
+    "LazyCache",
+    "TimedLazy",
+    "resolve_async_lazies",
+    "precompute_lazies",
+    "diff_configs",
+    "clone_config",
+    "ConfigChange",
     "Option",
     "ConfigListStructure",
+    "ParallelConfigListStructure",
+    "ConfigDictStructure",
     "BaseConfigLoader",
     "DictBasedConfigLoader",
     "PathBasedConfigLoader",
@@ -42,8 +63,12 @@ from . import attribute_setters
 from . import process
 from .process import (
     config_list,
+    parallel_config_list,
+    config_dict,
+    discriminated,
     make_boolean,
-    identical
+    identical,
+    numeric_array
 )
 
 from .config_context import ConfigContext
@@ -52,7 +77,6 @@ from .config_structure_visitor import ConfigStructureVisitor
 from .placeholder import PlaceHolder
 from .lazy import Lazy
 from .option import Option
-from .config_list_struct import ConfigListStructure
 from .config_loaders import (
     BaseConfigLoader,
     DictBasedConfigLoader,
@@ -61,7 +85,38 @@ from .config_loaders import (
     DictConfigLoader
 )
 from .base_config import BaseConfig
-
-from .config_loader_factory import ConfigLoaderFactory
-from .config_factory import ConfigFactory
 from .consts import IGNORED_NAME
+
+_LAZY_ATTRIBUTES = {
+    "AsyncLazy": ".async_lazy",
+    "resolve_async_lazies": ".async_lazy",
+    "MemoizedLazy": ".memoized_lazy",
+    "LazyCache": ".memoized_lazy",
+    "TimedLazy": ".timed_lazy",
+    "precompute_lazies": ".precompute",
+    "diff_configs": ".diff",
+    "clone_config": ".clone",
+    "ConfigChange": ".diff",
+    "ConfigListStructure": ".config_list_struct",
+    "ParallelConfigListStructure": ".config_list_struct",
+    "ConfigDictStructure": ".config_dict_struct",
+    "ConfigLoaderFactory": ".config_loader_factory",
+    "ConfigFactory": ".config_factory",
+}
+"""
+The names exported by this package which are imported on first access, mapped to their modules.
+"""
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module  # lazy import
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,15 +6,30 @@ __all__ = [
     "attribute_setters",
     "process",
     "config_list",
+    "parallel_config_list",
+    "config_dict",
+    "discriminated",
     "make_boolean",
     "identical",
+    "numeric_array",
     "ConfigContext",
     "ConfigStructure",
     "ConfigStructureVisitor",
     "PlaceHolder",
     "Lazy",
+    "AsyncLazy",
+    "MemoizedLazy",
+    "LazyCache",
+    "TimedLazy",
+    "resolve_async_lazies",
+    "precompute_lazies",
+    "diff_configs",
+    "clone_config",
+    "ConfigChange",
     "Option",
     "ConfigListStructure",
+    "ParallelConfigListStructure",
+    "ConfigDictStructure",
     "BaseConfigLoader",
     "DictBasedConfigLoader",
     "PathBasedConfigLoader",
@@ -26,13 +41,15 @@ __all__ = [
     "IGNORED_NAME",
 ]
 
-from collections.abc import Callable, Sequence
-from typing import Any, Literal, NoReturn, overload
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Executor
+from typing import Any, Hashable, Literal, NamedTuple, NoReturn, overload
 
 from . import attribute_setters
 
 from . import process
-from .process import config_list, make_boolean, identical
+from .process import config_list, parallel_config_list, config_dict, discriminated, make_boolean, identical, \
+    numeric_array
 
 from .config_context import ConfigContext
 from .config_structure import ConfigStructure
@@ -41,7 +58,8 @@ from .placeholder import PlaceHolder
 
 # from .lazy import Lazy
 # from .option import Option
-from .config_list_struct import ConfigListStructure
+from .config_list_struct import ConfigListStructure, ParallelConfigListStructure
+from .config_dict_struct import ConfigDictStructure
 from .config_loaders import (
     BaseConfigLoader,
     DictBasedConfigLoader,
@@ -50,6 +68,8 @@ from .config_loaders import (
     DictConfigLoader,
 )
 from .base_config import BaseConfig
+from .diff import ConfigChange, diff_configs
+from .clone import clone_config
 
 from .config_loader_factory import ConfigLoaderFactory
 from .config_factory import ConfigFactory
@@ -62,9 +82,74 @@ class Lazy[GV](PlaceHolder[GV]):
         name: str | None = None,
         description: str | None = None,
         hidden: bool = False,
+        thread_safe: bool = False,
     ) -> None: ...
+    @property
+    def thread_safe(self) -> bool: ...
     def __set__(self, instance: BaseConfig, raw_value: Any) -> NoReturn: ...
 
+class AsyncLazy[GV](Lazy[Awaitable[GV]]):
+    def __init__(
+        self,
+        fn: Callable[[Any], Awaitable[GV] | GV],
+        name: str | None = None,
+        description: str | None = None,
+        hidden: bool = False,
+    ) -> None: ...
+    def is_computed(self, instance: BaseConfig) -> bool: ...
+    def get_computed(self, instance: BaseConfig) -> GV: ...
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+class LazyCache:
+    maxsize: int
+    weak: bool
+    def __init__(self, maxsize: int = 1024, weak: bool = True) -> None: ...
+    def get_or_compute[T](self, key: Hashable, compute: Callable[[], T]) -> T: ...
+    def cache_info(self) -> CacheInfo: ...
+    def clear(self) -> None: ...
+
+class MemoizedLazy[GV](Lazy[GV]):
+    depends_on: tuple[str, ...] | None
+    cache: LazyCache
+    def __init__(
+        self,
+        fn: Callable[[Any], GV],
+        depends_on: Sequence[str] | None = None,
+        cache: LazyCache | None = None,
+        name: str | None = None,
+        description: str | None = None,
+        hidden: bool = False,
+        thread_safe: bool = False,
+    ) -> None: ...
+
+class TimedLazy[GV](Lazy[GV]):
+    ttl: float
+    on_refresh_error: Callable[[BaseConfig, Exception], None]
+    def __init__(
+        self,
+        fn: Callable[[Any], GV],
+        ttl: float,
+        on_refresh_error: Callable[[BaseConfig, Exception], None] | None = None,
+        executor: Executor | None = None,
+        name: str | None = None,
+        description: str | None = None,
+        hidden: bool = False,
+    ) -> None: ...
+
+async def resolve_async_lazies(structure: ConfigStructure) -> None: ...
+
+def precompute_lazies(
+    structure: ConfigStructure,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> dict[str, float]: ...
+
 #! Only for single-layer nesting; typing for more complex nesting is not supported.
 type _Nested[SV, GV] = list[Callable[[SV], GV]]
 type _NestedValue[V] = list[V]
@@ -0,0 +1,177 @@
+import asyncio
+import inspect
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Generator, Generic, List, Optional, TypeVar, Union, \
+    overload
+
+from . import ConfigStructure, dependencies
+from .lazy import Lazy
+from .placeholder import PlaceHolder
+from .utils.tree import iter_configs
+
+if TYPE_CHECKING:
+    from . import BaseConfig
+
+GV = TypeVar("GV")
+
+
+class AsyncLazy(Generic[GV], Lazy[Awaitable[GV]]):
+    """
+    Represents a lazily computed value which requires I/O, like reading a secrets file.
+
+    Accessing an AsyncLazy on an instance returns an awaitable. The function may be a
+    coroutine function, and it is run once per instance as an asyncio task, which all
+    concurrent awaiters share. The value is cached when the task finishes; if it
+    raises, all the awaiters get the exception, and nothing is cached.
+    Like other lazy values, the cached value is removed when the placeholders read
+    by the function, also after awaiting, are set or deleted.
+
+    Example usage:
+    ```python
+    class MyConfig(BaseConfig):
+        secret_path = Option(type=str)
+
+        secret = AsyncLazy[str](read_secret)  # async def read_secret(c): ...
+
+    async def main(config):
+        secret = await config.secret
+    ```
+
+    Only computed values are included in ``to_dict``; see :func:`resolve_async_lazies`.
+    """
+    _tasks: Dict[int, "asyncio.Task"]
+
+    def __init__(
+        self,
+        fn: Callable[[Any], Union[Awaitable[GV], GV]],
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        hidden: bool = False,
+    ):
+        """
+        Initialize the lazy value with a function to compute it.
+
+        :param fn: A function or a coroutine function that computes the value when needed.
+                   Takes the config instance as its argument.
+        :param name: Optional custom name for the lazy value (defaults to attribute name)
+        :param description: Optional description of the lazy value
+        :param hidden: Whether the lazy value should be hidden from to_dict output
+        """
+        super().__init__(fn, name, description, hidden)
+        self._tasks = {}
+
+    @overload
+    def __get__(self, instance: "BaseConfig", owner) -> Awaitable[GV]:
+        ...
+    @overload
+    def __get__(self, instance: None, owner) -> "AsyncLazy":  # TODO: Self
+        ...
+    def __get__(self, instance: Optional["BaseConfig"], owner):
+        """
+        Get an awaitable of the value of this lazy attribute.
+
+        If the value is not computed yet, a task computing it is started in the running
+        event loop, unless another caller has already started it.
+        Cancelling an awaiter doesn't cancel the shared task.
+
+        :param instance: The instance on which the lazy value is accessed
+        :param owner: The class that owns this lazy value
+        :return: An awaitable of the value, or the AsyncLazy object itself
+        :raises RuntimeError: If the value is not computed yet and there is no running event loop
+        """
+        if instance is None:
+            return self
+
+        if dependencies.tracking:
+            dependencies.record(instance, self.__name__)
+        values = vars(instance)
+        if self.__name__ in values:
+            return _Computed(values[self.__name__])
+
+        key = id(instance)
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._compute(instance))
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return asyncio.shield(task)
+
+    def is_computed(self, instance: "BaseConfig") -> bool:
+        """
+        Check if the value has been computed for an instance.
+
+        :param instance: The instance to check
+        :return: True if the value is cached, False otherwise
+        """
+        return PlaceHolder.is_assigned(self, instance)
+
+    def get_computed(self, instance: "BaseConfig") -> GV:
+        """
+        Get the computed value without awaiting.
+
+        :param instance: The instance to get the value from
+        :return: The cached value
+        :raises AttributeError: If the value has not been computed yet
+        """
+        try:
+            return vars(instance)[self.__name__]
+        except KeyError:
+            raise AttributeError(f"attribute '{self.__name__}' of '{type(instance).__name__}' is not computed yet.")
+
+    async def _compute(self, instance: "BaseConfig") -> GV:
+        generation = dependencies.generation(instance)
+        dependencies.begin(instance, self.__name__)  # the reads of the task, also after awaiting
+        try:
+            value = self.fn(instance)
+            if inspect.isawaitable(value):
+                value = await value
+        finally:
+            dependencies.end()
+        if dependencies.generation(instance) == generation:  # not computed from old values
+            vars(instance)[self.__name__] = value
+        return value
+
+    def _forget(self, key: int, task: "asyncio.Task") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+
+class _Computed:
+    """
+    An awaitable of a computed value, which doesn't need an event loop.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self.value
+        yield  # make it a generator
+
+
+async def resolve_async_lazies(structure: ConfigStructure) -> None:
+    """
+    Compute all async lazy values of a configuration tree concurrently.
+
+    The tree is traversed through the assigned options, and the lists and dictionaries
+    of sub-configs; lazy values are not computed to find sub-configs. All the async lazy
+    values are awaited with ``asyncio.gather``, so the first exception is raised after
+    all of them are finished.
+
+    :param structure: The root of the configuration tree
+    :raises Exception: The first exception raised by the computations
+    """
+    awaitables = [
+        getattr(config, placeholder.__name__)
+        for _, config in iter_configs(structure)
+        for placeholder in config.get_all_placeholders().values()
+        if isinstance(placeholder, AsyncLazy)
+    ]
+    await _gather(awaitables)
+
+
+async def _gather(awaitables: List[Awaitable[Any]]) -> None:
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
@@ -1,7 +1,7 @@
 from abc import ABC
 import typing
 import warnings
-from typing import Dict, List, overload, Any, Callable, Optional
+from typing import TYPE_CHECKING, Dict, List, overload, Any, Callable, Optional, Sequence, TypeVar
 
 from . import (
     ConfigStructure,
@@ -14,9 +14,18 @@ from . import (
 )
 from . import Option
 from .utils import inspect, Dispatcher, DispatcherError
-from . import visitors
+from .utils.registry import ClassRegistry, capitalize_first
+from .dependencies import DEPENDENTS_ATTRIBUTE
+from .frozen import FROZEN_ATTRIBUTE, HASH_ATTRIBUTE, freeze_value, immutable_value, is_frozen_value
+from .utils.freeze import freeze
 from ..config import BaseConfigLoader
 
+C = TypeVar("C", bound="BaseConfig")
+
+if TYPE_CHECKING:
+    from .diff import ConfigChange
+    from .precompute import LazyTimings
+
 
 class BaseConfig(ConfigStructure, ConfigContext, ABC):
     """
@@ -40,7 +49,13 @@ class BaseConfig(ConfigStructure, ConfigContext, ABC):
     
     config = MyConfig(a=1, b="custom text")
     ```
+
+    A frozen config (see :meth:`freeze`) can't be modified, and is hashable and compared
+    by the values of its options. With ``class MyConfig(cfg.BaseConfig, frozen=True)``,
+    the instances are frozen when they are loaded.
     """
+    _frozen: bool = False
+    _freeze_on_load: bool = False
     _name_mapping: Optional[Dict[str, str]] = None
     _all_placeholders: Optional[Dict[str, PlaceHolder]] = None
     _all_options: Optional[Dict[str, Option]] = None
@@ -90,13 +105,22 @@ class BaseConfig(ConfigStructure, ConfigContext, ABC):
     @_method_init_.implement
     def __init__(self, *args, **kwargs): ...
 
-    def __init_subclass__(cls, **kwargs):
+    def __init_subclass__(cls, aliases: Sequence[str] = (), frozen: Optional[bool] = None, **kwargs):
+        """
+        Register the subclass to be created by name (see :class:`ConfigFactory`).
+
+        :param aliases: The other names of the subclass, e.g. ``class DbConfig(BaseConfig, aliases=["database"])``
+        :param frozen: If true, the instances are frozen when they are loaded, inherited by default
+        """
+        config_registry.register(cls, aliases)
+        if frozen is not None:
+            cls._freeze_on_load = frozen
         cls._name_mapping = None
         cls._all_placeholders = None
         cls._all_options = None
         cls._all_required_options = None
 
-    def load(self, loader: "BaseConfigLoader") -> None:
+    def load(self, loader: "BaseConfigLoader", precompute: bool = False) -> Optional["LazyTimings"]:
         """
         Load configuration data from the provided loader.
         
@@ -104,11 +128,35 @@ class BaseConfig(ConfigStructure, ConfigContext, ABC):
         then runs post-processing and custom post-load logic.
         
         :param loader: A configuration loader
+        :param precompute: If true, compute all the lazy values of the configuration tree
+                           after loading, see :meth:`precompute_lazies`
+        :return: The timings of the lazy values if precompute is true, None otherwise
+        :raises exc.FrozenConfigError: If the configuration is frozen
         """
+        if self._frozen:
+            raise exc.FrozenConfigError(self)
         self._loader = loader
         loader.load(self)
         self._postprocessing()
         self.post_load()
+        if self._freeze_on_load:
+            self.freeze()
+        if precompute:
+            return self.precompute_lazies()
+        return None
+
+    def precompute_lazies(self, max_workers: Optional[int] = None) -> "LazyTimings":
+        """
+        Compute all the lazy values of this configuration tree concurrently in a thread pool.
+
+        This warms up the configuration, so the first accesses of the lazy values are cheap.
+
+        :param max_workers: The maximum number of threads
+        :return: The seconds taken to compute each lazy value, keyed by its path like ``servers[0].address``
+        :raises Exception: The first exception raised by the computations
+        """
+        from .precompute import precompute_lazies  # lazy import
+        return precompute_lazies(self, max_workers)
 
     def _postprocessing(self) -> None:
         """
@@ -216,6 +264,7 @@ class BaseConfig(ConfigStructure, ConfigContext, ABC):
                 "the parameter 'load_lazies' is deprecated and will be removed in 1.0.0.",
                 DeprecationWarning,
             )
+        from . import visitors  # lazy import
         visitor = visitors.ToCollectionVisitor(
             recursive=recursive, set_circular_to_none=prevent_circular, filter=filter
         )
@@ -249,17 +298,211 @@ class BaseConfig(ConfigStructure, ConfigContext, ABC):
         Clear all placeholder values in this configuration.
         
         This removes all assigned values, returning the configuration to an unloaded state.
+
+        :raises exc.FrozenConfigError: If the configuration is frozen
         """
+        if self._frozen:
+            raise exc.FrozenConfigError(self)
         for placeholder in self.get_all_placeholders().values():
             placeholder.__delete__(self)
 
+    def get_path(self, path: str) -> Any:
+        """
+        Get a value of this configuration tree by its path, like ``db.replicas[2].host``.
+
+        The path is compiled once per class and path, see :mod:`fancy.config.paths`.
+
+        :param path: The path of the value
+        :return: The value
+        :raises ValueError: If the path is not valid
+        :raises KeyError: If a name or a key in the path is not found, or doesn't apply to the value
+        :raises IndexError: If an index in the path is out of range
+        """
+        from .paths import compile_path  # lazy import
+        return compile_path(type(self), path).get(self)
+
+    def set_path(self, path: str, value: Any) -> None:
+        """
+        Set a value of this configuration tree by its path, like ``db.replicas[2].host``.
+
+        The value is converted by the type of the option, list or dictionary which contains it.
+
+        :param path: The path of the value
+        :param value: The value to set
+        :raises ValueError: If the path is not valid
+        :raises KeyError: If a name or a key in the path is not found, or doesn't apply to the value
+        :raises IndexError: If an index in the path is out of range
+        """
+        from .paths import compile_path  # lazy import
+        compile_path(type(self), path).set(self, value)
+
+    def clone(self: "C", **overrides: Any) -> "C":
+        """
+        Copy this configuration and override some of its values.
+
+        The stored values are copied without being converted again, and immutable values,
+        frozen sub-configs and the loader are shared, see :func:`clone_config`.
+
+        :param overrides: The new values, keyed by their configuration names
+        :return: The new configuration
+        :raises KeyError: If an override doesn't match a placeholder
+        """
+        from .clone import clone_config  # lazy import
+        return clone_config(self, **overrides)
+
+    def diff(self, other: "BaseConfig") -> List["ConfigChange"]:
+        """
+        Find the values which differ between this configuration and another one of the same class.
+
+        :param other: The new configuration, e.g. the configuration after reloading
+        :return: The paths of the changed values with the old and new values, see :func:`diff_configs`
+        :raises TypeError: If the configurations are not of the same class
+        """
+        from .diff import diff_configs  # lazy import
+        return diff_configs(self, other)
+
+    def fingerprint(self) -> str:
+        """
+        Get a stable digest of the visible values of this configuration tree.
+
+        Configurations with the same values have the same fingerprint, in any process,
+        regardless of the order of the values. Lazy values are not included.
+        The digests of the sub-configs are cached, and removed when they are modified,
+        so unchanged subtrees aren't hashed again.
+
+        :return: The hexadecimal BLAKE2b digest
+        :raises TypeError: If a value can't be fingerprinted
+        """
+        from . import visitors  # lazy import
+        visitor = visitors.FingerprintVisitor()
+        self.accept(visitor)
+        return visitor.get_result().hex()
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Check if the configuration is frozen.
+
+        :return: True if the configuration can't be modified, False otherwise
+        """
+        return self._frozen
+
+    def freeze(self) -> "BaseConfig":
+        """
+        Make this configuration and its sub-configs, lists and dictionaries immutable.
+
+        The default values of the options are assigned first, and setting, deleting or
+        loading values raises :class:`exc.FrozenConfigError` afterwards.
+        Plain lists, dictionaries, sets and bytearrays in options are replaced by tuples,
+        read-only dictionaries, frozensets and bytes (see :func:`frozen.immutable_value`).
+        Lazy values are still computed and cached on access.
+
+        :return: This configuration
+        """
+        values = vars(self)
+        if FROZEN_ATTRIBUTE in values:
+            return self
+        for name in self.get_all_options():
+            try:
+                values[name] = immutable_value(getattr(self, name))
+            except AttributeError:  # unassigned option without default
+                pass
+        values[FROZEN_ATTRIBUTE] = True
+        for name in self.get_all_placeholders():
+            freeze_value(values.get(name))
+        return self
+
+    def __hash__(self):
+        """
+        Get the hash of this configuration.
+
+        The hash of a frozen configuration is computed from the values of its options, and cached
+        unless some values can still change, like numeric arrays. Other configurations are hashed by identity.
+
+        :return: The hash value
+        """
+        values = vars(self)
+        if FROZEN_ATTRIBUTE not in values:
+            return object.__hash__(self)
+        result = values.get(HASH_ATTRIBUTE)
+        if result is None:
+            option_values = [values.get(name, _UNASSIGNED) for name in self.get_all_options()]
+            result = hash((type(self), tuple(map(freeze, option_values))))
+            if all(value is _UNASSIGNED or is_frozen_value(value) for value in option_values):
+                values[HASH_ATTRIBUTE] = result
+        return result
+
+    def __eq__(self, other):
+        """
+        Compare this configuration with another one.
+
+        Frozen configurations of the same class are equal if the values of their options are equal,
+        and the cached hashes are compared first. Other configurations are compared by identity.
+
+        :param other: The object to compare with
+        :return: True if the configurations are equal, False otherwise
+        """
+        if other is self:
+            return True
+        if type(other) is not type(self) or not (self._frozen and other._frozen):
+            return NotImplemented
+        if hash(self) != hash(other):
+            return False
+        values, other_values = vars(self), vars(other)
+        return all(
+            values.get(name, _UNASSIGNED) == other_values.get(name, _UNASSIGNED) for name in self.get_all_options()
+        )
+
+    def __getstate__(self):
+        """
+        Get the state of this configuration to copy or pickle it, without the dependencies of lazy values,
+        nor the cached fingerprint (which would not be invalidated anymore), hash and expiry times
+        (which are specific to the process, so the timed lazy values are refreshed on first access).
+
+        :return: The instance dictionary, without the per-instance bookkeeping
+        """
+        from .timed_lazy import EXPIRES_ATTRIBUTE  # lazy import
+        from .visitors.fingerprint_visitor import FINGERPRINT_ATTRIBUTE  # lazy import
+
+        state = dict(vars(self))
+        state.pop(DEPENDENTS_ATTRIBUTE, None)
+        state.pop(EXPIRES_ATTRIBUTE, None)
+        state.pop(FINGERPRINT_ATTRIBUTE, None)
+        state.pop(HASH_ATTRIBUTE, None)  # hashes of types and strings differ between processes
+        return state
+
+    def to_str(
+        self,
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        max_length: Optional[int] = None,
+    ) -> str:
+        """
+        Render this configuration as a dictionary-like string.
+
+        Without limits, the result is the full dump of this configuration, except that
+        lazy values which have not been computed yet are rendered as ``<lazy>``.
+
+        :param max_depth: Maximum nesting depth to render, or None for no limit
+        :param max_items: Maximum number of items to render per collection, or None for no limit
+        :param max_length: Maximum length of the result, or None for no limit
+        :return: The rendered string
+        """
+        from . import visitors  # lazy import
+        return visitors.ReprVisitor(max_depth, max_items, max_length).render(self)
+
     def __repr__(self):
         """
         Get a string representation of this configuration.
+
+        The cost of the representation is bounded: nested structures, long collections
+        and the total length are cut, and lazy values are not computed.
+        Use :meth:`to_str` or :meth:`to_dict` for a full dump.
         
-        :return: A string representation of the configuration's dictionary form
+        :return: A bounded string representation of the configuration's dictionary form
         """
-        return str(self.to_dict())
+        from . import visitors  # lazy import
+        return visitors.ReprVisitor().render(self)
 
     def __str__(self):
         """
@@ -333,3 +576,12 @@ class BaseConfig(ConfigStructure, ConfigContext, ABC):
                 name_mapping[placeholder.name] = attr_name
             cls._name_mapping = name_mapping
         return cls._name_mapping
+
+
+_UNASSIGNED = object()
+
+config_registry: ClassRegistry[BaseConfig] = ClassRegistry(capitalize_first)
+"""
+The registry of BaseConfig and its subclasses.
+"""
+config_registry.register(BaseConfig)
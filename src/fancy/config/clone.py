@@ -0,0 +1,135 @@
+"""
+Fast copies of configuration trees with structural sharing.
+"""
+
+from copy import copy, deepcopy
+from typing import Any, Dict, FrozenSet, Type, TypeVar
+
+from .base_config import BaseConfig
+from .config_dict_struct import ConfigDictStructure
+from .config_list_struct import ConfigListStructure
+from .dependencies import DEPENDENTS_ATTRIBUTE
+from .frozen import FROZEN_ATTRIBUTE, HASH_ATTRIBUTE
+from .lazy import Lazy
+from .process.numeric_array import is_numeric_array
+from .timed_lazy import EXPIRES_ATTRIBUTE
+from .utils.immutable import is_immutable
+from .visitors.fingerprint_visitor import FINGERPRINT_ATTRIBUTE
+
+C = TypeVar("C", bound=BaseConfig)
+
+_CACHE_ATTRIBUTES = frozenset((
+    DEPENDENTS_ATTRIBUTE, EXPIRES_ATTRIBUTE, FROZEN_ATTRIBUTE, HASH_ATTRIBUTE, FINGERPRINT_ATTRIBUTE
+))
+"""
+The per-instance bookkeeping, which is never shared with the clones.
+"""
+
+_ATOMIC_TYPES = frozenset((type(None), bool, int, float, str))
+
+_CONFIG = "config"
+_LIST = "list"
+_DICT = "dict"
+_OTHER = "other"
+
+_kinds: Dict[type, str] = {}
+"""
+The kinds of the values by their types.
+"""
+
+_skipped_names: Dict[Type[BaseConfig], FrozenSet[str]] = {}
+"""
+The names of the values which are not copied, per config class: the lazy values and the caches.
+"""
+
+
+def clone_config(config: C, **overrides: Any) -> C:
+    """
+    Copy a config, its sub-configs, lists and dictionaries, and override some of its values.
+
+    Only the stored values are copied, according to the placeholders of the classes, without
+    converting them again. Immutable values and frozen structures are shared with the original,
+    so cloning a frozen config copies nothing but the config itself. The loader and the other
+    attributes which are not placeholders are shared too, and the lazy values are not copied,
+    they are computed again on access, as are the caches and expiry times of the original.
+
+    The overrides are set by their configuration names, through the converters of the options,
+    and ``post_load`` is not run again. A clone of a frozen config is frozen.
+
+    :param config: The config to clone
+    :param overrides: The new values, keyed by their configuration names
+    :return: The new config
+    :raises KeyError: If an override doesn't match a placeholder
+    """
+    new = _clone_config(config, {})
+    for name, value in overrides.items():
+        new[name] = value
+    if config.frozen:
+        new.freeze()
+    return new
+
+
+def _clone_config(config: C, memo: Dict[int, Any]) -> C:
+    cls = type(config)
+    new = cls.__new__(cls)
+    memo[id(config)] = new
+    placeholders = cls.get_all_placeholders()
+    skipped = _skipped_names.get(cls)
+    if skipped is None:
+        lazy_names = (name for name, placeholder in placeholders.items() if isinstance(placeholder, Lazy))
+        skipped = _skipped_names[cls] = _CACHE_ATTRIBUTES.union(lazy_names)
+    values = vars(new)
+    for name, value in vars(config).items():
+        if name in skipped:
+            continue
+        if type(value) in _ATOMIC_TYPES or name not in placeholders:
+            values[name] = value
+        else:
+            values[name] = _clone_value(value, memo)
+    return new
+
+
+def _clone_value(value: Any, memo: Dict[int, Any]) -> Any:
+    cls = type(value)
+    if cls in _ATOMIC_TYPES:
+        return value
+    kind = _kinds.get(cls)
+    if kind is None:
+        kind = _kinds[cls] = _kind_of(cls)
+    if kind is _OTHER:
+        if is_immutable(value):
+            return value
+        if is_numeric_array(value):
+            return copy(value)
+        return deepcopy(value, memo)
+    if value._frozen:
+        return value
+    if id(value) in memo:
+        return memo[id(value)]
+    if kind is _CONFIG:
+        return _clone_config(value, memo)
+    new = _new_structure(value, memo)
+    if kind is _LIST:
+        list.extend(new, [_clone_value(item, memo) for item in value])
+    else:
+        dict.update(new, {k: _clone_value(v, memo) for k, v in value.items()})
+    return new
+
+
+def _kind_of(cls: type) -> str:
+    if issubclass(cls, BaseConfig):
+        return _CONFIG
+    if issubclass(cls, ConfigListStructure):
+        return _LIST
+    if issubclass(cls, ConfigDictStructure):
+        return _DICT
+    return _OTHER
+
+
+def _new_structure(structure, memo: Dict[int, Any]):
+    cls = type(structure)
+    new = cls.__new__(cls)
+    memo[id(structure)] = new
+    new.__dict__.update(structure.__dict__)
+    new.__dict__.pop(DEPENDENTS_ATTRIBUTE, None)
+    return new
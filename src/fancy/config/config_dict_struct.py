@@ -0,0 +1,123 @@
+from copy import deepcopy
+from typing import Any, Callable
+
+from . import ConfigStructure, ConfigContext, ConfigStructureVisitor
+from .dependencies import DEPENDENTS_ATTRIBUTE
+from .frozen import freeze_value, guard_mutation
+from .process import auto_process_typ, auto_process_value, is_scalar
+from .typing import UnProcType
+
+
+class ConfigDictStructure(dict, ConfigStructure):
+    """
+    A configuration structure that represents a dictionary of configuration values.
+
+    This class combines the functionality of Python's built-in dict with
+    the ConfigStructure interface, allowing it to be used in the configuration
+    hierarchy, e.g., for a mapping from names to sub-configs.
+
+    Keys and values are processed according to the specified configuration types.
+    Values of scalar types (see :func:`process.is_scalar`) are converted in bulk.
+
+    A frozen dictionary (see :meth:`freeze`) raises :class:`exc.FrozenConfigError` when it is modified.
+    """
+    _key_typ: Callable[[Any], Any]
+    _config_typ: Callable[[Any], Any]
+    _is_scalar: bool
+    _frozen: bool = False
+
+    def __init__(self, key_typ: UnProcType, config_typ: UnProcType):
+        """
+        Initialize a ConfigDictStructure with specified key and value types.
+
+        :param key_typ: The type specification for keys in the dictionary
+        :param config_typ: The type specification for values in the dictionary
+        """
+        super().__init__()
+        self._key_typ = auto_process_typ(key_typ)
+        self._config_typ = auto_process_typ(config_typ)
+        self._is_scalar = is_scalar(self._config_typ)
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Check if the dictionary has been loaded with configuration data.
+
+        A ConfigDictStructure is considered loaded if it contains at least one item.
+
+        :return: True if the dictionary contains items, False otherwise
+        """
+        return len(self) > 0
+
+    def load_by_context(self, context: ConfigContext, val):
+        """
+        Load a mapping of values from a configuration context.
+
+        :param context: The configuration context to use
+        :param val: A mapping of values to load
+        """
+        key_typ = self._key_typ
+        config_typ = self._config_typ
+        if self._is_scalar:
+            self.update({key_typ(k): config_typ(v) for k, v in val.items()})
+        else:
+            self.update({key_typ(k): auto_process_value(v, config_typ, context) for k, v in val.items()})
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Check if the dictionary is frozen.
+
+        :return: True if the dictionary can't be modified, False otherwise
+        """
+        return self._frozen
+
+    def freeze(self) -> "ConfigDictStructure":
+        """
+        Make this dictionary and the structures it contains immutable.
+
+        :return: This dictionary
+        """
+        if not self._frozen:
+            self._frozen = True
+            for value in self.values():
+                freeze_value(value)
+        return self
+
+    __setitem__ = guard_mutation(dict.__setitem__)
+    __delitem__ = guard_mutation(dict.__delitem__)
+    __ior__ = guard_mutation(dict.__ior__)
+    clear = guard_mutation(dict.clear)
+    pop = guard_mutation(dict.pop)
+    popitem = guard_mutation(dict.popitem)
+    setdefault = guard_mutation(dict.setdefault)
+    update = guard_mutation(dict.update)
+
+    def __copy__(self):
+        """
+        Create a shallow copy of this dictionary, which shares the element type.
+
+        :return: A new structure with the same elements, frozen if this dictionary is frozen
+        """
+        new = type(self).__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new.__dict__.pop(DEPENDENTS_ATTRIBUTE, None)
+        dict.update(new, self)
+        return new
+
+    def __deepcopy__(self, memo):
+        new = type(self).__new__(type(self))
+        memo[id(self)] = new
+        state = dict(self.__dict__)
+        state.pop(DEPENDENTS_ATTRIBUTE, None)
+        new.__dict__.update(deepcopy(state, memo))
+        dict.update(new, deepcopy(dict(self), memo))
+        return new
+
+    def accept(self, visitor: "ConfigStructureVisitor"):
+        """
+        Accept a visitor for traversing and processing this dictionary structure.
+
+        :param visitor: The visitor to accept
+        """
+        visitor.visit_config_dict(self)
@@ -5,17 +5,17 @@ This module provides a factory class for creating configuration objects from the
 class names, with support for automatic suffix matching.
 """
 
-from typing import Dict, Type, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
-from . import BaseConfig, utils
-from .exc import ClassNotFoundException
+from . import BaseConfig
+from .base_config import config_registry
+from .utils.registry import RegisteredClasses
 
 
 if TYPE_CHECKING:
     from . import BaseConfigLoader
 
 
-# TODO: As mentioned in `ConfigLoaderFactory`, we can simplify the logic for suffix matching
 # TODO: Consider to remove loader parameter from create_config method since the config instance
 #       can be created without it and the loader can be set later.
 
@@ -26,11 +26,11 @@ class ConfigFactory:
     
     This class provides functionality to instantiate configuration objects
     from their class names, with automatic handling of naming conventions.
-    It automatically discovers all subclasses of BaseConfig and can create
-    instances by name with flexible matching of class names.
+    The subclasses of BaseConfig are registered when they are defined, with optional
+    aliases (see :meth:`BaseConfig.__init_subclass__`), and are found by a dictionary lookup.
     """
     
-    configs = None
+    configs = RegisteredClasses(config_registry, "ConfigFactory.create_config")
     suffix: str = "Config"
 
     @classmethod
@@ -44,34 +44,16 @@ class ConfigFactory:
         - Class name without suffix (suffix is appended)
         - Class name without suffix and with lowercase first letter
           (first letter is capitalized and suffix is appended)
+        - An alias given when the class is defined, which takes precedence over the others
         
         :param config: The name of the configuration class to instantiate
         :param loader: The configuration loader to use for initialization
         :return: An instance of the specified configuration class
         :raises ClassNotFoundException: If no matching configuration class is found
+        :raises AmbiguousClassNameError: If several configuration classes match the name equally,
+                                         e.g. classes with the same name in different modules
         """
-        configs = cls._get_all_configs()
-        if config + cls.suffix in configs:
-            config += cls.suffix
-        elif config[0].capitalize() + config[1:] + cls.suffix in configs:
-            config = config[0].capitalize() + config[1:] + cls.suffix
-        elif config not in configs:
-            raise ClassNotFoundException(config)
-        return configs[config](loader)
-
-    @classmethod
-    def _get_all_configs(cls) -> Dict[str, Type['BaseConfig']]:
-        """
-        Get all available configuration classes.
-        
-        This method discovers and caches all subclasses of BaseConfig,
-        making them available for instantiation by name.
-        
-        :return: A dictionary mapping class names to configuration classes
-        """
-        if cls.configs is None:
-            cls.configs = {config.__name__: config for config in utils.reflections.find_subclasses(BaseConfig)}
-        return cls.configs
+        return config_registry.lookup(config, cls.suffix)(loader)
 
     @classmethod
     def get_suffix(cls) -> str:
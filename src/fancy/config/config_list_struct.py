@@ -1,9 +1,21 @@
-from typing import Any, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
-from . import ConfigStructure, ConfigContext, ConfigStructureVisitor
-from .process import auto_process_typ, auto_process_value
+from . import ConfigStructure, ConfigContext, ConfigStructureVisitor, exc
+from .dependencies import DEPENDENTS_ATTRIBUTE
+from .frozen import freeze_value, guard_mutation
+from .process import auto_process_typ, auto_process_value, is_scalar
 from .typing import UnProcType
 
+if TYPE_CHECKING:
+    from . import BaseConfig, BaseConfigLoader
+
+ExecutorSpec = Union[str, Executor]
+"""
+``"thread"``, ``"process"`` or an executor instance.
+"""
+
 
 class ConfigListStructure(list, ConfigStructure):
     """
@@ -15,8 +27,13 @@ class ConfigListStructure(list, ConfigStructure):
     in configuration data.
     
     Each element in the list is processed according to the specified configuration type.
+    Elements of scalar types (see :func:`process.is_scalar`) are converted in bulk.
+
+    A frozen list (see :meth:`freeze`) raises :class:`exc.FrozenConfigError` when it is modified.
     """
     _config_typ: Callable[[Any], Any]
+    _is_scalar: bool
+    _frozen: bool = False
 
     def __init__(self, config_typ: UnProcType):
         """
@@ -26,6 +43,7 @@ class ConfigListStructure(list, ConfigStructure):
         """
         super().__init__()
         self._config_typ = auto_process_typ(config_typ)
+        self._is_scalar = is_scalar(self._config_typ)
 
     @property
     def loaded(self) -> bool:
@@ -44,16 +62,76 @@ class ConfigListStructure(list, ConfigStructure):
         
         Each value in the input list is processed according to the
         configuration type specified during initialization.
+        If the type is scalar, the values are converted in a single pass
+        without checking for structures.
         
         :param context: The configuration context to use
         :param val: A list of values to load
         """
+        if self._is_scalar:
+            self.extend(list(map(self._config_typ, val)))
+            return
         new_items = []
         for raw_value in val:
             value = auto_process_value(raw_value, self._config_typ, context)
             new_items.append(value)
         self.extend(new_items)
 
+    @property
+    def frozen(self) -> bool:
+        """
+        Check if the list is frozen.
+
+        :return: True if the list can't be modified, False otherwise
+        """
+        return self._frozen
+
+    def freeze(self) -> "ConfigListStructure":
+        """
+        Make this list and the structures it contains immutable.
+
+        :return: This list
+        """
+        if not self._frozen:
+            self._frozen = True
+            for value in self:
+                freeze_value(value)
+        return self
+
+    __setitem__ = guard_mutation(list.__setitem__)
+    __delitem__ = guard_mutation(list.__delitem__)
+    __iadd__ = guard_mutation(list.__iadd__)
+    __imul__ = guard_mutation(list.__imul__)
+    append = guard_mutation(list.append)
+    extend = guard_mutation(list.extend)
+    insert = guard_mutation(list.insert)
+    pop = guard_mutation(list.pop)
+    remove = guard_mutation(list.remove)
+    clear = guard_mutation(list.clear)
+    sort = guard_mutation(list.sort)
+    reverse = guard_mutation(list.reverse)
+
+    def __copy__(self):
+        """
+        Create a shallow copy of this list, which shares the element type.
+
+        :return: A new structure with the same elements, frozen if this list is frozen
+        """
+        new = type(self).__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new.__dict__.pop(DEPENDENTS_ATTRIBUTE, None)
+        list.extend(new, self)
+        return new
+
+    def __deepcopy__(self, memo):
+        new = type(self).__new__(type(self))
+        memo[id(self)] = new
+        state = dict(self.__dict__)
+        state.pop(DEPENDENTS_ATTRIBUTE, None)
+        new.__dict__.update(deepcopy(state, memo))
+        list.extend(new, deepcopy(list(self), memo))
+        return new
+
     def accept(self, visitor: "ConfigStructureVisitor"):
         """
         Accept a visitor for traversing and processing this list structure.
@@ -63,3 +141,130 @@ class ConfigListStructure(list, ConfigStructure):
         :param visitor: The visitor to accept
         """
         visitor.visit_config_list(self)
+
+
+class ParallelConfigListStructure(ConfigListStructure):
+    """
+    A ConfigListStructure which loads its elements in parallel.
+
+    The values are split into chunks which are loaded by a thread pool or a process pool,
+    which is useful when elements are sub-configs with expensive ``post_load`` hooks.
+    The order of elements is preserved, and a failure of an element is reported as
+    :class:`exc.ListElementError` carrying the index of the element.
+
+    With the process pool, the element type must be a picklable BaseConfig subclass
+    and the loaded elements are sent back to this process by pickling.
+    """
+    _element_type: UnProcType
+    _executor: ExecutorSpec
+    _max_workers: Optional[int]
+    _chunk_size: int
+
+    def __init__(
+        self,
+        config_typ: UnProcType,
+        executor: ExecutorSpec = "thread",
+        max_workers: Optional[int] = None,
+        chunk_size: int = 64,
+    ):
+        """
+        Initialize a ParallelConfigListStructure with a specified configuration type.
+
+        :param config_typ: The type specification for elements in the list
+        :param executor: ``"thread"``, ``"process"`` or an executor instance to load the elements with.
+                         A given executor instance is not shut down after loading.
+        :param max_workers: The maximum number of workers of the created pool
+        :param chunk_size: The number of elements loaded by a task
+        :raises ValueError: If the executor or the chunk size is invalid
+        :raises TypeError: If the process pool is used with an element type which is not a BaseConfig subclass
+        """
+        super().__init__(config_typ)
+        from . import BaseConfig  # lazy import
+        if isinstance(executor, str) and executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread', 'process' or an Executor, not {executor!r}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if self._uses_processes(executor) and not (
+                isinstance(config_typ, type) and issubclass(config_typ, BaseConfig)):
+            raise TypeError(f"the process pool requires a BaseConfig subclass as element type, not {config_typ}")
+        self._element_type = config_typ
+        self._executor = executor
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+
+    def load_by_context(self, context: ConfigContext, val):
+        """
+        Load a list of values from a configuration context in parallel.
+
+        :param context: The configuration context to use
+        :param val: A list of values to load
+        :raises exc.ListElementError: If an element fails to load
+        """
+        val = val if isinstance(val, Sequence) else list(val)
+        if len(val) <= self._chunk_size:
+            self.extend(_load_chunk(self._config_typ, context, 0, val))
+            return
+
+        if isinstance(self._executor, Executor):
+            new_items = self._load_with(self._executor, context, val)
+        else:
+            with self._create_executor() as executor:
+                new_items = self._load_with(executor, context, val)
+        self.extend(new_items)
+
+    @staticmethod
+    def _uses_processes(executor: ExecutorSpec) -> bool:
+        return executor == "process" or isinstance(executor, ProcessPoolExecutor)
+
+    def _create_executor(self) -> Executor:
+        if self._executor == "process":
+            return ProcessPoolExecutor(self._max_workers)
+        return ThreadPoolExecutor(self._max_workers)
+
+    def _load_with(self, executor: Executor, context: ConfigContext, val: Sequence) -> list:
+        starts = range(0, len(val), self._chunk_size)
+        if not self._uses_processes(self._executor):
+            chunks = executor.map(
+                lambda start: _load_chunk(self._config_typ, context, start, val[start:start + self._chunk_size]),
+                starts
+            )
+            return [item for chunk in chunks for item in chunk]
+
+        # the values which are already configs are processed here, the others are loaded in the pool.
+        new_items: List[Any] = [None] * len(val)
+        jobs = []
+        for index, raw_value in enumerate(val):
+            if isinstance(raw_value, self._element_type):
+                new_items[index] = _load_chunk(self._config_typ, context, index, [raw_value])[0]
+            else:
+                jobs.append((index, context.get_loader().get_sub_loader(raw_value)))
+        job_chunks = [jobs[start:start + self._chunk_size] for start in range(0, len(jobs), self._chunk_size)]
+        for job_chunk, configs in zip(
+                job_chunks,
+                executor.map(_create_configs, [self._element_type] * len(job_chunks), job_chunks)
+        ):
+            for (index, _), config in zip(job_chunk, configs):
+                new_items[index] = config
+        return new_items
+
+
+def _load_chunk(config_typ: Callable[[Any], Any], context: ConfigContext, start: int, chunk: Sequence) -> list:
+    items = []
+    for index, raw_value in enumerate(chunk, start):
+        try:
+            items.append(auto_process_value(raw_value, config_typ, context))
+        except Exception as e:
+            raise exc.ListElementError(index, e) from e
+    return items
+
+
+def _create_configs(
+        config_type: "type[BaseConfig]", jobs: List[Tuple[int, "BaseConfigLoader"]]
+) -> List["BaseConfig"]:
+    configs = []
+    for index, loader in jobs:
+        try:
+            configs.append(config_type(loader))
+        except Exception as e:
+            raise exc.ListElementError(index, e) from e
+    return configs
@@ -8,10 +8,8 @@ class names, with support for automatic suffix matching.
 from typing import Dict, Type
 
 from .. import config as cfg
-from fancy.config import utils, exc
-
-# TODO: Instead of using complex logic about suffixes, we can use a simple class variable 
-#       with registration of the class name. This will make it easier to understand and maintain.
+from .config_loaders import loader_registry
+from .utils.registry import RegisteredClasses
 
 
 class ConfigLoaderFactory:
@@ -20,12 +18,12 @@ class ConfigLoaderFactory:
     
     This class provides functionality to instantiate configuration loader objects
     from their class names, with automatic handling of naming conventions.
-    It automatically discovers all subclasses of BaseConfigLoader and can create
-    instances by name with flexible matching of class names.
+    The subclasses of BaseConfigLoader are registered when they are defined, with optional
+    aliases (see :meth:`BaseConfigLoader.__init_subclass__`), and are found by a dictionary lookup.
     """
     
     suffix: str = "ConfigLoader"
-    loaders = None
+    loaders = RegisteredClasses(loader_registry, "ConfigLoaderFactory.get_all_loaders()")
 
     @classmethod
     def create_loader(cls, method: str = 'yaml') -> cfg.BaseConfigLoader:
@@ -37,35 +35,26 @@ class ConfigLoaderFactory:
         - Exact class name
         - Method name without suffix (suffix is appended)
         - Method name with lowercase first letter (first letter is capitalized and suffix is appended)
+        - An alias given when the class is defined, which takes precedence over the others
         
         :param method: The name of the configuration loader method/class to instantiate
         :return: An instance of the specified configuration loader class
         :raises exc.ClassNotFoundException: If no matching configuration loader class is found
+        :raises exc.AmbiguousClassNameError: If several configuration loader classes match the name equally
         """
-        loaders = cls.get_all_loaders()
-        if method + cls.suffix in loaders:
-            method += cls.suffix
-        elif method.capitalize() + cls.suffix in loaders:
-            method = method.capitalize() + cls.suffix
-        elif method not in loaders:
-            raise exc.ClassNotFoundException(method)
-        return loaders[method]()
+        return loader_registry.lookup(method, cls.suffix)()
 
     @classmethod
     def get_all_loaders(cls) -> Dict[str, Type[cfg.BaseConfigLoader]]:
         """
         Get all available configuration loader classes.
         
-        This method discovers and caches all subclasses of BaseConfigLoader,
-        making them available for instantiation by name.
+        The classes are registered when they are defined, so the classes defined
+        after a previous call are included too.
         
         :return: A dictionary mapping class names to configuration loader classes
         """
-        if cls.loaders is None:
-            cls.loaders = {
-                loader.__name__: loader for loader in utils.reflections.find_subclasses(cfg.BaseConfigLoader)
-            }
-        return cls.loaders
+        return {loader.__name__: loader for loader in loader_registry.get_all().values()}
 
     @classmethod
     def get_suffix(cls) -> str:
@@ -1,13 +1,13 @@
-from argparse import Namespace
 from pathlib import Path
-from typing import Dict, TYPE_CHECKING, Optional, Union
+from typing import Dict, TYPE_CHECKING, Optional, Sequence, Union
 
-import yaml
 from abc import ABC, abstractmethod
 
 from . import attribute_setters
+from .utils.registry import ClassRegistry
 
 if TYPE_CHECKING:
+    from argparse import Namespace
     from ..config import BaseConfig
 
 setter_name_map = {}
@@ -23,6 +23,11 @@ for name, x in vars(attribute_setters).items():
 
 SetterName = Union[str, attribute_setters.AttributeSetter]
 
+loader_registry: "ClassRegistry[BaseConfigLoader]" = ClassRegistry(str.capitalize)
+"""
+The registry of BaseConfigLoader and its subclasses.
+"""
+
 
 class BaseConfigLoader(ABC):
     """
@@ -47,6 +52,15 @@ class BaseConfigLoader(ABC):
         else:
             self._attribute_setter = setter
 
+    def __init_subclass__(cls, aliases: Sequence[str] = (), **kwargs):
+        """
+        Register the subclass to be created by name (see :class:`ConfigLoaderFactory`).
+
+        :param aliases: The other names of the subclass, e.g. ``class TomlConfigLoader(..., aliases=["tml"])``
+        """
+        super().__init_subclass__(**kwargs)
+        loader_registry.register(cls, aliases)
+
     @abstractmethod
     def load(self, config: "BaseConfig"):
         """
@@ -78,6 +92,9 @@ class BaseConfigLoader(ABC):
 
 
 # TODO: consider to use `Mapping` instead of `Dict`
+loader_registry.register(BaseConfigLoader)
+
+
 class DictBasedConfigLoader(BaseConfigLoader, ABC):
     """
     Abstract base class for dictionary-based configuration loaders.
@@ -174,6 +191,8 @@ class YamlConfigLoader(DictBasedConfigLoader, PathBasedConfigLoader):
         :return: The configuration data dictionary from the YAML file
         :raises FileNotFoundError: If the YAML file doesn't exist
         """
+        import yaml  # lazy import
+
         if not self.path.is_file():
             raise FileNotFoundError(str(self.path))
         stream = self.path.open()
@@ -219,11 +238,11 @@ class NamespaceConfigLoader(DictBasedConfigLoader):
     
     This loader is useful for loading configuration from command-line arguments.
     """
-    _args: Namespace
+    _args: "Namespace"
 
     def __init__(
         self,
-        args: Namespace,
+        args: "Namespace",
         setter: Optional[SetterName] = None,
     ):
         """
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from . import BaseConfig, ConfigListStructure
+    from . import BaseConfig, ConfigListStructure, ConfigDictStructure
 
 
 class ConfigStructureVisitor(ABC):
@@ -33,3 +33,14 @@ class ConfigStructureVisitor(ABC):
         :param structure: The ConfigListStructure to visit
         """
         ...
+
+    def visit_config_dict(self, structure: "ConfigDictStructure") -> None:
+        """
+        Visit a ConfigDictStructure structure.
+
+        Visitors which don't support dictionary structures don't need to override this method.
+
+        :param structure: The ConfigDictStructure to visit
+        :raises NotImplementedError: If the visitor doesn't support dictionary structures
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support ConfigDictStructure")
@@ -0,0 +1,174 @@
+"""
+Tracking of the placeholders read by lazy values.
+
+While a lazy value is computed, the placeholders read from any configuration are
+recorded as its dependencies. When a placeholder is set or deleted, the cached values
+of the lazies depending on it are removed, transitively through other lazies, so they
+are computed again on the next access.
+
+The dependencies of an instance are stored in the instance itself, as a mapping from
+the attribute names of placeholders to weak references to the lazies which read them, so
+short-lived configs reading long-lived ones are not kept alive. The items of list and
+dictionary structures are recorded under :data:`ITEMS` when the structures are read from
+an option, and invalidated by their mutations.
+
+The computations being tracked are stored in a context variable, so the reads of
+computations in other threads, or in other asyncio tasks in the same thread, are not mixed up.
+
+The dependencies are not copied with the instances: the cached values of the lazies of a
+copy or an unpickled config are not invalidated by its changes.
+"""
+
+import functools
+import threading
+from contextvars import ContextVar
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+from .config_structure import ConfigStructure
+
+if TYPE_CHECKING:
+    from . import BaseConfig
+
+DEPENDENTS_ATTRIBUTE = "_lazy_dependents"
+"""
+The attribute of instances which stores the lazies depending on their placeholders.
+"""
+
+GENERATION_ATTRIBUTE = "_lazy_generation"
+"""
+The attribute of instances which counts the invalidations of their lazy values,
+so computations which started before an invalidation can be detected (see :func:`generation`).
+"""
+
+ITEMS = "__items__"
+"""
+The name recorded for a read of all the items of a list or dictionary structure.
+"""
+
+Readers = Dict[Tuple[int, str], "weakref.ref[BaseConfig]"]
+Dependents = Dict[str, Readers]
+
+tracking = 0
+"""
+The number of lazy computations being tracked in all threads.
+Reads are recorded only when it is positive, which keeps reads cheap otherwise.
+"""
+
+_lock = threading.Lock()
+_frames: ContextVar[Tuple[Tuple[Any, str], ...]] = ContextVar("lazy_frames", default=())
+"""
+The computations being tracked in the current context, the innermost last.
+"""
+_MISSING = object()
+
+
+def begin(instance: "BaseConfig", name: str) -> None:
+    """
+    Start tracking the reads of a lazy computation in the current thread or asyncio task.
+
+    :param instance: The instance on which the lazy value is computed
+    :param name: The attribute name of the lazy value
+    """
+    global tracking
+    _frames.set(_frames.get() + ((instance, name),))
+    with _lock:
+        tracking += 1
+
+
+def end() -> None:
+    """
+    Stop tracking the reads of the innermost lazy computation in the current thread or asyncio task.
+    """
+    global tracking
+    _frames.set(_frames.get()[:-1])
+    with _lock:
+        tracking -= 1
+
+
+def record(instance: "BaseConfig", name: str) -> None:
+    """
+    Record a read of a placeholder as a dependency of the lazy value being computed.
+
+    :param instance: The instance from which the placeholder is read
+    :param name: The attribute name of the placeholder
+    """
+    frames = _frames.get()
+    if not frames:  # the computations are in other threads or tasks
+        return
+    lazy_instance, lazy_name = frames[-1]
+    if lazy_instance is instance and lazy_name == name:
+        return
+    dependents: Dependents = vars(instance).setdefault(DEPENDENTS_ATTRIBUTE, {})
+    readers = dependents.setdefault(name, {})
+    key = (id(lazy_instance), lazy_name)
+    if key not in readers:
+        readers[key] = weakref.ref(lazy_instance, functools.partial(_forget, readers, key))
+
+
+def record_items(value: Any) -> None:
+    """
+    Record a read of the items of a list or dictionary structure, and of the list and dictionary
+    structures nested in it, as a dependency of the lazy value being computed. Other values are ignored.
+
+    The items are not walked if they are not structures themselves (judging by the first one),
+    e.g. sub-configs, whose options are recorded when they are read.
+
+    :param value: The value read from a placeholder
+    """
+    if not _is_structure(value) or not _frames.get():
+        return
+    pending = [value]
+    while pending:
+        structure = pending.pop()
+        record(structure, ITEMS)
+        if structure._is_scalar or not structure:
+            continue
+        items = structure.values() if isinstance(structure, dict) else structure
+        if _is_structure(next(iter(items))):
+            pending.extend(item for item in items if _is_structure(item))
+
+
+def _is_structure(value: Any) -> bool:
+    return isinstance(value, (list, dict)) and isinstance(value, ConfigStructure)
+
+
+def invalidate(instance: "BaseConfig", name: str) -> None:
+    """
+    Remove the cached values of the lazies depending on a placeholder, transitively.
+
+    :param instance: The instance on which the placeholder is changed
+    :param name: The attribute name of the placeholder
+    """
+    pending = [(instance, name)]
+    while pending:
+        instance, name = pending.pop()
+        dependents = vars(instance).get(DEPENDENTS_ATTRIBUTE)
+        if not dependents:
+            continue
+        for (_, lazy_name), reader in dependents.pop(name, {}).items():
+            lazy_instance = reader()
+            if lazy_instance is not None:
+                values = vars(lazy_instance)
+                values.pop(lazy_name, _MISSING)
+                values[GENERATION_ATTRIBUTE] = values.get(GENERATION_ATTRIBUTE, 0) + 1
+                pending.append((lazy_instance, lazy_name))
+
+
+def generation(instance: "BaseConfig") -> int:
+    """
+    Get the number of invalidations of the lazy values of an instance.
+
+    A value computed in the background must be dropped if the generation changed while
+    it was computed, since it may be computed from the old values of its dependencies.
+
+    :param instance: The instance of the lazy values
+    :return: The generation of the instance
+    """
+    return vars(instance).get(GENERATION_ATTRIBUTE, 0)
+
+
+def _forget(readers: Readers, key: Tuple[int, str], reader: "weakref.ref[BaseConfig]") -> None:
+    # the reader is collected, unless it was replaced by another instance with the same id
+    if readers.get(key) is reader:
+        del readers[key]
@@ -0,0 +1,129 @@
+"""
+Structural comparison of configuration trees.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Set, Tuple
+
+from .config_dict_struct import ConfigDictStructure
+from .config_list_struct import ConfigListStructure
+from .lazy import Lazy
+from .consts import IGNORED_NAME
+from .frozen import HASH_ATTRIBUTE
+from .process.numeric_array import is_numeric_array
+from .utils.tree import join_path
+from .visitors.fingerprint_visitor import FINGERPRINT_ATTRIBUTE
+
+if TYPE_CHECKING:
+    from . import BaseConfig
+
+
+class _Missing:
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+"""
+The old or new value of a change when the value is not assigned, or the item doesn't exist.
+"""
+
+
+class ConfigChange(NamedTuple):
+    """
+    A value which differs between two configuration trees.
+    """
+
+    path: str
+    """
+    The path of the value, like ``servers[0].port``.
+    """
+
+    old: Any
+    """
+    The value in the old tree, or :data:`MISSING`.
+    """
+
+    new: Any
+    """
+    The value in the new tree, or :data:`MISSING`.
+    """
+
+
+def diff_configs(old: "BaseConfig", new: "BaseConfig") -> List[ConfigChange]:
+    """
+    Find the values which differ between two configs of the same class.
+
+    Both trees are walked together through the placeholders of their classes, the same
+    values as in ``to_dict()`` except the lazy values, and the changes are reported for the
+    deepest differing values: a changed option of a sub-config is reported by its own path,
+    and a sub-config replaced by a config of another class as a whole.
+    List items are compared by index, and mapping items by key.
+
+    Identical subtrees are skipped when they are the same objects, or frozen with immutable
+    values and the same cached fingerprint (see :meth:`BaseConfig.fingerprint`), without being walked.
+
+    :param old: The old config
+    :param new: The new config
+    :return: The changes in depth-first order of the placeholders
+    :raises TypeError: If the configs are not of the same class
+    """
+    if type(old) is not type(new):
+        raise TypeError(f"can't compare configs of different classes: {type(old)} and {type(new)}")
+    return list(_diff_configs("", old, new, set()))
+
+
+def _diff_configs(path: str, old: "BaseConfig", new: "BaseConfig", visited: Set[Tuple[int, int]]) \
+        -> Iterator[ConfigChange]:
+    if old is new or (id(old), id(new)) in visited:
+        return
+    if _is_immutable(old) and _is_immutable(new):
+        old_fingerprint = vars(old).get(FINGERPRINT_ATTRIBUTE)
+        if old_fingerprint is not None and old_fingerprint == vars(new).get(FINGERPRINT_ATTRIBUTE):
+            return
+    visited.add((id(old), id(new)))
+    for attr_name, placeholder in old.get_all_placeholders().items():
+        if isinstance(placeholder, Lazy) or placeholder.hidden or placeholder.name == IGNORED_NAME:
+            continue
+        old_value = getattr(old, attr_name) if placeholder.is_assigned(old) else MISSING
+        new_value = getattr(new, attr_name) if placeholder.is_assigned(new) else MISSING
+        yield from _diff_values(join_path(path, placeholder.name), old_value, new_value, visited)
+
+
+def _diff_values(path: str, old: Any, new: Any, visited: Set[Tuple[int, int]]) -> Iterator[ConfigChange]:
+    from . import BaseConfig  # lazy import
+
+    if old is new:
+        return
+    if isinstance(old, BaseConfig) and type(old) is type(new):
+        yield from _diff_configs(path, old, new, visited)
+    elif isinstance(old, ConfigListStructure) and isinstance(new, ConfigListStructure):
+        for index in range(max(len(old), len(new))):
+            yield from _diff_values(
+                f"{path}[{index}]",
+                old[index] if index < len(old) else MISSING,
+                new[index] if index < len(new) else MISSING,
+                visited,
+            )
+    elif isinstance(old, ConfigDictStructure) and isinstance(new, ConfigDictStructure):
+        for key in [*old, *(key for key in new if key not in old)]:
+            yield from _diff_values(f"{path}[{key}]", old.get(key, MISSING), new.get(key, MISSING), visited)
+    elif not _equal(old, new):
+        yield ConfigChange(path, old, new)
+
+
+def _is_immutable(config: "BaseConfig") -> bool:
+    # unlike the fingerprint, which is not invalidated by in-place changes of the values of the options,
+    # the hash of a frozen config is cached only if these values can't change
+    if not config.frozen:
+        return False
+    try:
+        hash(config)
+    except TypeError:  # unhashable values
+        return False
+    return HASH_ATTRIBUTE in vars(config)
+
+
+def _equal(old: Any, new: Any) -> bool:
+    if is_numeric_array(old) or is_numeric_array(new):
+        return type(old) is type(new) and old.tolist() == new.tolist()
+    return old == new
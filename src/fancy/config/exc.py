@@ -6,13 +6,60 @@ class ClassNotFoundException(Exception):
         super().__init__(f'Class "{cls}" is not found.', *args)
 
 
+class AmbiguousClassNameError(LookupError):
+    """
+    Error raised when several classes are found by a name, e.g. classes with the same name in different modules.
+    """
+    def __init__(self, name: str, classes: list):
+        qualified_names = ", ".join(f"{cls.__module__}.{cls.__qualname__}" for cls in classes)
+        super().__init__(f'Class name "{name}" is ambiguous: {qualified_names}, use an alias or a qualified name to distinguish them.')
+        self.classes = classes
+
+
 class ContextNotLoadedError(RuntimeError):
     """
     Error raised when getting a context that is not loaded.
     """
 
 
+class FrozenConfigError(TypeError):
+    """
+    Error raised when modifying a frozen configuration structure.
+    """
+    def __init__(self, structure, name: str = None):
+        target = type(structure).__name__ if name is None else f"'{name}' of {type(structure).__name__}"
+        super().__init__(f"cannot modify {target}, the structure is frozen.")
+        self.structure = structure
+
+
 class DuplicatedNameError(RuntimeError):
     """
     Detects a config class has duplicated name in its placeholders.
-    """
\ No newline at end of file
+    """
+
+
+class ListElementError(Exception):
+    """
+    Error raised when an element of a configuration list fails to load.
+
+    The original error is available as :attr:`error` (and as ``__cause__`` when raised
+    in the same process).
+    """
+
+    index: int
+    """
+    The index of the element which failed to load.
+    """
+
+    error: BaseException
+    """
+    The error raised while loading the element.
+    """
+
+    def __init__(self, index: int, error: BaseException):
+        super().__init__(index, error)
+        self.index = index
+        self.error = error
+
+    def __str__(self):
+        return f"failed to load the element at index {self.index}: {self.error!r}"
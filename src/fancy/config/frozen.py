@@ -0,0 +1,116 @@
+"""
+Support for frozen configuration structures.
+
+A frozen BaseConfig, ConfigListStructure or ConfigDictStructure raises
+:class:`~fancy.config.exc.FrozenConfigError` when it is modified. The flag is stored in the
+instance dictionary under :data:`FROZEN_ATTRIBUTE`, so the placeholders check it in the
+dictionary they already use for the values, and reading a frozen structure costs nothing more.
+"""
+
+import functools
+from typing import Any, Callable, TypeVar
+
+from . import dependencies
+from .exc import FrozenConfigError
+from .utils.immutable import is_immutable
+
+FROZEN_ATTRIBUTE = "_frozen"
+"""
+The attribute which is true in a frozen structure.
+"""
+
+HASH_ATTRIBUTE = "_frozen_hash"
+"""
+The attribute of a frozen config which caches its structural hash, when all its values are immutable.
+"""
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def guard_mutation(method: F) -> F:
+    """
+    Wrap a mutating method of a structure, so it raises if the structure is frozen.
+
+    Otherwise, the values computed from the items (see :data:`dependencies.ITEMS`) are invalidated.
+
+    :param method: The method to wrap, e.g. ``list.append``
+    :return: The wrapped method
+    """
+    @functools.wraps(method)
+    def _guarded(self, *args, **kwargs):
+        if self._frozen:
+            raise FrozenConfigError(self)
+        result = method(self, *args, **kwargs)
+        if dependencies.DEPENDENTS_ATTRIBUTE in self.__dict__:
+            dependencies.invalidate(self, dependencies.ITEMS)
+        return result
+    return _guarded  # type: ignore
+
+
+def freeze_value(value: Any) -> None:
+    """
+    Freeze a value if it's a configuration structure, and the structures it contains.
+
+    :param value: The value to freeze
+    """
+    from .config_structure import ConfigStructure  # lazy import
+
+    if isinstance(value, ConfigStructure) and not getattr(value, FROZEN_ATTRIBUTE, True):
+        value.freeze()
+
+
+class FrozenDict(dict):
+    """
+    A read-only dictionary, which replaces the plain dictionaries in the options of frozen configs.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise FrozenConfigError(self)
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+def immutable_value(value: Any) -> Any:
+    """
+    Convert a plain mutable value of an option into an immutable equivalent, recursively.
+
+    Lists become tuples, dictionaries :class:`FrozenDict`, sets frozensets and bytearrays bytes.
+    Other values, including the configuration structures, are returned unchanged.
+
+    :param value: The value to convert
+    :return: The immutable value
+    """
+    cls = type(value)
+    if cls is list or cls is tuple:
+        return tuple(map(immutable_value, value))
+    if cls is dict:
+        return FrozenDict({k: immutable_value(v) for k, v in value.items()})
+    if cls is set:
+        return frozenset(map(immutable_value, value))
+    if cls is bytearray:
+        return bytes(value)
+    return value
+
+
+def is_frozen_value(value: Any) -> bool:
+    """
+    Check if a value can't change anymore: it's immutable, frozen, or only contains such values.
+
+    :param value: The value to check
+    :return: True if the value can't change, False otherwise
+    """
+    from .config_structure import ConfigStructure  # lazy import
+
+    if is_immutable(value):
+        return True
+    if isinstance(value, ConfigStructure):
+        return getattr(value, FROZEN_ATTRIBUTE, False)
+    if isinstance(value, FrozenDict):
+        return all(map(is_frozen_value, value.values()))
+    if isinstance(value, (tuple, frozenset)):
+        return all(map(is_frozen_value, value))
+    return False
@@ -1,12 +1,41 @@
-from typing import TYPE_CHECKING, Callable, Any, Generic, NoReturn, Optional, TypeVar, overload
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Any, Generic, Iterator, NoReturn, Optional, TypeVar, overload
 
+from . import dependencies
 from .placeholder import PlaceHolder
+from .utils.single_flight import SingleFlight
 
 if TYPE_CHECKING:
     from . import BaseConfig
 
 GV = TypeVar("GV")
 
+sharing = 0
+"""
+The number of scopes in all threads in which the computations of all the lazy values are deduplicated,
+as in the thread-safe mode (see :func:`shared_computations`).
+"""
+
+_sharing_lock = threading.Lock()
+_shared_flight = SingleFlight()
+
+
+@contextmanager
+def shared_computations() -> Iterator[None]:
+    """
+    Deduplicate the concurrent computations of the same lazy value of an instance while in the scope,
+    even if the lazy value is not thread-safe, e.g. while lazy values are computed in a thread pool.
+    """
+    global sharing
+    with _sharing_lock:
+        sharing += 1
+    try:
+        yield
+    finally:
+        with _sharing_lock:
+            sharing -= 1
+
 # TODO: typing using new syntax. use Never instead of Any
 class Lazy(Generic[GV], PlaceHolder[GV]):
     """
@@ -27,9 +56,13 @@ class Lazy(Generic[GV], PlaceHolder[GV]):
         
         # Computed with a custom transformation
         formatted = Lazy[str](lambda c: f"The sum is {c.sum_value:.2f}")
+
+        # Computed exactly once even if several threads access it at the same time
+        vocabulary = Lazy[dict](lambda c: load_vocabulary(c.path), thread_safe=True)
     ```
     """
     readonly: bool = True
+    _single_flight: Optional[SingleFlight]
 
     def __init__(
         self,
@@ -37,6 +70,7 @@ class Lazy(Generic[GV], PlaceHolder[GV]):
         name: Optional[str] = None,
         description: Optional[str] = None,
         hidden: bool = False,
+        thread_safe: bool = False,
     ):
         """
         Initialize the lazy value with a function to compute it.
@@ -45,9 +79,12 @@ class Lazy(Generic[GV], PlaceHolder[GV]):
         :param name: Optional custom name for the lazy value (defaults to attribute name)
         :param description: Optional description of the lazy value
         :param hidden: Whether the lazy value should be hidden from to_dict output
+        :param thread_safe: If true, the value is computed exactly once per instance, and the other
+                            threads accessing it meanwhile wait for the result (or the exception)
         """
         super().__init__(name, description, hidden)
         self.fn = fn
+        self._single_flight = SingleFlight() if thread_safe else None
 
     @overload
     def __get__(self, instance: "BaseConfig", owner) -> GV:
@@ -63,6 +100,12 @@ class Lazy(Generic[GV], PlaceHolder[GV]):
         If accessed on an instance:
         - If the value has already been computed, returns the cached value
         - Otherwise, computes the value using the provided function, caches it, and returns it
+
+        The placeholders read by the function are recorded, and the cached value is removed
+        when any of them is set or deleted (see :mod:`fancy.config.dependencies`).
+
+        In the thread-safe mode, concurrent accesses to an uncomputed value wait for a single
+        computation. If it raises, all of them get the exception, and nothing is cached.
         
         :param instance: The instance on which the lazy value is accessed
         :param owner: The class that owns this lazy value
@@ -71,9 +114,39 @@ class Lazy(Generic[GV], PlaceHolder[GV]):
         if instance is None:
             return self
 
-        if not super().is_assigned(instance):
-            vars(instance)[self.__name__] = self.fn(instance)
-        return vars(instance)[self.__name__]
+        if dependencies.tracking:
+            dependencies.record(instance, self.__name__)
+        values = vars(instance)
+        if self.__name__ not in values:
+            if self._single_flight is not None:
+                return self._single_flight.do(id(instance), self._compute_once, instance)
+            if sharing:
+                return _shared_flight.do((id(instance), self.__name__), self._compute_once, instance)
+            values[self.__name__] = self._compute(instance)
+        return values[self.__name__]
+
+    @property
+    def thread_safe(self) -> bool:
+        """
+        Check if the value is computed exactly once per instance under concurrent accesses.
+
+        :return: True if the lazy value is thread-safe, False otherwise
+        """
+        return self._single_flight is not None
+
+    def _compute_once(self, instance: "BaseConfig") -> GV:
+        # the value may be stored by a computation which finished after the caller checked it
+        values = vars(instance)
+        if self.__name__ not in values:
+            values[self.__name__] = self._compute(instance)
+        return values[self.__name__]
+
+    def _compute(self, instance: "BaseConfig") -> GV:
+        dependencies.begin(instance, self.__name__)
+        try:
+            return self.fn(instance)
+        finally:
+            dependencies.end()
 
     def is_assigned(self, instance) -> bool:
         """
@@ -0,0 +1,198 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Hashable, NamedTuple, Optional, Sequence, TypeVar
+
+from . import dependencies
+from .lazy import Lazy
+from .utils.freeze import freeze
+from .utils.single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from . import BaseConfig
+
+GV = TypeVar("GV")
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a :class:`LazyCache`.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LazyCache:
+    """
+    A bounded LRU cache of the values of memoized lazies, shared by config instances.
+
+    Values which support weak references are held weakly if ``weak`` is true, so a
+    cached value is freed once no config (or anything else) uses it; such an entry is
+    then a miss. Other values are held until they are evicted.
+    Concurrent misses with the same key are computed once.
+    """
+    maxsize: int
+    weak: bool
+
+    def __init__(self, maxsize: int = 1024, weak: bool = True):
+        """
+        Initialize an empty cache.
+
+        :param maxsize: The maximum number of entries
+        :param weak: Whether to hold the values which support weak references weakly
+        :raises ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.weak = weak
+        self._entries: "OrderedDict[Hashable, Callable[[], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._single_flight = SingleFlight()
+        self._hits = self._misses = self._evictions = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], GV]) -> GV:
+        """
+        Get the cached value of a key, or compute and cache it.
+
+        :param key: The key of the value
+        :param compute: The function computing the value
+        :return: The cached or computed value
+        """
+        value = self._get(key)
+        if value is not _MISSING:
+            return value
+        return self._single_flight.do(key, self._compute, key, compute)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Get the statistics of this cache.
+
+        :return: The numbers of hits, misses and evictions, and the sizes
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """
+        Remove all the entries and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            value = _MISSING if entry is None else entry()
+            if value is None and isinstance(entry, weakref.ref):  # freed
+                del self._entries[key]
+                value = _MISSING
+            if value is _MISSING:
+                return _MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def _compute(self, key: Hashable, compute: Callable[[], GV]) -> GV:
+        value = self._get(key)  # computed by the previous flight
+        if value is not _MISSING:
+            return value
+        value = compute()
+        with self._lock:
+            self._misses += 1
+            self._entries[key] = self._make_entry(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def _make_entry(self, value: Any) -> Callable[[], Any]:
+        if self.weak:
+            try:
+                return weakref.ref(value)
+            except TypeError:
+                pass
+        return lambda: value
+
+
+default_lazy_cache = LazyCache()
+"""
+The process-wide cache used by memoized lazies by default.
+"""
+
+
+class MemoizedLazy(Lazy[GV]):
+    """
+    A lazy value which is shared by the config instances with the same inputs.
+
+    The value is cached in a process-wide :class:`LazyCache`, keyed by the type of the
+    config and the values of the options it depends on, so other instances with equal
+    option values reuse it instead of computing it again. The function must only depend
+    on these options.
+
+    Example usage:
+    ```python
+    class ModelConfig(BaseConfig):
+        model_path = Option(type=str)
+        lowercase = Option(type=bool, default=False)
+        batch_size = Option(type=int, default=32)
+
+        tokenizer = MemoizedLazy(load_tokenizer, depends_on=["model_path", "lowercase"])
+    ```
+
+    The value is also cached in each instance like other lazies, and removed when one of
+    the options it depends on is changed.
+    """
+    depends_on: Optional[Sequence[str]]
+    cache: LazyCache
+
+    def __init__(
+        self,
+        fn: Callable[[Any], GV],
+        depends_on: Optional[Sequence[str]] = None,
+        cache: Optional[LazyCache] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        hidden: bool = False,
+        thread_safe: bool = False,
+    ):
+        """
+        Initialize the memoized lazy value with a function to compute it.
+
+        :param fn: A function that computes the value when needed. Takes the config instance as its argument.
+        :param depends_on: The attribute names of the options the value depends on, defaults to all options
+        :param cache: The cache to store the value in, defaults to :data:`default_lazy_cache`
+        :param name: Optional custom name for the lazy value (defaults to attribute name)
+        :param description: Optional description of the lazy value
+        :param hidden: Whether the lazy value should be hidden from to_dict output
+        :param thread_safe: See :class:`Lazy`
+        """
+        super().__init__(fn, name, description, hidden, thread_safe)
+        self.depends_on = None if depends_on is None else tuple(depends_on)
+        self.cache = default_lazy_cache if cache is None else cache
+
+    def _compute(self, instance: "BaseConfig") -> GV:
+        dependencies.begin(instance, self.__name__)
+        try:
+            key = self._make_key(instance)  # the options read here are recorded as the dependencies
+            if key is None:
+                return self.fn(instance)
+            return self.cache.get_or_compute(key, lambda: self.fn(instance))
+        finally:
+            dependencies.end()
+
+    def _make_key(self, instance: "BaseConfig") -> Optional[Hashable]:
+        names = self.depends_on
+        if names is None:
+            names = instance.get_all_options().keys()
+        try:
+            return self, type(instance), tuple((name, freeze(getattr(instance, name))) for name in names)
+        except TypeError:  # unhashable option values, the value is not shared
+            return None
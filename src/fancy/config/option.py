@@ -1,8 +1,18 @@
+import typing
+from copy import copy
 from typing import Any, Callable, TYPE_CHECKING, Generic, Optional, TypeVar, Union, overload
 
+from . import dependencies
+from .dependencies import DEPENDENTS_ATTRIBUTE
+from .exc import FrozenConfigError
+from .frozen import FROZEN_ATTRIBUTE
+from .config_structure import ConfigStructure
 from .placeholder import PlaceHolder
-from .process import auto_process_typ, auto_process_value
+from .process import auto_process_typ, auto_process_value, is_scalar
+from .process.numeric_array import is_numeric_array
 from .typing import UnProcType
+from .utils import annotations
+from .utils.immutable import is_immutable
 from ..config import identical
 
 if TYPE_CHECKING:
@@ -12,6 +22,16 @@ GV = TypeVar("GV")
 SV = TypeVar("SV")
 N = TypeVar("N")  # TODO: should bound to None or Never
 
+_SHARED = "shared"
+_COPIED = "copied"
+_CONVERTED = "converted"
+_CLONED = "cloned"
+_COPYABLE_TYPES = (list, dict, set, bytearray)
+
+_base_config = None
+_dict_based_loader = None
+_clone = None
+
 class Option(Generic[GV, SV, N], PlaceHolder[Union[GV, N]]):
     """
     Represents a configuration option with validation, type conversion, and other features.
@@ -36,13 +56,23 @@ class Option(Generic[GV, SV, N], PlaceHolder[Union[GV, N]]):
         
         # A list of integers
         d = Option(type=[int])
+
+        # Types compiled from annotations, once when the class is created
+        port: int = Option(default=80)
+        hosts: List[str] = Option(default=[])
+        db: Optional[DbConfig] = Option()  # nullable
     ```
     """
     raw_type: UnProcType
     _type: Callable[[Any], Any]
+    _setter: Callable[["BaseConfig", Any], None]
     _required: bool
     _nullable: bool
     _default: Any
+    _default_strategy: Optional[str] = None
+    _default_value: Any = None
+    _from_annotation: bool
+    _annotation_owner: Optional[type] = None
 
     _description: str
 
@@ -54,7 +84,7 @@ class Option(Generic[GV, SV, N], PlaceHolder[Union[GV, N]]):
             required: bool = False,
             nullable: bool = False,
             default=None,
-            type: UnProcType = identical,
+            type: Optional[UnProcType] = None,
             name: Optional[str] = None,
             description: Optional[str] = None,
             hidden: bool = False
@@ -65,7 +95,10 @@ class Option(Generic[GV, SV, N], PlaceHolder[Union[GV, N]]):
         :param required: Whether the option must be specified in the configuration data
         :param nullable: Whether the option can have a null (None) value
         :param default: Default value for the option if not specified in the configuration data
-        :param type: Type specification for validation and conversion
+        :param type: Type specification for validation and conversion.
+                     If not given, it is compiled from the annotation of the attribute
+                     (an ``Optional`` annotation also makes the option nullable),
+                     or the value is stored unchanged when there is no supported annotation.
         :param name: Optional custom name for the option (defaults to attribute name)
         :param description: Optional description of the option
         :param hidden: Whether the option should be hidden from to_dict output
@@ -82,8 +115,27 @@ class Option(Generic[GV, SV, N], PlaceHolder[Union[GV, N]]):
         #  or required value or nullable values
         self._default = default
 
-        self.raw_type = type
-        self._type = auto_process_typ(type)
+        self.raw_type = identical if type is None else type
+        self._set_type(auto_process_typ(self.raw_type))
+        self._from_annotation = type is None
+
+    def __set_name__(self, owner, name):
+        """
+        Set the name of this option, and compile its type from the annotation if the type is not given.
+
+        Annotations with forward references which can't be resolved yet are compiled on first use.
+        Annotations which are not supported or can't be resolved are ignored.
+
+        :param owner: The class that owns this option
+        :param name: The attribute name of this option
+        """
+        super().__set_name__(owner, name)
+        if self._from_annotation:
+            try:
+                self._apply_annotation(owner)
+            except NameError:
+                self._annotation_owner = owner
+                self._set_type(self._resolve_deferred_type)
 
     @overload
     def __get__(self, instance: "BaseConfig", owner) -> GV:
@@ -111,13 +163,18 @@ class Option(Generic[GV, SV, N], PlaceHolder[Union[GV, N]]):
 
         # initialize value
         if self._should_assign_default_value(instance):
+            self._ensure_annotation_resolved()
             if self._default is None and not self._nullable:
                 raise AttributeError(
                     f"attribute '{self.__name__}' of '{owner.__name__}' object must be assigned before accessing.")
 
-            self.__set__(instance, self._default)
+            self._assign_default(instance)
 
-        return vars(instance)[self.__name__]
+        value = vars(instance)[self.__name__]
+        if dependencies.tracking:
+            dependencies.record(instance, self.__name__)
+            dependencies.record_items(value)
+        return value
 
     def __set__(self, instance: "BaseConfig", raw_value: Optional[Union[SV, N]]):
         """
@@ -132,21 +189,21 @@ class Option(Generic[GV, SV, N], PlaceHolder[Union[GV, N]]):
         - If nullable=False, a ValueError is raised
         
         When raw_value is not None:
-        - The value is processed using auto_process_value with the configured type
+        - If the type is scalar (see :func:`process.is_scalar`), the value is converted and stored directly
+        - Otherwise, the value is processed using auto_process_value with the configured type
+
+        The setter is selected when the type is set, so a scalar assignment only
+        converts and stores the value.
+
+        The cached values of the lazies which depend on this option are removed.
         
         :param instance: The instance on which to set the value
         :param raw_value: The value to set (before processing)
         :raises ValueError: If None is provided for a non-nullable option
+        :raises exc.FrozenConfigError: If the instance is frozen
         """
         # TODO Add Docs to explain how the None value works in this function
-        if raw_value is None:
-            if not self._nullable:
-                raise ValueError('the value should not be none')
-            value = None
-        else:
-            value = auto_process_value(raw_value, self._type, instance)
-
-        vars(instance)[self.__name__] = value
+        self._setter(instance, raw_value)
 
     def __delete__(self, instance):
         """
@@ -154,10 +211,17 @@ class Option(Generic[GV, SV, N], PlaceHolder[Union[GV, N]]):
         
         This removes the option from the instance's dictionary,
         making it appear unassigned again.
+        The cached values of the lazies which depend on it are removed too.
         
         :param instance: The instance from which to delete the value
+        :raises exc.FrozenConfigError: If the instance is frozen
         """
-        del vars(instance)[self.__name__]
+        values = vars(instance)
+        if FROZEN_ATTRIBUTE in values:
+            raise FrozenConfigError(instance, self.name)
+        del values[self.__name__]
+        if DEPENDENTS_ATTRIBUTE in values:
+            dependencies.invalidate(instance, self.__name__)
 
     def _should_assign_default_value(self, instance):
         """
@@ -189,4 +253,163 @@ class Option(Generic[GV, SV, N], PlaceHolder[Union[GV, N]]):
         :param instance: The instance to check
         :return: True if the option is considered assigned, False otherwise
         """
+        self._ensure_annotation_resolved()
         return super().is_assigned(instance) or self._default is not None or self._nullable
+
+    def _apply_annotation(self, owner: type) -> None:
+        annotation = annotations.get_annotation(owner, self.__name__)
+        if annotation is not annotations.MISSING and not _is_placeholder_annotation(annotation):
+            try:
+                raw_type, nullable = annotations.typ_from_annotation(annotation)
+            except TypeError:
+                # annotations which don't map to a type specification, e.g. `Tuple[int, int]`
+                # or `Literal["a", "b"]`, stay decorative and the values are stored unchanged
+                pass
+            else:
+                self.raw_type = raw_type
+                self._nullable = self._nullable or nullable
+        self._set_type(auto_process_typ(self.raw_type))
+
+    def _set_type(self, processor: Callable[[Any], Any]) -> None:
+        self._type = processor
+        self._default_strategy = None
+        self._default_value = None
+        self._default_setter = None
+        self._setter = self._set_scalar if is_scalar(processor) else self._set_structure
+
+    def _set_scalar(self, instance: "BaseConfig", raw_value: Any) -> None:
+        if raw_value is None:
+            self._set_none(instance)
+            return
+        values = vars(instance)
+        if FROZEN_ATTRIBUTE in values:
+            raise FrozenConfigError(instance, self.name)
+        values[self.__name__] = self._type(raw_value)
+        if DEPENDENTS_ATTRIBUTE in values:
+            dependencies.invalidate(instance, self.__name__)
+
+    def _set_structure(self, instance: "BaseConfig", raw_value: Any) -> None:
+        if raw_value is None:
+            self._set_none(instance)
+            return
+        values = vars(instance)
+        if FROZEN_ATTRIBUTE in values:
+            raise FrozenConfigError(instance, self.name)
+        values[self.__name__] = auto_process_value(raw_value, self._type, instance)
+        if DEPENDENTS_ATTRIBUTE in values:
+            dependencies.invalidate(instance, self.__name__)
+
+    def _set_none(self, instance: "BaseConfig") -> None:
+        self._ensure_annotation_resolved()
+        if not self._nullable:
+            raise ValueError('the value should not be none')
+        values = vars(instance)
+        if FROZEN_ATTRIBUTE in values:
+            raise FrozenConfigError(instance, self.name)
+        values[self.__name__] = None
+        if DEPENDENTS_ATTRIBUTE in values:
+            dependencies.invalidate(instance, self.__name__)
+
+    def _assign_default(self, instance: "BaseConfig") -> None:
+        """
+        Assign the default value to an instance, converting it only once when possible.
+
+        The converted default is shared by all instances if it is immutable. Otherwise,
+        mutable containers and structures of scalar values are copied from the value
+        converted the first time. Sub-configs are loaded with the loader of the instance,
+        so they are cloned from the one loaded the first time only when they would be
+        loaded the same way, and other values are converted for every instance.
+
+        :param instance: The instance to assign the default value to
+        """
+        strategy = self._default_strategy
+        if strategy is _SHARED:
+            vars(instance)[self.__name__] = self._default_value
+        elif strategy is _COPIED:
+            vars(instance)[self.__name__] = copy(self._default_value)
+        elif strategy is _CLONED and _sub_loader_setter(instance) is self._default_setter:
+            vars(instance)[self.__name__] = _clone_config(self._default_value)
+        else:
+            self.__set__(instance, self._default)
+            if strategy is None:
+                self._choose_default_strategy(instance, vars(instance)[self.__name__])
+
+    def _choose_default_strategy(self, instance: "BaseConfig", value: Any) -> None:
+        if is_immutable(value) or _is_frozen_config(value):
+            self._default_value, self._default_strategy = value, _SHARED
+        elif _is_copyable(value):
+            # keep a private copy, the value is owned by the instance now
+            self._default_value, self._default_strategy = copy(value), _COPIED
+        elif _is_config(value) and isinstance(self._default, dict) and _sub_loader_setter(instance) is not None:
+            # the sub-config depends only on the setter of the loader, which is kept to check
+            # the next instances, and ``post_load`` isn't run again for the clones
+            self._default_value, self._default_strategy = _clone_config(value), _CLONED
+            self._default_setter = _sub_loader_setter(instance)
+        else:
+            self._default_strategy = _CONVERTED
+
+    def _resolve_deferred_type(self, raw_value: Any) -> Any:
+        self._ensure_annotation_resolved()
+        return self._type(raw_value)
+
+    def _ensure_annotation_resolved(self) -> None:
+        if self._annotation_owner is not None:
+            try:
+                self._apply_annotation(self._annotation_owner)
+            except NameError:
+                # e.g. a name imported only when type checking, the values are stored unchanged
+                self._set_type(auto_process_typ(self.raw_type))
+            self._annotation_owner = None
+
+
+def _is_config(value: Any) -> bool:
+    global _base_config
+    if _base_config is None:
+        from .base_config import BaseConfig  # lazy import
+        _base_config = BaseConfig
+    return isinstance(value, _base_config)
+
+
+def _is_frozen_config(value: Any) -> bool:
+    return _is_config(value) and value.frozen
+
+
+def _sub_loader_setter(instance: "BaseConfig") -> Any:
+    # the attribute setter of the sub-loaders of the instance, or None if the
+    # sub-loaders may depend on anything else
+    global _dict_based_loader
+    if _dict_based_loader is None:
+        from .config_loaders import DictBasedConfigLoader  # lazy import
+        _dict_based_loader = DictBasedConfigLoader
+    loader = instance._loader
+    if loader is None or type(loader).get_sub_loader is not _dict_based_loader.get_sub_loader:
+        return None
+    return loader.get_setter()
+
+
+def _clone_config(config: "BaseConfig") -> "BaseConfig":
+    global _clone
+    if _clone is None:
+        from .clone import clone_config  # lazy import
+        _clone = clone_config
+    return _clone(config)
+
+
+def _is_copyable(value: Any) -> bool:
+    # a shallow copy is enough only if the items are immutable
+    if is_numeric_array(value):
+        return True
+    if isinstance(value, ConfigStructure):
+        # list and dict structures of scalar values don't depend on the context
+        if not getattr(value, "_is_scalar", False):
+            return False
+    elif type(value) not in _COPYABLE_TYPES:
+        return False
+    items = value.values() if isinstance(value, dict) else value
+    return all(map(is_immutable, items))
+
+
+def _is_placeholder_annotation(annotation: Any) -> bool:
+    # e.g. `a: Option[int, int, None] = Option(...)`
+    cls = typing.get_origin(annotation) or annotation
+    return isinstance(cls, type) and issubclass(cls, PlaceHolder)
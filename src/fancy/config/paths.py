@@ -0,0 +1,236 @@
+"""
+Access to the values of configuration trees by paths.
+
+A path is like ``db.replicas[2].host``: configuration names separated by dots, and indexes
+of lists or keys of dictionaries in brackets (quoted if they contain brackets). This is the
+format of the paths returned by :func:`precompute_lazies` and :func:`diff_configs`.
+
+Paths are parsed once and compiled into accessors, which are cached per config class.
+"""
+
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple, Type, Union
+
+from . import dependencies
+from .base_config import BaseConfig
+from .config_dict_struct import ConfigDictStructure
+from .config_list_struct import ConfigListStructure
+from .lazy import Lazy
+from .process import auto_process_value
+
+PATH_CACHE_SIZE = 1024
+"""
+The maximum number of compiled accessors which are cached.
+"""
+
+_STEP_PATTERN = re.compile(r"""(\.?)([^.\[\]]+)|\[(?:"([^"]*)"|'([^']*)'|(-?\d+)|([^\]]*))\]""")
+
+Step = Tuple[bool, Union[str, int]]
+"""
+A step of a path: whether it's a name (rather than an index or a key), and the name, index or key.
+"""
+
+
+def parse_path(path: str) -> List[Step]:
+    """
+    Parse a path into its steps.
+
+    Unquoted integers in brackets are indexes, and other values in brackets are keys.
+
+    :param path: The path, like ``db.replicas[2].host``
+    :return: The steps of the path
+    :raises ValueError: If the path is not valid
+    """
+    steps = []
+    position = 0
+    while position < len(path):
+        match = _STEP_PATTERN.match(path, position)
+        if match is None or (match.group(2) is not None and bool(match.group(1)) != (position > 0)):
+            raise ValueError(f"invalid path: {path!r} at position {position}")
+        dot, name, double_quoted, single_quoted, index, key = match.groups()
+        if name is not None:
+            steps.append((True, name))
+        elif index is not None:
+            steps.append((False, int(index)))
+        else:
+            steps.append((False, next(k for k in (double_quoted, single_quoted, key) if k is not None)))
+        position = match.end()
+    if not steps or not steps[0][0]:
+        raise ValueError(f"invalid path: {path!r}, a path starts with a name")
+    return steps
+
+
+class PathAccessor:
+    """
+    A compiled path, which gets and sets the value at the path in configs of a class.
+    """
+
+    path: str
+    """
+    The path.
+    """
+
+    _attr_name: str
+    _get_first: Callable[[BaseConfig], Any]
+    _getters: List[Callable[[Any], Any]]
+    _last: Step
+
+    def __init__(self, config_type: Type[BaseConfig], path: str):
+        """
+        Compile a path for a config class.
+
+        :param config_type: The class of the configs at the root of the path
+        :param path: The path
+        :raises ValueError: If the path is not valid
+        :raises KeyError: If the first name of the path is not a name of the class
+        """
+        steps = parse_path(path)
+        self.path = path
+        self._attr_name = _resolve_name(config_type, steps[0][1])
+        self._get_first = _attribute_getter(self._attr_name, _is_stored(config_type, self._attr_name))
+        self._getters = [_getter(path, step) for step in steps[1:]]
+        self._last = steps[-1]
+
+    def get(self, config: BaseConfig) -> Any:
+        """
+        Get the value at the path.
+
+        :param config: The root config
+        :return: The value
+        :raises KeyError: If a name or a key is not found, or a step doesn't apply to the value,
+                          like a name to a list
+        :raises IndexError: If an index is out of range
+        """
+        value = self._get_first(config)
+        for getter in self._getters:
+            value = getter(value)
+        return value
+
+    def set(self, config: BaseConfig, raw_value: Any) -> None:
+        """
+        Set the value at the path, converted by the type of the option, list or dictionary containing it.
+
+        Sub-configs in lists and dictionaries are loaded with the loader of the nearest config.
+
+        :param config: The root config
+        :param raw_value: The value to set
+        :raises KeyError: If a name or a key is not found, or a step doesn't apply to the value,
+                          like a name to a list
+        :raises IndexError: If an index is out of range
+        """
+        if not self._getters:
+            setattr(config, self._attr_name, raw_value)
+            return
+        context = config
+        parent = getattr(config, self._attr_name)
+        for getter in self._getters[:-1]:
+            if isinstance(parent, BaseConfig):
+                context = parent
+            parent = getter(parent)
+        is_name, key = self._last
+        if not _applies(self._last, parent):
+            raise _step_error(self.path, self._last, parent)
+        if isinstance(parent, BaseConfig):
+            setattr(parent, _resolve_name(type(parent), key), raw_value)
+        elif isinstance(parent, ConfigListStructure):
+            parent[key] = _convert(parent, raw_value, context)
+        elif isinstance(parent, ConfigDictStructure):
+            parent[parent._key_typ(key)] = _convert(parent, raw_value, context)
+        else:
+            try:
+                parent[key] = raw_value
+            except TypeError:  # e.g. a key of a tuple
+                raise _step_error(self.path, self._last, parent) from None
+
+    def __repr__(self):
+        return f"PathAccessor({self.path!r})"
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(config_type: Type[BaseConfig], path: str) -> PathAccessor:
+    """
+    Compile a path for a config class, or get the cached accessor.
+
+    :param config_type: The class of the configs at the root of the path
+    :param path: The path
+    :return: The accessor
+    :raises ValueError: If the path is not valid
+    :raises KeyError: If the first name of the path is not a name of the class
+    """
+    return PathAccessor(config_type, path)
+
+
+def _resolve_name(config_type: Type[BaseConfig], name: Union[str, int]) -> str:
+    try:
+        return config_type.get_name_mapping()[str(name)]
+    except KeyError:
+        raise KeyError(f"{config_type}: not contains the config named {name}") from None
+
+
+def _is_stored(config_type: Type[BaseConfig], attr_name: str) -> bool:
+    # the values of options and placeholders are stored as they are, unlike lazy values
+    return not isinstance(config_type.get_all_placeholders()[attr_name], Lazy)
+
+
+def _attribute_getter(attr_name: str, stored: bool) -> Callable[[BaseConfig], Any]:
+    if not stored:
+        return operator.attrgetter(attr_name)
+
+    def _get(config):
+        # read the assigned value directly, unless the read must be recorded as a dependency
+        if not dependencies.tracking:
+            values = vars(config)
+            if attr_name in values:
+                return values[attr_name]
+        return getattr(config, attr_name)
+    return _get
+
+
+def _getter(path: str, step: Step) -> Callable[[Any], Any]:
+    _, key = step
+    config_getters = {}  # the getters of the attribute named by the key, by config class
+
+    def _get(value):
+        config_getter = config_getters.get(type(value))
+        if config_getter is not None:
+            return config_getter(value)
+        if not _applies(step, value):
+            raise _step_error(path, step, value)
+        if isinstance(value, BaseConfig):
+            config_type = type(value)
+            attr_name = _resolve_name(config_type, key)
+            config_getter = config_getters[config_type] = _attribute_getter(
+                attr_name, _is_stored(config_type, attr_name)
+            )
+            return config_getter(value)
+        if isinstance(value, ConfigDictStructure):
+            return value[value._key_typ(key)]
+        try:
+            return value[key]
+        except TypeError:  # e.g. a key of a string
+            raise _step_error(path, step, value) from None
+    return _get
+
+
+def _applies(step: Step, value: Any) -> bool:
+    # names apply to configs only, and indexes to sequences only
+    is_name, key = step
+    if isinstance(value, BaseConfig):
+        return is_name
+    if is_name:
+        return False
+    return isinstance(key, int) or not isinstance(value, (list, tuple))
+
+
+def _step_error(path: str, step: Step, value: Any) -> KeyError:
+    is_name, key = step
+    step_repr = f".{key}" if is_name else f"[{key}]"
+    return KeyError(f"{path!r}: can't apply {step_repr} to a value of type {type(value).__name__}")
+
+
+def _convert(structure, raw_value: Any, context: BaseConfig) -> Any:
+    if structure._is_scalar:
+        return structure._config_typ(raw_value)
+    return auto_process_value(raw_value, structure._config_typ, context)
@@ -1,5 +1,9 @@
 from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union, overload
 
+from . import dependencies
+from .exc import FrozenConfigError
+from .frozen import FROZEN_ATTRIBUTE
+
 if TYPE_CHECKING:
     from fancy.config import BaseConfig
 
@@ -83,6 +87,8 @@ class PlaceHolder(Generic[V]):
         if instance is None:
             return self
 
+        if dependencies.tracking:
+            dependencies.record(instance, self.__name__)
         try:
             return vars(instance)[self.__name__]
         except KeyError:
@@ -97,10 +103,16 @@ class PlaceHolder(Generic[V]):
         :param instance: The instance on which to set the value
         :param raw_value: The value to set
         :raises AttributeError: If the placeholder is read-only
+        :raises exc.FrozenConfigError: If the instance is frozen
         """
         if self.readonly:
             raise AttributeError(f"{self.name} can't be set")
-        vars(instance)[self.__name__] = raw_value
+        values = vars(instance)
+        if FROZEN_ATTRIBUTE in values:
+            raise FrozenConfigError(instance, self.name)
+        values[self.__name__] = raw_value
+        if dependencies.DEPENDENTS_ATTRIBUTE in values:
+            dependencies.invalidate(instance, self.__name__)
 
     def __delete__(self, instance: "BaseConfig"):
         """
@@ -108,10 +120,17 @@ class PlaceHolder(Generic[V]):
         
         This removes the placeholder from the instance's dictionary,
         making it appear unassigned again.
+        The cached values of the lazies which depend on it are removed too.
         
         :param instance: The instance from which to delete the value
-        """
-        vars(instance).pop(self.__name__, None)
+        :raises exc.FrozenConfigError: If the instance is frozen
+        """
+        values = vars(instance)
+        if FROZEN_ATTRIBUTE in values:
+            raise FrozenConfigError(instance, self.name)
+        values.pop(self.__name__, None)
+        if dependencies.DEPENDENTS_ATTRIBUTE in values:
+            dependencies.invalidate(instance, self.__name__)
 
     @property
     def name(self) -> str:
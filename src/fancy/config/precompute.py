@@ -0,0 +1,91 @@
+"""
+Eager computation of the lazy values of configuration trees.
+"""
+
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .async_lazy import AsyncLazy
+from .lazy import Lazy, shared_computations
+from .placeholder import PlaceHolder
+from .utils.tree import iter_configs, join_path
+
+if TYPE_CHECKING:
+    from . import BaseConfig, ConfigStructure
+
+LazyTimings = Dict[str, float]
+"""
+The seconds taken to compute each lazy value, keyed by its path like ``servers[0].address``.
+"""
+
+
+def precompute_lazies(
+        structure: "ConfigStructure",
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+) -> LazyTimings:
+    """
+    Compute all the lazy values of a configuration tree, so the first accesses are cheap.
+
+    Each lazy value is computed by its own task in a thread pool, so independent lazy values
+    are computed concurrently. The dependencies between lazy values are only known when they
+    are read, so the tasks are submitted in the usual dependency order, the lazy values of the
+    deepest configs first and in declaration order within a config, and the computations are
+    deduplicated while the tasks run (see :func:`lazy.shared_computations`): a lazy value read
+    by another one is computed once, either by its own task or as a part of the other one,
+    and the readers wait for it. The timings are inclusive of the lazy values read, or waited for.
+    Lazy values which have already been computed and async lazy values are skipped.
+
+    :param structure: The root of the configuration tree
+    :param max_workers: The maximum number of threads, used if executor is not given
+    :param executor: An executor to run the computations, which is not shut down
+    :return: The seconds taken to compute each lazy value
+    :raises Exception: The first exception raised by the computations, after all of them are finished
+    """
+    tasks = [
+        (join_path(path, lazy.name), config, lazy)
+        for path, config in reversed(list(iter_configs(structure)))
+        for lazy in _uncomputed_lazies(config)
+    ]
+    if not tasks:
+        return {}
+    with shared_computations():
+        if executor is None:
+            with ThreadPoolExecutor(max_workers) as executor:
+                return _precompute_with(executor, tasks)
+        return _precompute_with(executor, tasks)
+
+
+def _precompute_with(executor: Executor, tasks: List[Tuple[str, "BaseConfig", Lazy]]) -> LazyTimings:
+    futures = [(path, executor.submit(_compute_lazy, config, lazy)) for path, config, lazy in tasks]
+    error = None
+    timings = {}
+    for path, future in futures:
+        try:
+            seconds = future.result()
+        except Exception as e:
+            error = e if error is None else error
+        else:
+            if seconds is not None:
+                timings[path] = seconds
+    if error is not None:
+        raise error
+    return timings
+
+
+def _uncomputed_lazies(config: "BaseConfig") -> List[Lazy]:
+    return [
+        placeholder for placeholder in config.get_all_placeholders().values()
+        if isinstance(placeholder, Lazy)
+        and not isinstance(placeholder, AsyncLazy)
+        and not PlaceHolder.is_assigned(placeholder, config)
+    ]
+
+
+def _compute_lazy(config: "BaseConfig", lazy: Lazy) -> Optional[float]:
+    if PlaceHolder.is_assigned(lazy, config):  # computed as a part of another one
+        return None
+    start = time.perf_counter()
+    lazy.__get__(config, type(config))
+    return time.perf_counter() - start
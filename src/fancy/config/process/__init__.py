@@ -7,28 +7,49 @@ according to type specifications. It includes handlers for various types of valu
 - boolean: Convert various string representations to boolean values
 - config: Process nested configuration objects
 - config_list: Process lists of configuration objects
+- parallel_config_list: Process lists of configuration objects in parallel
+- config_dict: Process dictionaries of configuration objects
+- discriminated: Process configuration objects whose class is selected by a field
 - flag_string/flag_container: Handle flag-based configuration
+- register_flag_type/get_flag_type: Manage the types usable in flagged strings
 - auto_process_typ: Automatically select the appropriate processor
 - auto_process_value: Convert values based on their type
 - identical: Pass values through unchanged
+- numeric_array: Convert numeric sequences into compact arrays
+- scalar/is_scalar: Mark and detect processors which never produce configuration structures
 """
 
 __all__ = [
     "boolean",
+    "make_boolean",
+    "BooleanConverter",
     "config",
     "config_list",
+    "parallel_config_list",
+    "config_dict",
+    "discriminated",
     "flag_string",
+    "register_flag_type",
+    "get_flag_type",
     "flag_container",
+    "iter_flag_container",
     "auto_process_typ",
     "auto_process_value",
-    "identical"
+    "identical",
+    "numeric_array",
+    "scalar",
+    "is_scalar",
 ]
 
-from .boolean import boolean, make_boolean
+from .scalar import scalar, is_scalar
+from .boolean import boolean, make_boolean, BooleanConverter
 from .config import config
-from .config_list import config_list
-from .flag_string import flag_string
-from .flag_container import flag_container
+from .config_list import config_list, parallel_config_list
+from .config_dict import config_dict
+from .discriminated import discriminated
+from .flag_string import flag_string, register_flag_type, get_flag_type
+from .flag_container import flag_container, iter_flag_container
 from .auto_process_typ import auto_process_typ
 from .auto_process_value import auto_process_value
 from .identical import identical
+from .numeric_array import numeric_array
@@ -1,27 +1,90 @@
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Dict, NamedTuple, Tuple, Union
 
-from . import boolean, config, config_list
+from . import boolean, config, config_list, config_dict
 from ..typing import UnProcType
 
+PROCESSOR_CACHE_SIZE = 1024
+"""
+The maximum number of type specifications whose processors are memoized by `auto_process_typ`.
+"""
+
 
 def auto_process_typ(typ: UnProcType) -> Callable:
     """
     Automatically select an appropriate processor for the given type.
-    
+
     This function examines the provided type specification and returns
     an appropriate processor function:
     - For list types (like [int]), returns a config_list processor
+    - For dict types (like {str: int}), returns a config_dict processor
     - For bool types, returns the boolean processor
     - For BaseConfig subclasses, returns a config processor
     - For other callable types, returns the callable itself
-    
-    :param typ: A type specification (type, list of types, or callable)
+
+    Processors of types and list/dict specifications are memoized, so the same processor
+    is returned for equal type specifications.
+
+    :param typ: A type specification (type, list of types, dict of types, or callable)
     :return: An appropriate processor function for the type
     :raises ValueError: If the type is not a recognized type specification
     """
+    if isinstance(typ, (list, dict)):  # https://github.com/susautw/fancy-config/issues/4
+        try:
+            return _cached_process_typ(_freeze(typ))
+        except TypeError:  # the element type is unhashable
+            return _process_typ(typ)
+    if isinstance(typ, type):
+        return _cached_process_typ(typ)
+    if callable(typ):
+        return typ
+    else:
+        raise ValueError("typ must be callable or subclass of BaseConfig")
+
+
+class _ListSpec(NamedTuple):
+    element: "_FrozenType"
+
+
+class _DictSpec(NamedTuple):
+    key: "_FrozenType"
+    value: "_FrozenType"
+
+
+_FrozenType = Union[_ListSpec, _DictSpec, type, Callable]
+
+
+def _freeze(typ: UnProcType) -> _FrozenType:
+    if isinstance(typ, list):
+        frozen = _ListSpec(_freeze(typ[0]))
+    elif isinstance(typ, dict):
+        key, value = _dict_item(typ)
+        frozen = _DictSpec(_freeze(key), _freeze(value))
+    else:
+        return typ
+    hash(frozen)
+    return frozen
+
+
+def _unfreeze(typ: _FrozenType) -> UnProcType:
+    if isinstance(typ, _ListSpec):
+        return [_unfreeze(typ.element)]
+    if isinstance(typ, _DictSpec):
+        return {_unfreeze(typ.key): _unfreeze(typ.value)}
+    return typ
+
+
+@lru_cache(maxsize=PROCESSOR_CACHE_SIZE)
+def _cached_process_typ(typ: _FrozenType) -> Callable:
+    return _process_typ(_unfreeze(typ))
+
+
+def _process_typ(typ: UnProcType) -> Callable:
     from .. import BaseConfig  # lazy import
-    if isinstance(typ, list):  # https://github.com/susautw/fancy-config/issues/4
+    if isinstance(typ, list):
         return config_list(typ[0])
+    if isinstance(typ, dict):
+        return config_dict(*_dict_item(typ))
     if isinstance(typ, type):
         if issubclass(typ, bool):
             return boolean
@@ -31,3 +94,9 @@ def auto_process_typ(typ: UnProcType) -> Callable:
         return typ
     else:
         raise ValueError("typ must be callable or subclass of BaseConfig")
+
+
+def _dict_item(typ: Dict[UnProcType, UnProcType]) -> Tuple[UnProcType, UnProcType]:
+    if len(typ) != 1:
+        raise ValueError("a dict type must have exactly one item, like {str: int}")
+    return next(iter(typ.items()))
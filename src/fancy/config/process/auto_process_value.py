@@ -1,7 +1,9 @@
-from typing import Any, Callable, TYPE_CHECKING
+from typing import Any, Callable, Optional, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .. import ConfigContext
+    from .. import ConfigContext, ConfigStructure
+
+_config_structure: Optional[Type["ConfigStructure"]] = None
 
 
 def auto_process_value(raw_val: Any, transform: Callable[[Any], Any], context: "ConfigContext") -> Any:
@@ -22,9 +24,12 @@ def auto_process_value(raw_val: Any, transform: Callable[[Any], Any], context: "
         it will be loaded with the context.
     """
 
-    from .. import ConfigStructure
+    global _config_structure
+    if _config_structure is None:
+        from .. import ConfigStructure  # lazy import
+        _config_structure = ConfigStructure
     value = transform(raw_val)
-    if isinstance(value, ConfigStructure):
+    if isinstance(value, _config_structure):
         if not value.loaded:
             value.load_by_context(context, raw_val)
     return value
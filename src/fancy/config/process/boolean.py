@@ -5,40 +5,132 @@ This module provides utilities for converting various string representations to
 values, with support for custom true/false value sets.
 """
 
-from typing import Any, Optional, Set
+from functools import partial
+from typing import AbstractSet, Any, Callable, FrozenSet, Optional
 
-TRUE_CHOICES = {"on", "1", "true", "yes", "==true=="}
+from .scalar import scalar
+
+TRUE_CHOICES = frozenset({"on", "1", "true", "yes", "==true=="})
 """
 Standard string values that represent True.
 """
 
-FALSE_CHOICES = {"off", "0", "false", "no", "==false=="}
+FALSE_CHOICES = frozenset({"off", "0", "false", "no", "==false=="})
 """
 Standard string values that represent False.
 """
 
-StrChoices = Set[str]
+StrChoices = AbstractSet[str]
+
+
+@scalar
+class BooleanConverter(partial):
+    """
+    A converter which converts values to booleans using a precompiled lookup table.
+
+    The table maps the choices, and their lowercase, uppercase and capitalized variants,
+    to booleans. Strings are first looked up as they are, and only normalized
+    (stripped and lowercased) when the exact lookup misses.
+    True choices take precedence over false choices.
+
+    The converter is a :class:`functools.partial` of the conversion function bound to
+    the lookup tables, so calling it costs no more than calling a closure.
+    """
+    __slots__ = ()
+
+    def __new__(cls, true_choices: StrChoices, false_choices: StrChoices):
+        """
+        Precompile the lookup table of the choices.
+
+        :param true_choices: Set of strings to interpret as True
+        :param false_choices: Set of strings to interpret as False
+        """
+        true_choices = frozenset(true_choices)
+        false_choices = frozenset(false_choices)
+        table = {}
+        normalized_table = {}
+        for choices, result in ((false_choices, False), (true_choices, True)):
+            for choice in choices:
+                for variant in (choice, choice.lower(), choice.upper(), choice.capitalize()):
+                    table[variant] = result
+                normalized_table[_normalize(choice)] = result
+        table.update(normalized_table)
+        error_choices = str(set(true_choices).union(false_choices))
+        return super().__new__(
+            cls, _convert, table.get, normalized_table.get, error_choices, true_choices, false_choices
+        )
+
+    def __reduce__(self):
+        # rebuilt from the choices, as partial would call __new__ with the arguments of the function
+        return type(self), (self.true_choices, self.false_choices)
+
+    @property
+    def true_choices(self) -> FrozenSet[str]:
+        """
+        Get the strings interpreted as True.
+
+        :return: The frozen set of the choices
+        """
+        return self.args[3]
+
+    @property
+    def false_choices(self) -> FrozenSet[str]:
+        """
+        Get the strings interpreted as False.
+
+        :return: The frozen set of the choices
+        """
+        return self.args[4]
+
+
+def _convert(
+    lookup: Callable[[str], Optional[bool]],
+    normalized_lookup: Callable[[str], Optional[bool]],
+    error_choices: str,
+    _true_choices: FrozenSet[str],
+    _false_choices: FrozenSet[str],
+    value: Any,
+) -> bool:
+    if isinstance(value, str):
+        result = lookup(value)
+        if result is None:
+            result = normalized_lookup(value.strip().lower())
+            if result is None:
+                raise ValueError(f"unexpected value: {value}, expected choices: {error_choices}")
+        return result
+    return bool(value)
+
+
+def _normalize(value: str) -> str:
+    return value.strip().lower()
+
+
+_default_converter = BooleanConverter(TRUE_CHOICES, FALSE_CHOICES)
 
 
 def make_boolean(
     true_choices: Optional[StrChoices] = None, false_choices: Optional[StrChoices] = None
-):
+) -> BooleanConverter:
     """
-    Create a boolean converter function with custom true/false choices.
-    
-    This function returns a new function that converts values to booleans
+    Create a boolean converter with custom true/false choices.
+
+    This function returns a new converter that converts values to booleans
     using the specified sets of strings that represent true and false.
-    
+    The lookup table of the choices is compiled once here.
+
     :param true_choices: Set of strings to interpret as True
     :param false_choices: Set of strings to interpret as False
-    :return: A function that converts values to booleans
+    :return: A converter that converts values to booleans
     """
-    def _inner(value):
-        return boolean(value, true_choices, false_choices)
-
-    return _inner
+    if true_choices is None and false_choices is None:
+        return _default_converter
+    return BooleanConverter(
+        TRUE_CHOICES if true_choices is None else true_choices,
+        FALSE_CHOICES if false_choices is None else false_choices,
+    )
 
 
+@scalar
 def boolean(
     value: Any,
     true_choices: Optional[StrChoices] = None,
@@ -53,6 +145,7 @@ def boolean(
 
     .. note::
         The function is case-insensitive and ignores leading/trailing whitespace.
+        Use :func:`make_boolean` to avoid compiling custom choices on each call.
     
     :param value: The value to convert to a boolean
     :param true_choices: Set of strings to interpret as True
@@ -60,19 +153,6 @@ def boolean(
     :return: The boolean representation of the value
     :raises ValueError: If the value is a string but not in either set of choices
     """
-    if true_choices is None:
-        true_choices = TRUE_CHOICES
-    if false_choices is None:
-        false_choices = FALSE_CHOICES
-
-    if isinstance(value, str):
-        _value = value.strip().lower()
-        if _value in true_choices:
-            return True
-        if _value in false_choices:
-            return False
-        raise ValueError(
-            f"unexpected value: {value}, expected choices:"
-            f" {str(true_choices.union(false_choices))}"
-        )
-    return bool(value)
+    if true_choices is None and false_choices is None:
+        return _default_converter(value)
+    return make_boolean(true_choices, false_choices)(value)
@@ -0,0 +1,24 @@
+from typing import Callable
+
+from ..typing import UnProcType
+
+
+def config_dict(key_type: UnProcType, value_type: UnProcType) -> Callable:
+    """
+    Create a function that returns a ConfigDictStructure for the specified types.
+
+    The key and value processors are resolved once here and shared by all the created dictionaries.
+
+    :param key_type: The type specification for keys in the dictionary
+    :param value_type: The type specification for values in the dictionary
+    :return: A function that returns a new ConfigDictStructure instance
+    """
+    from .. import ConfigDictStructure
+    from . import auto_process_typ
+
+    key_typ = auto_process_typ(key_type)
+    value_typ = auto_process_typ(value_type)
+
+    def _inner(_):
+        return ConfigDictStructure(key_typ, value_typ)
+    return _inner
@@ -1,20 +1,55 @@
-from typing import Callable
+from typing import Callable, Optional, TYPE_CHECKING
 
 from ..typing import UnProcType
 
+if TYPE_CHECKING:
+    from ..config_list_struct import ExecutorSpec
+
 
 def config_list(_type: UnProcType) -> Callable:
     """
     Create a function that returns a ConfigListStructure for the specified type.
-    
+
     This factory function creates a processor that returns a new ConfigListStructure
     instance configured to hold elements of the specified type.
-    
+    The element processor is resolved once here and shared by all the created lists.
+
     :param _type: The type specification for elements in the list
     :return: A function that returns a new ConfigListStructure instance
     """
     from .. import ConfigListStructure
+    from . import auto_process_typ
+
+    element_typ = auto_process_typ(_type)
+
+    def _inner(_):
+        return ConfigListStructure(element_typ)
+    return _inner
+
+
+def parallel_config_list(
+    _type: UnProcType,
+    executor: "ExecutorSpec" = "thread",
+    max_workers: Optional[int] = None,
+    chunk_size: int = 64,
+) -> Callable:
+    """
+    Create a function that returns a ParallelConfigListStructure for the specified type.
+
+    Example usage:
+    ```python
+    class ClusterConfig(BaseConfig):
+        services = Option(type=parallel_config_list(ServiceConfig, executor="process", chunk_size=128))
+    ```
+
+    :param _type: The type specification for elements in the list
+    :param executor: ``"thread"``, ``"process"`` or an executor instance to load the elements with
+    :param max_workers: The maximum number of workers of the created pool
+    :param chunk_size: The number of elements loaded by a task
+    :return: A function that returns a new ParallelConfigListStructure instance
+    """
+    from .. import ParallelConfigListStructure
 
     def _inner(_):
-        return ConfigListStructure(_type)
+        return ParallelConfigListStructure(_type, executor, max_workers, chunk_size)
     return _inner
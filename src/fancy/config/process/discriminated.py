@@ -0,0 +1,69 @@
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Mapping, Optional, Type, TypeVar
+
+if TYPE_CHECKING:
+    from .. import BaseConfig
+
+T = TypeVar("T", bound="BaseConfig")
+
+
+def discriminated(
+        mapping: Mapping[Hashable, Type[T]],
+        field: str = "kind",
+        default: Optional[Type[T]] = None,
+) -> Callable[[Any], T]:
+    """
+    Create a function that returns an instance of the config class selected by a field of the value.
+
+    The config class is looked up in the mapping by the value of the discriminator field,
+    and the instance is loaded with the whole value by `auto_process_value`, so each value
+    is read once. It can be used as an element type too, e.g. ``[discriminated(...)]``.
+
+    Example usage:
+    ```python
+    class StorageConfig(BaseConfig):
+        kind = Option(type=str, required=True)
+
+    class S3StorageConfig(StorageConfig):
+        bucket = Option(type=str, required=True)
+
+    class LocalStorageConfig(StorageConfig):
+        root = Option(type=str, default="/var/data")
+
+    class AppConfig(BaseConfig):
+        storage = Option(type=discriminated({"s3": S3StorageConfig, "local": LocalStorageConfig}))
+        backups = Option(type=[discriminated({"s3": S3StorageConfig, "local": LocalStorageConfig})])
+    ```
+
+    :param mapping: A mapping from the values of the field to config classes
+    :param field: The configuration name of the discriminator field, which each class must have,
+                  so the field is loaded and included in ``to_dict``
+    :param default: The config class used when the value has no field
+    :return: A function that returns an unloaded instance of the selected config class
+    :raises TypeError: If a class is not a subclass of BaseConfig, or has no field named ``field``
+    """
+    from .. import BaseConfig
+
+    table = dict(mapping)
+    classes = tuple(table.values()) + (() if default is None else (default,))
+    for cls in classes:
+        if not (isinstance(cls, type) and issubclass(cls, BaseConfig)):
+            raise TypeError(f"config type {cls} must be a subclass of BaseConfig")
+        if field not in cls.get_name_mapping():
+            raise TypeError(f"config type {cls.__name__} must have a placeholder named '{field}'")
+
+    def _inner(val: Any) -> T:
+        if isinstance(val, classes):
+            return val
+        try:
+            kind = val[field]
+        except (KeyError, TypeError):
+            if default is None:
+                raise ValueError(f"the value has no discriminator field '{field}': {val!r}") from None
+            return default()
+        try:
+            cls = table[kind]
+        except (KeyError, TypeError):  # TypeError for unhashable values
+            raise ValueError(f"unexpected {field}: {kind!r}, expected one of {list(table)}") from None
+        return cls()
+
+    return _inner
@@ -1,38 +1,95 @@
-from copy import deepcopy
-from typing import TypeVar, MutableMapping, MutableSequence
+from copy import copy
+from typing import Any, Iterator, Tuple, TypeVar, MutableMapping, MutableSequence, Hashable
 
 from . import flag_string
 
 T = TypeVar("T", MutableMapping, MutableSequence)
 
+Path = Tuple[Hashable, ...]
 
-def flag_container(container: T) -> T:
+
+def flag_container(container: T, inplace: bool = False) -> T:
     """
     Process all string values in a container using flag_string.
-    
-    This function creates a deep copy of the container and processes each string 
-    value within it using the flag_string processor. It works recursively on 
-    nested containers (dictionaries and lists).
-    
+
+    This function processes each string value within the container using the
+    flag_string processor. It works recursively on nested containers (dictionaries and lists).
+
+    By default, the container is not modified: new containers are created only along
+    the paths to converted values, and the subtrees without flagged strings are shared
+    with the original container. If no value is converted, the container itself is returned.
+
+    :param container: A mutable mapping (like dict) or sequence (like list)
+    :param inplace: If true, convert the values in the container itself instead
+    :return: A container with all string values processed
+    :raises TypeError: If the container is not a MutableMapping or MutableSequence
+    """
+    if not isinstance(container, (MutableMapping, MutableSequence)):
+        raise TypeError("the container must be a MutableMapping or MutableSequence")
+    if inplace:
+        for path, value in iter_flag_container(container):
+            parent = container
+            for key in path[:-1]:
+                parent = parent[key]
+            parent[path[-1]] = value
+        return container
+    return _copy_on_write(container)
+
+
+def iter_flag_container(container: T) -> Iterator[Tuple[Path, Any]]:
+    """
+    Iterate over the converted values of the flagged strings in a container.
+
+    This is the streaming variant of :func:`flag_container`: nothing is copied or
+    modified, and only the path to the currently visited value is kept in memory.
+    The values are yielded in depth-first order.
+
     :param container: A mutable mapping (like dict) or sequence (like list)
-    :return: A new container with all string values processed
+    :return: An iterator of (path, converted value) pairs, where a path is a tuple of keys and indexes
     :raises TypeError: If the container is not a MutableMapping or MutableSequence
     """
     if not isinstance(container, (MutableMapping, MutableSequence)):
         raise TypeError("the container must be a MutableMapping or MutableSequence")
-    result = deepcopy(container)
-    opening = [result]
+    path = []
+    opening = [_iter_entries(container)]
 
     while len(opening) > 0:
-        container = opening.pop()
-        if isinstance(container, MutableMapping):
-            keys = container.keys()
+        entry = next(opening[-1], None)
+        if entry is None:
+            opening.pop()
+            if path:
+                path.pop()
+            continue
+        k, value = entry
+        if isinstance(value, (MutableMapping, MutableSequence)):
+            path.append(k)
+            opening.append(_iter_entries(value))
+        else:
+            new_value = flag_string(value)
+            if new_value is not value:
+                yield (*path, k), new_value
+
+
+def _iter_entries(container):
+    if isinstance(container, MutableMapping):
+        return iter(container.items())
+    return enumerate(container)
+
+
+def _copy_on_write(container: T) -> T:
+    result = None
+    if isinstance(container, MutableMapping):
+        entries = container.items()
+    else:
+        entries = enumerate(container)
+
+    for k, value in entries:
+        if isinstance(value, (MutableMapping, MutableSequence)):
+            new_value = _copy_on_write(value)
         else:
-            keys = range(len(container))
-
-        for k in keys:
-            if isinstance(container[k], (MutableMapping, MutableSequence)):
-                opening.append(container[k])
-            else:
-                container[k] = flag_string(container[k])
-    return result
+            new_value = flag_string(value)
+        if new_value is not value:
+            if result is None:
+                result = copy(container)
+            result[k] = new_value
+    return container if result is None else result
@@ -1,34 +1,86 @@
-from typing import Any
+import builtins
+import re
+from typing import Any, Callable, Dict, Optional
 
 from . import boolean
+from ..typing import UnProcType
+
+FLAG_PATTERN = re.compile(r"!([^:]*):(.*)", re.DOTALL)
+"""
+The pattern of flagged strings, ``!type_name:real_value``.
+"""
+
+_flag_types: Dict[str, Callable[[Any], Any]] = {
+    name: obj for name, obj in vars(builtins).items() if type(obj) is type
+}
+_flag_types["bool"] = boolean
+
+
+def register_flag_type(typ: UnProcType, name: Optional[str] = None) -> None:
+    """
+    Register a type or a converter which can be used in flagged strings.
+
+    The type is processed by `auto_process_typ` once here, so ``bool`` is converted
+    using the boolean converter. The builtin types (like ``int``, ``float`` and ``str``)
+    are registered by default. Configuration structures (BaseConfig subclasses, and list
+    or dictionary specifications) can't be converted from strings, and are rejected.
+
+    :param typ: The type specification or converter to register
+    :param name: The name used in flagged strings, defaults to the ``__name__`` of typ
+    :raises ValueError: If the name is not given and typ has no ``__name__``
+    :raises TypeError: If typ is a configuration structure
+    """
+    from . import auto_process_typ
+    from .. import ConfigStructure  # lazy import
+
+    if isinstance(typ, (list, dict)) or (isinstance(typ, type) and issubclass(typ, ConfigStructure)):
+        raise TypeError(f"{typ} is a configuration structure, which can't be converted from a flagged string")
+    if name is None:
+        name = getattr(typ, "__name__", None)
+        if name is None:
+            raise ValueError(f"the name of {typ} must be given")
+    _flag_types[name] = auto_process_typ(typ)
+
+
+def get_flag_type(name: str) -> Callable[[Any], Any]:
+    """
+    Get the converter registered with the name.
+
+    :param name: The name used in flagged strings
+    :return: The converter
+    :raises TypeError: If no type is registered with the name
+    """
+    try:
+        return _flag_types[name]
+    except KeyError:
+        raise TypeError(f"{name} is not a type") from None
 
 
 def flag_string(value: str) -> Any:
     """
     Process a string value that may contain type information.
-    
+
     This function allows type conversion from string representations using a special
     syntax. If the string starts with '!', it is parsed as a type conversion request.
-    
+    The type name is looked up in the registered flag types (see :func:`register_flag_type`),
+    and is never evaluated.
+
     Format: !type_name:real_value
-    
+
     Examples:
       - "regular string" -> unchanged
       - "!int:42" -> 42 (as int)
       - "!bool:true" -> True (using boolean converter)
-    
+
     :param value: The value to process
     :return: The original value if not a flagged string, otherwise the converted value
-    :raises TypeError: If the specified type name is not a valid type
+    :raises TypeError: If the specified type name is not a registered type
+    :raises ValueError: If the flagged string has no real value part
     """
-    if not isinstance(value, str):
+    if not isinstance(value, str) or not value.startswith("!"):
         return value
-    if value.startswith("!"):
-        type_name, real_val = value[1:].split(":", maxsplit=1)
-        cls = eval(type_name)
-        if type(cls) is not type:
-            raise TypeError(f"{type_name} is not a type")
-        if cls is bool:
-            return boolean(real_val)
-        return cls(real_val)
-    return value
+    match = FLAG_PATTERN.fullmatch(value)
+    if match is None:
+        raise ValueError(f"unexpected flagged string: {value}, expected format: !type_name:real_value")
+    type_name, real_val = match.groups()
+    return get_flag_type(type_name)(real_val)
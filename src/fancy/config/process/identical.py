@@ -1,6 +1,9 @@
 from typing import Any
 
+from .scalar import scalar
 
+
+@scalar
 def identical(val: Any) -> Any:
     """
     Return the input value unchanged.
@@ -0,0 +1,118 @@
+"""
+Functions for processing numeric sequences into compact arrays.
+
+Numeric sequences are converted in a single step into an :class:`array.array`, or into a
+NumPy array when requested, instead of being loaded element by element as a
+ConfigListStructure of boxed Python numbers.
+"""
+
+import operator
+import sys
+from array import array
+from typing import Any, Callable, Union
+
+from .scalar import scalar
+
+TYPECODES = {
+    float: "d",
+    int: "q",
+}
+"""
+The typecodes of :class:`array.array` used for the element types.
+"""
+
+NUMERIC_TYPECODES = frozenset("bBhHiIlLqQfd")
+"""
+The typecodes of :class:`array.array` which can be used, the unicode ones are not numeric.
+"""
+
+_FLOAT_TYPECODES = "fd"
+
+ElementType = Union[type, str]
+
+
+def numeric_array(element_type: ElementType = float, use_numpy: bool = False) -> Callable[[Any], Any]:
+    """
+    Create a converter that converts a sequence of numbers into a compact array.
+
+    Example usage:
+    ```python
+    class ModelConfig(BaseConfig):
+        weights = Option(type=numeric_array(float))
+        buckets = Option(type=numeric_array(int, use_numpy=True))
+    ```
+
+    The converted array is always a new one, even if the value is already an array of the
+    element type. Integer arrays only accept integral numbers, so floats like ``1.5`` are
+    rejected instead of being truncated.
+
+    :param element_type: ``float``, ``int`` or a numeric typecode of :class:`array.array` (like ``"f"``)
+    :param use_numpy: If true, convert into a NumPy array instead of an :class:`array.array`
+    :return: A function that converts a sequence of numbers into an array
+    :raises ValueError: If the element type is not supported
+    :raises ImportError: If use_numpy is true but NumPy is not installed
+    """
+    if isinstance(element_type, str) and element_type in NUMERIC_TYPECODES:
+        typecode = element_type
+    elif element_type in TYPECODES:
+        typecode = TYPECODES[element_type]
+    else:
+        raise ValueError(f"unsupported element type: {element_type}, expected float, int or a numeric typecode")
+    convert = float if typecode in _FLOAT_TYPECODES else _to_integer
+
+    if use_numpy:
+        import numpy
+        dtype = numpy.dtype(typecode)
+
+        @scalar
+        def _to_ndarray(value: Any):
+            _check_sequence(value)
+            source = numpy.asarray(value)
+            if source.dtype.kind in "iub" or (source.dtype.kind == "f" and convert is float):
+                return source.astype(dtype)  # always a copy
+            if source.dtype.kind == "f" and numpy.array_equal(source, numpy.trunc(source)):
+                return source.astype(dtype)
+            return numpy.fromiter(map(convert, value), dtype=dtype, count=len(value))
+
+        return _to_ndarray
+
+    @scalar
+    def _to_array(value: Any) -> array:
+        _check_sequence(value)
+        try:  # copies the arrays too
+            return array(typecode, value)
+        except TypeError:  # e.g. numbers represented in strings, or integral floats
+            return array(typecode, map(convert, value))
+
+    return _to_array
+
+
+def _check_sequence(value: Any) -> None:
+    # strings would be split into characters, and bytes would be read as the raw memory of the numbers
+    if isinstance(value, (str, bytes, bytearray)):
+        raise TypeError(f"expected a sequence of numbers, not {type(value).__name__}")
+
+
+def _to_integer(value: Any) -> int:
+    if isinstance(value, str):
+        return int(value)
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{value} is not an integer")
+        return int(value)
+    return operator.index(value)
+
+
+def is_numeric_array(value: Any) -> bool:
+    """
+    Check if a value is an array produced by :func:`numeric_array`.
+
+    NumPy is never imported by this function.
+
+    :param value: The value to check
+    :return: True if the value is an :class:`array.array` or a NumPy array, False otherwise
+    """
+    if isinstance(value, array):
+        return True
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
@@ -0,0 +1,49 @@
+"""
+Utilities for marking processors which never produce configuration structures.
+
+Values converted by scalar processors don't need to be checked for, or loaded as,
+ConfigStructures, which allows collections of them to be converted in bulk.
+"""
+
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[[Any], Any])
+
+SCALAR_ATTRIBUTE = "_is_scalar_processor"
+"""
+The attribute which marks a processor as scalar.
+"""
+
+
+def scalar(processor: F) -> F:
+    """
+    Mark a processor as scalar, i.e., it never returns a ConfigStructure.
+
+    Example usage:
+    ```python
+    @scalar
+    def path_converter(value):
+        return Path(value)
+    ```
+
+    :param processor: The processor to mark
+    :return: The same processor
+    """
+    setattr(processor, SCALAR_ATTRIBUTE, True)
+    return processor
+
+
+def is_scalar(processor: Callable[[Any], Any]) -> bool:
+    """
+    Check if a processor never returns a ConfigStructure.
+
+    A processor is scalar if it is marked by :func:`scalar`, or it is a type
+    which is not a subclass of ConfigStructure (like ``int`` or ``str``).
+
+    :param processor: The processor to check
+    :return: True if the processor is scalar, False otherwise
+    """
+    from .. import ConfigStructure  # lazy import
+    if isinstance(processor, type):
+        return not issubclass(processor, ConfigStructure)
+    return getattr(processor, SCALAR_ATTRIBUTE, False) is True
@@ -0,0 +1,139 @@
+import threading
+import time
+import warnings
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, TypeVar
+
+from . import dependencies
+from .lazy import Lazy
+
+if TYPE_CHECKING:
+    from . import BaseConfig
+
+GV = TypeVar("GV")
+
+EXPIRES_ATTRIBUTE = "_lazy_expires"
+"""
+The attribute of instances which stores when their timed lazy values expire.
+"""
+
+RefreshErrorHook = Callable[["BaseConfig", Exception], None]
+
+
+def warn_refresh_error(instance: "BaseConfig", error: Exception) -> None:
+    """
+    The default hook for refresh failures, which issues a RuntimeWarning.
+
+    :param instance: The instance whose value failed to refresh
+    :param error: The exception raised by the refresh
+    """
+    warnings.warn(f"{type(instance).__name__}: failed to refresh a lazy value: {error!r}", RuntimeWarning)
+
+
+class TimedLazy(Lazy[GV]):
+    """
+    A lazy value which is refreshed in the background once it is older than a TTL.
+
+    The first access computes the value like a thread-safe :class:`Lazy`. After that,
+    accesses always return the cached value immediately; an access after the value has
+    expired starts a single background refresh per instance (stale-while-revalidate).
+    If the refresh fails, the last good value is kept for another TTL, and the failure
+    is reported to ``on_refresh_error``.
+
+    Example usage:
+    ```python
+    class InventoryConfig(BaseConfig):
+        inventory_path = Option(type=str)
+
+        # re-read at most every 30 seconds, without blocking the readers
+        hosts = TimedLazy[list](lambda c: read_hosts(c.inventory_path), ttl=30)
+    ```
+    """
+    ttl: float
+    on_refresh_error: RefreshErrorHook
+    _executor: Optional[Executor]
+    _refreshing: Set[int]
+    _refreshing_lock: threading.Lock
+
+    def __init__(
+        self,
+        fn: Callable[[Any], GV],
+        ttl: float,
+        on_refresh_error: Optional[RefreshErrorHook] = None,
+        executor: Optional[Executor] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        hidden: bool = False,
+    ):
+        """
+        Initialize the timed lazy value with a function to compute it.
+
+        :param fn: A function that computes the value when needed. Takes the config instance as its argument.
+        :param ttl: The seconds after which the value is refreshed
+        :param on_refresh_error: A function called with the instance and the exception when a refresh fails,
+                                 defaults to :func:`warn_refresh_error`
+        :param executor: The executor to refresh values in, defaults to a daemon thread per refresh
+        :param name: Optional custom name for the lazy value (defaults to attribute name)
+        :param description: Optional description of the lazy value
+        :param hidden: Whether the lazy value should be hidden from to_dict output
+        :raises ValueError: If ttl is not positive
+        """
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        super().__init__(fn, name, description, hidden, thread_safe=True)
+        self.ttl = ttl
+        self.on_refresh_error = warn_refresh_error if on_refresh_error is None else on_refresh_error
+        self._executor = executor
+        self._refreshing = set()
+        self._refreshing_lock = threading.Lock()
+
+    def __get__(self, instance: Optional["BaseConfig"], owner):
+        """
+        Get the value of this lazy attribute, and refresh it in the background if it has expired.
+
+        :param instance: The instance on which the lazy value is accessed
+        :param owner: The class that owns this lazy value
+        :return: The cached value or the TimedLazy object itself
+        """
+        value = super().__get__(instance, owner)
+        if instance is not None and time.monotonic() >= self._get_expires(instance).get(self.__name__, 0.0):
+            self._start_refresh(instance)
+        return value
+
+    def _compute(self, instance: "BaseConfig") -> GV:
+        value = super()._compute(instance)
+        self._get_expires(instance)[self.__name__] = time.monotonic() + self.ttl
+        return value
+
+    def _start_refresh(self, instance: "BaseConfig") -> None:
+        key = id(instance)
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        if self._executor is None:
+            threading.Thread(target=self._refresh, args=(instance,), daemon=True).start()
+        else:
+            self._executor.submit(self._refresh, instance)
+
+    def _refresh(self, instance: "BaseConfig") -> None:
+        generation = dependencies.generation(instance)
+        try:
+            value = self._compute(instance)
+        except Exception as e:
+            self._get_expires(instance)[self.__name__] = time.monotonic() + self.ttl
+            self.on_refresh_error(instance, e)
+        else:
+            if dependencies.generation(instance) != generation:
+                return  # computed from old values, the invalidated value is computed again on access
+            values = vars(instance)
+            values[self.__name__] = value
+            if dependencies.DEPENDENTS_ATTRIBUTE in values:
+                dependencies.invalidate(instance, self.__name__)
+        finally:
+            with self._refreshing_lock:
+                self._refreshing.discard(id(instance))
+
+    @staticmethod
+    def _get_expires(instance: "BaseConfig") -> Dict[str, float]:
+        return vars(instance).setdefault(EXPIRES_ATTRIBUTE, {})
@@ -0,0 +1,115 @@
+"""
+Utilities for compiling type annotations of options into type specifications.
+
+Supported annotations are types and callables, ``Any``, ``Optional[T]`` (and ``T | None``),
+``List[T]``/``Sequence[T]``, ``Dict[K, V]``/``Mapping[K, V]`` and ``Annotated[T, ...]``,
+which are translated to the type specifications understood by `auto_process_typ`.
+"""
+
+import collections.abc
+import sys
+import types
+import typing
+from typing import Any, Callable, Tuple
+
+from ..typing import UnProcType
+
+MISSING = object()
+"""
+Returned by :func:`get_annotation` when the attribute is not annotated.
+"""
+
+_LIST_ORIGINS = (list, collections.abc.Sequence, collections.abc.MutableSequence)
+_DICT_ORIGINS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+_UNION_ORIGINS = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+
+def get_annotation(owner: type, name: str) -> Any:
+    """
+    Get the evaluated annotation of an attribute defined in a class.
+
+    String annotations and forward references are evaluated in the namespace of the
+    module and the class, where the class itself is also available by its name.
+    Only the annotation of the attribute is evaluated, not the other annotations of the class.
+
+    :param owner: The class which defines the attribute
+    :param name: The name of the attribute
+    :return: The evaluated annotation, or :data:`MISSING` if the attribute is not annotated
+    :raises NameError: If a forward reference can't be resolved yet
+    """
+    annotations = owner.__dict__.get("__annotations__")
+    if annotations is None:
+        annotations = getattr(owner, "__annotations__", {})
+    if name not in annotations:
+        return MISSING
+    annotation = annotations[name]
+    if not _has_forward_reference(annotation):
+        return annotation
+    module = sys.modules.get(owner.__module__)
+    globalns = dict(vars(module)) if module is not None else {}
+    localns = dict(vars(owner))
+    localns.setdefault(owner.__name__, owner)
+    # a class holding only this annotation, so that the other ones are not evaluated
+    holder = type(owner.__name__, (), {"__annotations__": {name: annotation}})
+    hints = typing.get_type_hints(holder, globalns=globalns, localns=localns, include_extras=True)
+    return hints[name]
+
+
+def typ_from_annotation(annotation: Any) -> Tuple[UnProcType, bool]:
+    """
+    Translate an annotation to a type specification.
+
+    :param annotation: An evaluated annotation
+    :return: The type specification and whether the annotation is nullable
+    :raises TypeError: If the annotation is not supported
+    """
+    from ..process import identical, auto_process_typ  # lazy import
+
+    if annotation is Any or annotation is object:
+        return identical, False
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return typ_from_annotation(args[0])
+    if origin in _UNION_ORIGINS:
+        non_none_args = [arg for arg in args if arg is not type(None)]
+        if len(non_none_args) != 1:
+            raise TypeError(f"unsupported annotation: {annotation}, only Optional unions are supported")
+        typ, _ = typ_from_annotation(non_none_args[0])
+        return typ, len(non_none_args) < len(args)
+    if origin in _LIST_ORIGINS:
+        return [_nested_typ(args[0] if args else Any)], False
+    if origin in _DICT_ORIGINS:
+        key, value = args if args else (Any, Any)
+        return {_nested_typ(key): _nested_typ(value)}, False
+    if origin is not None:
+        raise TypeError(f"unsupported annotation: {annotation}")
+    if annotation is None or annotation is type(None):
+        raise TypeError("an option can't be annotated with None")
+    if callable(annotation):
+        auto_process_typ(annotation)  # validate the type
+        return annotation, False
+    raise TypeError(f"unsupported annotation: {annotation}")
+
+
+def _nested_typ(annotation: Any) -> UnProcType:
+    typ, nullable = typ_from_annotation(annotation)
+    if not nullable:
+        return typ
+    from ..process import auto_process_typ  # lazy import
+    return _optional(auto_process_typ(typ))
+
+
+def _optional(processor: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    from ..process import scalar, is_scalar  # lazy import
+
+    def _inner(value):
+        return None if value is None else processor(value)
+    return scalar(_inner) if is_scalar(processor) else _inner
+
+
+def _has_forward_reference(annotation: Any) -> bool:
+    if isinstance(annotation, (str, typing.ForwardRef)):
+        return True
+    return any(_has_forward_reference(arg) for arg in typing.get_args(annotation))
@@ -0,0 +1,46 @@
+"""
+Utilities for converting configuration values into hashable keys.
+"""
+
+from array import array
+from typing import Any, Hashable
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Convert a value into a hashable value which is equal for equal values.
+
+    Frozen configs are hashable themselves, other configs are converted into their class and
+    the values of their options, without the lazy values, which are not computed. Mappings are
+    converted into frozensets of their items, sequences into tuples and sets into frozensets, recursively.
+
+    :param value: The value to convert
+    :return: A hashable representation of the value
+    :raises TypeError: If the value or a value it contains is not hashable
+    """
+    from .. import BaseConfig  # lazy import
+
+    if isinstance(value, BaseConfig):
+        if value.frozen:
+            return value
+        return type(value), tuple(_freeze_option(value, name) for name in value.get_all_options())
+    if isinstance(value, dict):
+        return frozenset((freeze(k), freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    if isinstance(value, array):
+        return value.typecode, value.tobytes()
+    hash(value)
+    return value
+
+
+_UNASSIGNED = object()
+
+
+def _freeze_option(config: Any, name: str) -> Hashable:
+    try:
+        return freeze(getattr(config, name))
+    except AttributeError:  # unassigned option without default
+        return _UNASSIGNED
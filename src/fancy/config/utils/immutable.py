@@ -0,0 +1,30 @@
+"""
+Utilities for detecting values which can be safely shared between configurations.
+"""
+
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from pathlib import PurePath
+from typing import Any
+
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, range, Decimal, Fraction, PurePath, Enum)
+"""
+The types whose instances are immutable.
+"""
+
+
+def is_immutable(value: Any) -> bool:
+    """
+    Check if a value is immutable, including all the values it contains.
+
+    Tuples and frozensets are immutable if all of their items are immutable.
+
+    :param value: The value to check
+    :return: True if the value can be shared without being copied, False otherwise
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable(item) for item in value)
+    return False
@@ -0,0 +1,210 @@
+"""
+A registry of classes, looked up by their names with suffix and case rules.
+"""
+
+import warnings
+import weakref
+from types import MappingProxyType
+from typing import Callable, Dict, Generic, Iterable, List, Mapping, Optional, Tuple, Type, TypeVar
+
+from ..exc import AmbiguousClassNameError, ClassNotFoundException
+
+T = TypeVar("T")
+
+Normalize = Callable[[str], str]
+
+ALIAS, BASE_NAME, NORMALIZED_NAME, CLASS_NAME = range(4)
+"""
+The priorities of the names, the lower one wins.
+"""
+
+
+def capitalize_first(name: str) -> str:
+    """
+    Capitalize the first letter of a name, e.g. ``fooBar`` to ``FooBar``.
+
+    :param name: The name to normalize
+    :return: The name with the first letter capitalized
+    """
+    return name[:1].capitalize() + name[1:]
+
+
+class _Table:
+    """
+    The names of the registered classes for a suffix.
+    """
+    exact: Dict[str, List[Tuple[int, "weakref.ref"]]]
+    normalized: Dict[str, List[Tuple[int, "weakref.ref"]]]
+
+    def __init__(self):
+        self.exact = {}
+        self.normalized = {}
+
+    def add(self, cls: type, exact: List[Tuple[str, int]], normalized: List[Tuple[str, int]]) -> None:
+        """
+        Add the names of a class, which are removed when the class is garbage collected.
+
+        :param cls: The class
+        :param exact: The names and their priorities
+        :param normalized: The normalized names and their priorities
+        """
+        def remove(ref: "weakref.ref") -> None:
+            _remove(self.exact, exact, ref)
+            _remove(self.normalized, normalized, ref)
+
+        ref = weakref.ref(cls, remove)
+        for name, priority in exact:
+            self.exact.setdefault(name, []).append((priority, ref))
+        for name, priority in normalized:
+            self.normalized.setdefault(name, []).append((priority, ref))
+
+
+def _remove(table: Dict[str, List[Tuple[int, "weakref.ref"]]], names: List[Tuple[str, int]], ref: "weakref.ref") -> None:
+    for name, _ in names:
+        entries = table.get(name)
+        if entries is None:
+            continue
+        # replaced rather than modified, the lookups may be iterating over the old list
+        remaining = [entry for entry in entries if entry[1] is not ref]
+        if remaining:
+            table[name] = remaining
+        else:
+            del table[name]
+
+
+class ClassRegistry(Generic[T]):
+    """
+    A registry of classes, which are usually registered in ``__init_subclass__``.
+
+    A class is found by (in order of priority):
+
+    - one of its aliases,
+    - its name without the suffix, e.g. ``Yaml`` for ``YamlConfigLoader``,
+    - a name which is normalized into its name without the suffix, e.g. ``yaml``,
+    - its class name, or its qualified name like ``package.module.DbConfig``.
+
+    Lookups are dictionary lookups; the names for a suffix are computed once and updated
+    when a class is registered. Classes are held weakly, so classes which are not used
+    anymore (like the ones defined in functions) disappear from the registry.
+    """
+    _normalize: Normalize
+    _classes: "weakref.WeakKeyDictionary[Type[T], Tuple[str, ...]]"
+    _tables: Dict[str, _Table]
+
+    def __init__(self, normalize: Normalize):
+        """
+        Initialize an empty registry.
+
+        :param normalize: An idempotent function, like ``str.capitalize``; a class is found by
+                          a name if the normalized name is its name without the suffix
+        """
+        self._normalize = normalize
+        self._classes = weakref.WeakKeyDictionary()
+        self._tables = {}
+
+    def register(self, cls: Type[T], aliases: Iterable[str] = ()) -> None:
+        """
+        Register a class, replacing the aliases if it is already registered.
+
+        :param cls: The class to register
+        :param aliases: The other names of the class
+        """
+        aliases = tuple(aliases)
+        if cls in self._classes:
+            self._classes[cls] = aliases
+            self._tables.clear()
+            return
+        self._classes[cls] = aliases
+        for suffix, table in self._tables.items():
+            self._add(table, suffix, cls, aliases)
+
+    def lookup(self, name: str, suffix: str) -> Type[T]:
+        """
+        Find a class by name.
+
+        :param name: The name of the class
+        :param suffix: The suffix which may be omitted from the name
+        :return: The class
+        :raises ClassNotFoundException: If no class is registered with the name
+        :raises AmbiguousClassNameError: If several classes have the name with the same priority
+        """
+        table = self._get_table(suffix)
+        candidates = table.exact.get(name, []) + table.normalized.get(self._normalize(name), [])
+        best = None
+        found = []
+        for priority, ref in candidates:
+            cls = ref()
+            if cls is None or (best is not None and priority > best):
+                continue
+            if best is None or priority < best:
+                best, found = priority, []
+            if cls not in found:
+                found.append(cls)
+        if not found:
+            raise ClassNotFoundException(name)
+        if len(found) > 1:
+            raise AmbiguousClassNameError(name, found)
+        return found[0]
+
+    def get_all(self) -> Dict[str, Type[T]]:
+        """
+        Get all the registered classes by their qualified names.
+
+        :return: A dictionary mapping ``module.QualifiedName`` to the classes
+        """
+        return {f"{cls.__module__}.{cls.__qualname__}": cls for cls in list(self._classes.keys())}
+
+    def _get_table(self, suffix: str) -> _Table:
+        table = self._tables.get(suffix)
+        if table is None:
+            table = self._tables[suffix] = _Table()
+            for cls, aliases in list(self._classes.items()):
+                self._add(table, suffix, cls, aliases)
+        return table
+
+    def _add(self, table: _Table, suffix: str, cls: Type[T], aliases: Tuple[str, ...]) -> None:
+        name = cls.__name__
+        exact = [(alias, ALIAS) for alias in aliases]
+        normalized = []
+        if suffix and name.endswith(suffix) and len(name) > len(suffix):
+            base_name = name[:-len(suffix)]
+            exact.append((base_name, BASE_NAME))
+            if self._normalize(base_name) == base_name:  # otherwise no name is normalized into it
+                normalized.append((base_name, NORMALIZED_NAME))
+        exact.append((name, CLASS_NAME))
+        exact.append((f"{cls.__module__}.{cls.__qualname__}", CLASS_NAME))
+        table.add(cls, exact, normalized)
+
+
+class RegisteredClasses:
+    """
+    A read-only class attribute with the classes of a registry by their names, for the
+    attributes which were replaced by registries, like ``ConfigFactory.configs``.
+
+    Reading it emits a :class:`DeprecationWarning`.
+    """
+    _registry: ClassRegistry
+    _replacement: str
+    _name: str
+
+    def __init__(self, registry: ClassRegistry, replacement: str):
+        """
+        :param registry: The registry of the classes
+        :param replacement: What to use instead, for the warning
+        """
+        self._registry = registry
+        self._replacement = replacement
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = f"{owner.__name__}.{name}"
+
+    def __get__(self, instance: Optional[object], owner: type) -> Mapping[str, type]:
+        warnings.warn(
+            f"'{self._name}' is deprecated and will be removed in 1.0.0, use {self._replacement} instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return MappingProxyType({cls.__name__: cls for cls in self._registry.get_all().values()})
+
+    def __set__(self, instance: object, value: object) -> None:
+        raise AttributeError(f"'{self._name}' is read-only")
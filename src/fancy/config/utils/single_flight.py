@@ -0,0 +1,81 @@
+"""
+Utilities for running a computation at most once at a time for each key.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """
+    A computation in flight, which the other callers with the same key wait for.
+    """
+    __slots__ = ("thread", "done", "value", "error")
+
+    def __init__(self):
+        self.thread = threading.get_ident()
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent computations with the same key.
+
+    The first caller with a key runs the computation, and the other callers with the
+    same key wait for it and get its result or its exception. Once the computation
+    finishes, the next caller with the key starts a new one, so the result should be
+    cached by the computation itself.
+
+    Example usage:
+    ```python
+    flight = SingleFlight()
+    value = flight.do(key, compute, arg)
+    ```
+    """
+    _lock: threading.Lock
+    _calls: Dict[Hashable, _Call]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run fn(*args), or wait for the computation with the same key in flight.
+
+        :param key: The key of the computation
+        :param fn: The computation
+        :param args: The arguments of fn
+        :return: The result of the computation
+        :raises RuntimeError: If the computation requires its own result in the same thread
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            if call.thread == threading.get_ident():
+                raise RuntimeError(f"the computation of {key!r} requires its own result")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn(*args)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,54 @@
+"""
+Utilities for traversing configuration trees.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterator, Tuple
+
+if TYPE_CHECKING:
+    from .. import BaseConfig, ConfigStructure
+
+
+def iter_configs(structure: "ConfigStructure") -> Iterator[Tuple[str, "BaseConfig"]]:
+    """
+    Iterate over the configs of a configuration tree in depth-first pre-order.
+
+    The tree is traversed through the assigned options and placeholders, and the lists
+    and dictionaries of sub-configs. Lazy values are not computed, and each config is
+    visited once even if it is referenced more than once.
+
+    :param structure: The root of the configuration tree
+    :return: An iterator of (path, config) pairs, where a path is like ``servers[0].db``
+             and the path of the root is an empty string
+    """
+    from .. import BaseConfig, ConfigStructure, Lazy  # lazy import
+
+    stack = [("", structure)]
+    visited = set()
+    while stack:
+        path, value = stack.pop()
+        if id(value) in visited:
+            continue
+        visited.add(id(value))
+        if isinstance(value, BaseConfig):
+            yield path, value
+            children = [
+                (join_path(path, placeholder.name), getattr(value, placeholder.__name__))
+                for placeholder in value.get_all_placeholders().values()
+                if not isinstance(placeholder, Lazy) and placeholder.is_assigned(value)
+            ]
+        elif isinstance(value, dict):
+            children = [(f"{path}[{key}]", item) for key, item in value.items()]
+        else:
+            children = [(f"{path}[{index}]", item) for index, item in enumerate(value)]
+        stack.extend(child for child in reversed(children) if isinstance(child[1], ConfigStructure))
+
+
+def join_path(path: str, name: Any) -> str:
+    """
+    Append the name of an attribute to a path.
+
+    :param path: The path of a config, an empty string for the root
+    :param name: The name of an attribute of the config
+    :return: The path of the attribute
+    """
+    return f"{path}.{name}" if path else str(name)
@@ -3,10 +3,16 @@ This module contains visitors for processing configuration values.
 
 Key components:
 - ToCollectionVisitor: Visitor for converting configuration structures to collections
+- ReprVisitor: Visitor for rendering configuration structures into bounded-length strings
+- FingerprintVisitor: Visitor for computing stable digests of configuration structures
 """
 
 __all__ = [
     "ToCollectionVisitor",
+    "ReprVisitor",
+    "FingerprintVisitor",
 ]
 
 from .to_collection_visitor import ToCollectionVisitor
+from .repr_visitor import ReprVisitor
+from .fingerprint_visitor import FingerprintVisitor
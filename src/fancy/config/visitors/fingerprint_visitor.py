@@ -0,0 +1,169 @@
+"""
+Provides stable content digests of config structures.
+
+A fingerprint is a BLAKE2b digest of a canonical encoding of the visible values of a
+structure, the same ones as in ``to_dict()``, except the lazy values. It doesn't depend
+on the order of the placeholders or of the items of mappings and sets, nor on the
+process, so it can be stored, e.g. to key on-disk caches of artifacts built from a config.
+
+The digest of each config is cached in the config, and computed as a tracked computation
+(see :mod:`fancy.config.dependencies`): setting or deleting a placeholder which was read,
+or modifying a list or dictionary structure, removes the cached digests of the config and
+of all the configs containing it.
+"""
+
+import hashlib
+from array import array
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from pathlib import PurePath
+from typing import Any, List, TYPE_CHECKING
+
+from .. import ConfigStructureVisitor, ConfigListStructure, ConfigDictStructure, ConfigStructure, Lazy, \
+    consts, dependencies
+
+if TYPE_CHECKING:
+    from .. import BaseConfig
+
+FINGERPRINT_ATTRIBUTE = "_fingerprint"
+"""
+The attribute of configs which caches their digests.
+"""
+
+DIGEST_SIZE = 32
+"""
+The size of the digests in bytes.
+"""
+
+
+class FingerprintVisitor(ConfigStructureVisitor):
+    """
+    Visitor for computing the digests of ConfigStructure objects.
+
+    Supported values are the configuration structures, None, booleans, numbers, strings,
+    bytes, paths, enums, dates and times, numeric arrays, and sequences, mappings and sets of them.
+    A reference to a config being visited (a cycle) is encoded by its distance in the path.
+    """
+
+    result: bytes
+    """
+    The encoding of the last visited structure.
+    """
+
+    _visiting: List["BaseConfig"]
+    """
+    The configs on the path to the visited structure.
+    """
+
+    def __init__(self):
+        """
+        Initialize a FingerprintVisitor.
+        """
+        self.result = b""
+        self._visiting = []
+
+    def visit_config(self, structure: "BaseConfig") -> None:
+        """
+        Visit a BaseConfig object and encode it by its digest, which is computed if not cached.
+
+        :param structure: The BaseConfig object to encode.
+        """
+        for distance, config in enumerate(reversed(self._visiting)):
+            if config is structure:
+                self.result = _pack(b"R", str(distance).encode())
+                return
+        values = vars(structure)
+        digest = values.get(FINGERPRINT_ATTRIBUTE)
+        if digest is None:
+            self._visiting.append(structure)
+            dependencies.begin(structure, FINGERPRINT_ATTRIBUTE)
+            try:
+                digest = _digest(b"".join(sorted(self._encode_placeholders(structure))))
+            finally:
+                dependencies.end()
+                self._visiting.pop()
+            values[FINGERPRINT_ATTRIBUTE] = digest
+        if dependencies.tracking:
+            dependencies.record(structure, FINGERPRINT_ATTRIBUTE)
+        self.result = _pack(b"C", digest)
+
+    def visit_config_list(self, structure: ConfigListStructure) -> None:
+        """
+        Visit a ConfigListStructure object and encode its items in order.
+
+        :param structure: The ConfigListStructure object to encode.
+        """
+        if dependencies.tracking:
+            dependencies.record(structure, dependencies.ITEMS)
+        self.result = _pack(b"L", b"".join(map(self._encode, structure)))
+
+    def visit_config_dict(self, structure: ConfigDictStructure) -> None:
+        """
+        Visit a ConfigDictStructure object and encode its items in a canonical order.
+
+        :param structure: The ConfigDictStructure object to encode.
+        """
+        if dependencies.tracking:
+            dependencies.record(structure, dependencies.ITEMS)
+        self.result = _pack(b"M", b"".join(sorted(self._encode(k) + self._encode(v) for k, v in structure.items())))
+
+    def get_result(self) -> bytes:
+        """
+        Get the digest of the visited structure.
+
+        :return: The digest, of :data:`DIGEST_SIZE` bytes.
+        """
+        if self.result[:1] == b"C":
+            return self.result[9:]
+        return _digest(self.result)
+
+    def _encode_placeholders(self, structure: "BaseConfig"):
+        for placeholder in structure.get_all_placeholders().values():
+            if isinstance(placeholder, Lazy) or \
+                    not placeholder.is_assigned(structure) or \
+                    placeholder.hidden or \
+                    placeholder.name == consts.IGNORED_NAME:
+                continue
+            yield _pack(b"K", placeholder.name.encode()) + self._encode(structure[placeholder.name])
+
+    def _encode(self, value: Any) -> bytes:
+        if isinstance(value, ConfigStructure):
+            value.accept(self)
+            return self.result
+        if value is None:
+            return b"N"
+        if isinstance(value, bool):
+            return b"T" if value else b"F"
+        if isinstance(value, Enum):
+            return _pack(b"E", _pack(b"S", type(value).__qualname__.encode()) + self._encode(value.value))
+        if isinstance(value, (int, float, complex, Decimal, Fraction)):
+            return _pack(b"I" if isinstance(value, int) else b"D", repr(value).encode())
+        if isinstance(value, str):
+            return _pack(b"S", value.encode())
+        if isinstance(value, (bytes, bytearray)):
+            return _pack(b"B", bytes(value))
+        if isinstance(value, PurePath):
+            return _pack(b"P", value.as_posix().encode())
+        if isinstance(value, (date, time, timedelta)):
+            return _pack(b"W", str(value).encode())
+        if isinstance(value, array):
+            return _pack(b"A", value.typecode.encode() + value.tobytes())
+        if isinstance(value, (list, tuple)):
+            return _pack(b"L", b"".join(map(self._encode, value)))
+        if isinstance(value, dict):
+            return _pack(b"M", b"".join(sorted(self._encode(k) + self._encode(v) for k, v in value.items())))
+        if isinstance(value, (set, frozenset)):
+            return _pack(b"U", b"".join(sorted(map(self._encode, value))))
+        if type(value).__module__ == "numpy" and hasattr(value, "tobytes"):
+            return _pack(b"A", value.dtype.str.encode() + value.tobytes())
+        raise TypeError(f"can't fingerprint a value of type {type(value).__qualname__}: {value!r}")
+
+
+def _pack(tag: bytes, payload: bytes) -> bytes:
+    return tag + len(payload).to_bytes(8, "little") + payload
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
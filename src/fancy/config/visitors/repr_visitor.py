@@ -0,0 +1,230 @@
+"""
+Provides a bounded-cost textual rendering of config structures.
+
+The rendering looks like ``str(config.to_dict())`` for small configs, but the amount of
+work is limited by a maximum depth, a maximum number of items per collection and a
+maximum total length, so that rendering a config with huge options stays cheap.
+"""
+
+from array import array
+from typing import Any, Callable, Collection, List, Mapping, Optional, Set, TYPE_CHECKING
+
+from .. import ConfigStructureVisitor, ConfigListStructure, ConfigDictStructure, ConfigStructure, PlaceHolder, Lazy, \
+    AsyncLazy, consts
+
+if TYPE_CHECKING:
+    from .. import BaseConfig
+
+DEFAULT_MAX_DEPTH = 4
+"""
+Default maximum nesting depth rendered by ``repr(config)``.
+"""
+
+DEFAULT_MAX_ITEMS = 16
+"""
+Default maximum number of items rendered per collection by ``repr(config)``.
+"""
+
+DEFAULT_MAX_LENGTH = 1024
+"""
+Default maximum length of ``repr(config)``.
+"""
+
+UNCOMPUTED_LAZY = "<lazy>"
+"""
+The text rendered for lazy values which have not been computed yet.
+"""
+
+ELLIPSIS = "..."
+
+
+class _LengthExceeded(Exception):
+    pass
+
+
+class ReprVisitor(ConfigStructureVisitor):
+    """
+    Visitor for rendering ConfigStructure objects into a bounded-length string.
+
+    Lazy values are never computed; the ones which have not been accessed yet are
+    rendered as ``<lazy>``. Circular references and structures deeper than ``max_depth``
+    are rendered as ``{...}`` or ``[...]``, and collections longer than ``max_items``
+    are cut with a ``...<N more>`` marker.
+    """
+
+    max_depth: Optional[int]
+    """
+    Maximum nesting depth to render, or None for no limit.
+    """
+
+    max_items: Optional[int]
+    """
+    Maximum number of items to render per collection, or None for no limit.
+    """
+
+    max_length: Optional[int]
+    """
+    Maximum length of the result, or None for no limit.
+    """
+
+    _parts: List[str]
+    _length: int
+    _depth: int
+    _visiting: Set[int]
+    _truncated: bool
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = DEFAULT_MAX_DEPTH,
+        max_items: Optional[int] = DEFAULT_MAX_ITEMS,
+        max_length: Optional[int] = DEFAULT_MAX_LENGTH,
+    ):
+        """
+        Initialize a ReprVisitor.
+
+        :param max_depth: Maximum nesting depth to render, or None for no limit.
+        :param max_items: Maximum number of items to render per collection, or None for no limit.
+        :param max_length: Maximum length of the result, or None for no limit.
+        """
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_length = max_length
+        self._parts = []
+        self._length = 0
+        self._depth = 0
+        self._visiting = set()
+        self._truncated = False
+
+    def render(self, structure: ConfigStructure) -> str:
+        """
+        Render a structure and return the result.
+
+        :param structure: The structure to render.
+        :return: The rendered string, at most ``max_length`` characters long.
+        """
+        try:
+            self._resolve_value(structure)
+        except _LengthExceeded:
+            self._truncated = True
+        return self.get_result()
+
+    def visit_config(self, structure: "BaseConfig") -> None:
+        """
+        Render a BaseConfig object like a dictionary.
+
+        :param structure: The BaseConfig object to render.
+        """
+        entries = (
+            (placeholder.name, self._get_value(structure, placeholder))
+            for placeholder in structure.get_all_placeholders().values()
+            if not placeholder.hidden
+            and placeholder.name != consts.IGNORED_NAME
+            and placeholder.is_assigned(structure)
+        )
+        self._render_entries("{", "}", entries, None, is_mapping=True)
+
+    def visit_config_list(self, structure: ConfigListStructure) -> None:
+        """
+        Render a ConfigListStructure object like a list.
+
+        :param structure: The ConfigListStructure object to render.
+        """
+        self._render_entries("[", "]", iter(structure), len(structure), is_mapping=False)
+
+    def visit_config_dict(self, structure: ConfigDictStructure) -> None:
+        """
+        Render a ConfigDictStructure object like a dictionary.
+
+        :param structure: The ConfigDictStructure object to render.
+        """
+        self._visit_mapping(structure)
+
+    def get_result(self) -> str:
+        """
+        Get the rendered string.
+
+        :return: The rendered string.
+        """
+        result = "".join(self._parts)
+        if self.max_length is not None and (self._truncated or len(result) > self.max_length):
+            result = result[:max(self.max_length - len(ELLIPSIS), 0)] + ELLIPSIS
+        return result
+
+    def _get_value(self, structure: "BaseConfig", placeholder: PlaceHolder) -> Any:
+        if isinstance(placeholder, Lazy) and not PlaceHolder.is_assigned(placeholder, structure):
+            return _Verbatim(UNCOMPUTED_LAZY)
+        if isinstance(placeholder, AsyncLazy):
+            return placeholder.get_computed(structure)
+        return getattr(structure, placeholder.__name__)
+
+    def _resolve_value(self, value: Any) -> None:
+        if isinstance(value, _Verbatim):
+            self._write(value.text)
+        elif isinstance(value, ConfigStructure):
+            self._enter(value, "[...]" if isinstance(value, list) else "{...}", lambda: value.accept(self))
+        elif isinstance(value, Mapping):
+            self._enter(value, "{...}", lambda: self._visit_mapping(value))
+        elif isinstance(value, (list, tuple, set, frozenset, array)):
+            self._enter(value, "[...]", lambda: self._visit_sequence(value))
+        elif isinstance(value, str) and self.max_length is not None and len(value) > self.max_length:
+            self._write(repr(value[:self.max_length]))
+            raise _LengthExceeded()
+        else:
+            self._write(repr(value))
+
+    def _enter(self, value: Any, placeholder: str, visit: Callable[[], None]) -> None:
+        if id(value) in self._visiting or (self.max_depth is not None and self._depth >= self.max_depth):
+            self._write(placeholder)
+            return
+        self._visiting.add(id(value))
+        self._depth += 1
+        try:
+            visit()
+        finally:
+            self._depth -= 1
+            self._visiting.discard(id(value))
+
+    def _visit_mapping(self, mapping: Mapping) -> None:
+        self._render_entries("{", "}", iter(mapping.items()), len(mapping), is_mapping=True)
+
+    def _visit_sequence(self, collection: Collection) -> None:
+        if isinstance(collection, tuple):
+            brackets = ("(", ",)" if len(collection) == 1 else ")")
+        elif isinstance(collection, (set, frozenset)):
+            brackets = ("{", "}")
+        else:
+            brackets = ("[", "]")
+        self._render_entries(*brackets, iter(collection), len(collection), is_mapping=False)
+
+    def _render_entries(self, opening: str, closing: str, entries, size: Optional[int], is_mapping: bool) -> None:
+        self._write(opening)
+        count = 0
+        for entry in entries:
+            if self.max_items is not None and count >= self.max_items:
+                self._write(", " + ELLIPSIS)
+                if size is not None:
+                    self._write(f"<{size - count} more>")
+                break
+            if count > 0:
+                self._write(", ")
+            if is_mapping:
+                key, value = entry
+                self._write(repr(key) + ": ")
+                self._resolve_value(value)
+            else:
+                self._resolve_value(entry)
+            count += 1
+        self._write(closing)
+
+    def _write(self, text: str) -> None:
+        self._parts.append(text)
+        self._length += len(text)
+        if self.max_length is not None and self._length > self.max_length:
+            raise _LengthExceeded()
+
+
+class _Verbatim:
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
@@ -7,7 +7,9 @@ into standard Python collections like dictionaries and lists.
 
 from typing import Collection, List, Optional, Mapping, Sequence, Any, Dict, TYPE_CHECKING, Callable
 
-from .. import ConfigStructureVisitor, ConfigListStructure, ConfigStructure, PlaceHolder, consts
+from .. import ConfigStructureVisitor, ConfigListStructure, ConfigDictStructure, ConfigStructure, PlaceHolder, \
+    AsyncLazy, consts
+from ..process.numeric_array import is_numeric_array
 
 if TYPE_CHECKING:
     from .. import BaseConfig
@@ -79,7 +81,13 @@ class ToCollectionVisitor(ConfigStructureVisitor):
                     placeholder.hidden or \
                     placeholder.name == consts.IGNORED_NAME:
                 continue
-            self._resolve_value(structure[placeholder.name])
+            if isinstance(placeholder, AsyncLazy):
+                # only the computed values, which don't need to be awaited
+                if not placeholder.is_computed(structure):
+                    continue
+                self._resolve_value(placeholder.get_computed(structure))
+            else:
+                self._resolve_value(structure[placeholder.name])
             result[placeholder.name] = self.result_stack.pop()
         self.result_stack[-1] = result
 
@@ -95,6 +103,18 @@ class ToCollectionVisitor(ConfigStructureVisitor):
             result.append(self.result_stack.pop())
         self.result_stack[-1] = result
 
+    def visit_config_dict(self, structure: ConfigDictStructure) -> None:
+        """
+        Visit a ConfigDictStructure object and convert it to a dictionary.
+
+        :param structure: The ConfigDictStructure object to convert.
+        """
+        result = {}
+        for key, value in structure.items():
+            self._resolve_value(value)
+            result[key] = self.result_stack.pop()
+        self.result_stack[-1] = result
+
     def get_result(self) -> Collection:
         """
         Get the final result of the conversion.
@@ -125,6 +145,8 @@ class ToCollectionVisitor(ConfigStructureVisitor):
                 self.visited[ref] = None
                 value.accept(self)
                 self.visited[ref] = self.result_stack[-1]
+            elif is_numeric_array(value):
+                self.result_stack.append(value.tolist())
             elif not isinstance(value, str) and isinstance(value, Collection):
                 self.result_stack.append(None)
                 self.visited[ref] = None
@@ -0,0 +1,132 @@
+import textwrap
+from typing import Annotated, Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple
+
+import pytest
+from fancy import config as cfg
+
+
+class DbConfig(cfg.BaseConfig):
+    host: str = cfg.Option(default="localhost")
+    port: int = cfg.Option(default=5432)
+
+
+class AppConfig(cfg.BaseConfig):
+    port: int = cfg.Option(default=80)
+    debug: bool = cfg.Option(default=False)
+    hosts: List[str] = cfg.Option(default=[])
+    matrix: list[list[int]] = cfg.Option(default=[])
+    limits: Dict[str, int] = cfg.Option(default={})
+    db: Optional[DbConfig] = cfg.Option()
+    replicas: Dict[str, DbConfig] = cfg.Option(default={})
+    backups: Sequence[Optional[DbConfig]] = cfg.Option(default=[])
+    weights: Mapping[str, Optional[float]] = cfg.Option(default={})
+    note: Annotated[str, "free text"] = cfg.Option(nullable=True)
+    extra: Any = cfg.Option(nullable=True)
+    explicit: str = cfg.Option(type=int, default=1)
+    untyped = cfg.Option(nullable=True)
+
+
+def test_annotated_options_are_converted():
+    config = AppConfig(
+        port="8080",
+        debug="yes",
+        hosts=[1, "b"],
+        matrix=[["1", 2]],
+        limits={"rps": "10"},
+        db={"port": "1"},
+        replicas={"a": {"host": "a.local"}, "b": {}},
+        backups=[None, {"host": "backup"}],
+        weights={"x": "0.5", "y": None},
+        extra=[1],
+        explicit="2",
+        untyped="3",
+    )
+    assert config.port == 8080
+    assert config.debug is True
+    assert config.hosts == ["1", "b"]
+    assert config.matrix == [[1, 2]]
+    assert isinstance(config.limits, cfg.ConfigDictStructure)
+    assert config.limits == {"rps": 10}
+    assert config.db.port == 1
+    assert isinstance(config.replicas["a"], DbConfig)
+    assert config.replicas["a"].host == "a.local"
+    assert config.backups[0] is None
+    assert config.backups[1].host == "backup"
+    assert config.weights == {"x": 0.5, "y": None}
+    assert config.explicit == 2
+    assert config.untyped == "3"
+    assert config.to_dict()["replicas"] == {
+        "a": {"host": "a.local", "port": 5432},
+        "b": {"host": "localhost", "port": 5432},
+    }
+
+
+def test_optional_annotation_makes_option_nullable():
+    config = AppConfig()
+    assert config.db is None
+    assert config.note is None
+    config.db = None
+    with pytest.raises(ValueError):
+        config.port = None
+
+
+def test_compiled_types_are_resolved_once():
+    option = AppConfig.__dict__["replicas"]
+    assert option.raw_type == {str: DbConfig}
+    assert AppConfig.__dict__["port"]._type is int
+    assert AppConfig.__dict__["untyped"]._type is cfg.identical
+
+
+def test_forward_references():
+    class Node(cfg.BaseConfig):
+        name: "str" = cfg.Option(required=True)
+        children: List["Node"] = cfg.Option(default=[])
+        parent: Optional["Node"] = cfg.Option()
+        leaf: Optional["LeafConfig"] = cfg.Option()
+
+    config = Node(name="root", children=[{"name": "a", "children": [{"name": "b"}]}], leaf={"value": "1"})
+    assert config.children[0].children[0].name == "b"
+    assert config.parent is None
+    assert config.leaf.value == 1
+
+
+class LeafConfig(cfg.BaseConfig):
+    value: int = cfg.Option()
+
+
+def test_unsupported_annotations_are_decorative():
+    class _Config(cfg.BaseConfig):
+        pair: Tuple[int, int] = cfg.Option(default=(1, 2))
+        mode: Literal["a", "b"] = cfg.Option(default="a")
+        either: int | str = cfg.Option(nullable=True)
+
+    config = _Config(pair=["3", "4"], either="5")
+    assert config.pair == ["3", "4"]
+    assert config.mode == "a"
+    assert config.either == "5"
+    assert _Config.__dict__["pair"]._type is cfg.identical
+
+    with pytest.raises(ValueError):
+        cfg.Option(type={str: int, int: str})
+
+
+def test_annotations_of_names_only_imported_when_type_checking():
+    namespace = {}
+    exec(textwrap.dedent("""
+        from __future__ import annotations
+        from typing import TYPE_CHECKING
+        from fancy import config as cfg
+
+        if TYPE_CHECKING:
+            from decimal import Decimal
+
+        class _Config(cfg.BaseConfig):
+            port: int = cfg.Option(default=80)
+            price: Decimal = cfg.Option(nullable=True)
+            note: str = cfg.Option(nullable=True)
+    """), namespace)
+
+    config = namespace["_Config"](port="8080", price="1.5", note=1)
+    assert config.port == 8080
+    assert config.price == "1.5"
+    assert config.note == "1"
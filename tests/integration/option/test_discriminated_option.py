@@ -0,0 +1,67 @@
+import pytest
+
+from fancy import config as cfg
+
+
+class StorageConfig(cfg.BaseConfig):
+    kind = cfg.Option(type=str, required=True)
+
+
+class S3StorageConfig(StorageConfig):
+    bucket = cfg.Option(type=str, required=True)
+
+
+class LocalStorageConfig(StorageConfig):
+    root = cfg.Option(type=str, default="/var/data")
+
+
+STORAGES = {"s3": S3StorageConfig, "local": LocalStorageConfig}
+
+
+class AppConfig(cfg.BaseConfig):
+    storage = cfg.Option(type=cfg.discriminated(STORAGES), nullable=True)
+    backups = cfg.Option(type=[cfg.discriminated(STORAGES)], default=[])
+
+
+def test_selects_class_by_field():
+    config = AppConfig({"storage": {"kind": "s3", "bucket": "logs"}})
+    assert type(config.storage) is S3StorageConfig
+    assert config.storage.bucket == "logs"
+    assert config.to_dict()["storage"] == {"kind": "s3", "bucket": "logs"}
+
+
+def test_heterogeneous_list():
+    raw = [{"kind": "s3", "bucket": f"b{i}"} if i % 2 else {"kind": "local"} for i in range(1000)]
+    config = AppConfig({"backups": raw})
+    assert [type(backup) for backup in config.backups[:2]] == [LocalStorageConfig, S3StorageConfig]
+    assert config.backups[999].bucket == "b999"
+    assert config.to_dict()["backups"][0] == {"kind": "local", "root": "/var/data"}
+
+
+def test_assign_instance():
+    config = AppConfig({})
+    storage = LocalStorageConfig(kind="local")
+    config.storage = storage
+    assert config.storage is storage
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="unexpected kind"):
+        AppConfig({"storage": {"kind": "ftp"}})
+    with pytest.raises(ValueError, match="discriminator"):
+        AppConfig({"storage": {"bucket": "logs"}})
+    with pytest.raises(TypeError):
+        cfg.discriminated({"s3": S3StorageConfig}, field="type")
+    with pytest.raises(TypeError):
+        cfg.discriminated({"s3": dict})
+
+
+def test_default_class():
+    typ = cfg.discriminated(STORAGES, default=LocalStorageConfig)
+
+    class DefaultConfig(cfg.BaseConfig):
+        storage = cfg.Option(type=typ)
+
+    config = DefaultConfig({"storage": {"kind": "local", "root": "/tmp"}})
+    assert config.storage.root == "/tmp"
+    assert type(typ({})) is LocalStorageConfig
@@ -0,0 +1,75 @@
+from array import array
+
+import pytest
+
+from fancy import config as cfg
+
+
+class ModelConfig(cfg.BaseConfig):
+    weights = cfg.Option(type=cfg.numeric_array(float))
+    buckets = cfg.Option(type=cfg.numeric_array(int), default=[1, 2, 3])
+    halves = cfg.Option(type=cfg.numeric_array("f"), nullable=True)
+
+
+def test_numeric_array_conversion():
+    config = ModelConfig(weights=[0.5, 1, 2.5], halves=["0.5", "1.5"])
+    assert isinstance(config.weights, array)
+    assert config.weights.typecode == "d"
+    assert list(config.weights) == [0.5, 1.0, 2.5]
+    assert config.buckets.typecode == "q"
+    assert list(config.buckets) == [1, 2, 3]
+    assert list(config.halves) == [0.5, 1.5]
+
+
+def test_numeric_array_to_dict_round_trip():
+    config = ModelConfig(weights=[0.5, 1.5])
+    data = config.to_dict()
+    assert data == {"weights": [0.5, 1.5], "buckets": [1, 2, 3], "halves": None}
+    assert type(data["weights"]) is list
+    assert ModelConfig(data).to_dict() == data
+
+
+def test_numeric_array_assignment_copies_matching_array():
+    weights = array("d", [1.0])
+    config = ModelConfig(weights=weights)
+    assert config.weights is not weights
+    weights[0] = 3.0
+    assert list(config.weights) == [1.0]
+    config.weights = array("f", [2.0])
+    assert config.weights.typecode == "d"
+
+
+def test_numeric_array_invalid_values():
+    with pytest.raises(ValueError):
+        ModelConfig(weights=["abc"])
+    with pytest.raises(ValueError):
+        cfg.numeric_array(str)
+    with pytest.raises(ValueError):
+        cfg.numeric_array("u")
+
+
+def test_numeric_array_integers_are_not_truncated():
+    assert list(ModelConfig(buckets=[1.0, "2", 3]).buckets) == [1, 2, 3]
+    with pytest.raises(ValueError):
+        ModelConfig(buckets=[1, 2.5])
+    with pytest.raises(ValueError):
+        ModelConfig(buckets=array("d", [0.5]))
+
+
+def test_numeric_array_rejects_strings_and_bytes():
+    with pytest.raises(TypeError):
+        ModelConfig(weights="123")
+    with pytest.raises(TypeError):
+        ModelConfig(weights=bytes(8))
+
+
+def test_numeric_array_with_numpy():
+    numpy = pytest.importorskip("numpy")
+
+    class Config(cfg.BaseConfig):
+        weights = cfg.Option(type=cfg.numeric_array(float, use_numpy=True))
+
+    config = Config(weights=[1, 2])
+    assert isinstance(config.weights, numpy.ndarray)
+    assert config.weights.dtype == numpy.float64
+    assert config.to_dict() == {"weights": [1.0, 2.0]}
@@ -0,0 +1,104 @@
+import pytest
+
+from fancy import config as cfg
+
+
+class SubConfig(cfg.BaseConfig):
+    a = cfg.Option(type=int, default=0)
+
+
+class MyConfig(cfg.BaseConfig):
+    port = cfg.Option(type=int, default="8080")
+    ratios = cfg.Option(type=tuple, default=[0.5, 0.5])
+    names = cfg.Option(type=list, default=("a", "b"))
+    tags = cfg.Option(type=[str], default=["a", "b"])
+    sub = cfg.Option(type=SubConfig, default={})
+
+
+def test_immutable_default_is_converted_once_and_shared():
+    first, second = MyConfig({}), MyConfig({})
+    assert first.port == 8080
+    assert first.ratios == (0.5, 0.5)
+    assert second.ratios is first.ratios
+
+
+def test_mutable_default_is_copied():
+    first, second = MyConfig({}), MyConfig({})
+    first.names.append("c")
+    first.tags.append("c")
+    assert second.names == ["a", "b"]
+    assert second.tags == ["a", "b"]
+    assert isinstance(second.tags, cfg.ConfigListStructure)
+    assert MyConfig({}).tags == ["a", "b"]
+
+
+def test_sub_config_default_is_created_per_instance():
+    first, second = MyConfig({}), MyConfig({})
+    first.sub.a = 1
+    assert second.sub is not first.sub
+    assert second.sub.loaded
+    assert second.sub.a == 0
+
+
+def test_converter_is_called_once_for_immutable_default():
+    calls = []
+
+    def to_int(value):
+        calls.append(value)
+        return int(value)
+
+    class CountingConfig(cfg.BaseConfig):
+        x = cfg.Option(type=to_int, default="1")
+
+    for _ in range(3):
+        assert CountingConfig({}).x == 1
+    assert calls == ["1"]
+
+
+def test_nested_mutable_default_is_converted_per_instance():
+    class NestedConfig(cfg.BaseConfig):
+        groups = cfg.Option(type=[list], default=[["a"], ["b"]])
+
+    first, second = NestedConfig({}), NestedConfig({})
+    first.groups[0].append("c")
+    assert second.groups == [["a"], ["b"]]
+
+
+def test_sub_config_default_is_loaded_once_and_cloned():
+    calls = []
+
+    def to_int(value):
+        calls.append(value)
+        return int(value)
+
+    class CountingSubConfig(cfg.BaseConfig):
+        x = cfg.Option(type=to_int)
+
+    class ParentConfig(cfg.BaseConfig):
+        sub = cfg.Option(type=CountingSubConfig, default={"x": "1"})
+
+    first, second, third = ParentConfig({}), ParentConfig({}), ParentConfig({})
+    assert first.sub.x == 1
+    first.sub.x = 2
+    assert second.sub.x == 1
+    assert third.sub is not second.sub
+    assert calls == ["1", 2]
+
+
+def test_sub_config_default_is_loaded_again_with_another_setter():
+    class ParentConfig(cfg.BaseConfig):
+        sub = cfg.Option(type=SubConfig, default={"a": 1, "unknown": 2})
+
+    assert ParentConfig(cfg.DictConfigLoader({}, setter="ignore")).sub.a == 1
+    with pytest.raises(KeyError):
+        _ = ParentConfig(cfg.DictConfigLoader({}, setter="strict")).sub
+
+
+def test_frozen_sub_config_default_is_shared():
+    class FrozenSubConfig(cfg.BaseConfig, frozen=True):
+        a = cfg.Option(type=int, default=0)
+
+    class ParentConfig(cfg.BaseConfig):
+        sub = cfg.Option(type=FrozenSubConfig, default={"a": 1})
+
+    assert ParentConfig({}).sub is ParentConfig({}).sub
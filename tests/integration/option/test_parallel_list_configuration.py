@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fancy import config as cfg
+from fancy.config import exc
+
+
+class ServiceConfig(cfg.BaseConfig):
+    name = cfg.Option(type=str, required=True)
+    port = cfg.Option(type=int, default=80)
+    thread = cfg.PlaceHolder[str]()
+
+    def post_load(self):
+        self.thread = threading.current_thread().name
+
+
+class ThreadClusterConfig(cfg.BaseConfig):
+    services = cfg.Option(type=cfg.parallel_config_list(ServiceConfig, max_workers=4, chunk_size=8))
+
+
+class ProcessClusterConfig(cfg.BaseConfig):
+    services = cfg.Option(type=cfg.parallel_config_list(ServiceConfig, executor="process", chunk_size=8))
+
+
+DATA = [{"name": f"service-{i}", "port": 1000 + i} for i in range(100)]
+
+
+def test_thread_loading_preserves_order():
+    config = ThreadClusterConfig(services=DATA)
+    assert isinstance(config.services, cfg.ParallelConfigListStructure)
+    assert [s.name for s in config.services] == [d["name"] for d in DATA]
+    assert config.to_dict(filter=lambda p: p.name != "thread") == {"services": DATA}
+    assert len({s.thread for s in config.services}) > 1
+
+
+def test_process_loading_preserves_order():
+    instance = ServiceConfig(name="local")
+    config = ProcessClusterConfig(services=DATA[:50] + [instance] + DATA[50:])
+    assert [s.name for s in config.services] == [d["name"] for d in DATA[:50]] + ["local"] + [
+        d["name"] for d in DATA[50:]
+    ]
+    assert config.services[50] is instance
+    assert config.services[1].port == 1001
+
+
+@pytest.mark.parametrize("config_type", [ThreadClusterConfig, ProcessClusterConfig])
+def test_error_reports_element_index(config_type):
+    data = DATA[:42] + [{"port": 1}] + DATA[42:]
+    with pytest.raises(exc.ListElementError) as e:
+        config_type(services=data)
+    assert e.value.index == 42
+    assert isinstance(e.value.error, ValueError)
+
+
+def test_small_list_and_given_executor():
+    with ThreadPoolExecutor(2) as executor:
+        class Config(cfg.BaseConfig):
+            services = cfg.Option(type=cfg.parallel_config_list(ServiceConfig, executor=executor, chunk_size=2))
+
+        assert [s.name for s in Config(services=DATA[:1]).services] == ["service-0"]
+        assert [s.name for s in Config(services=DATA[:5]).services] == [d["name"] for d in DATA[:5]]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        cfg.ParallelConfigListStructure(ServiceConfig, executor="fork")
+    with pytest.raises(ValueError):
+        cfg.ParallelConfigListStructure(ServiceConfig, chunk_size=0)
+    with pytest.raises(TypeError):
+        cfg.ParallelConfigListStructure(int, executor="process")
@@ -0,0 +1,103 @@
+import threading
+import time
+
+import pytest
+
+from fancy import config as cfg
+
+
+class ServerConfig(cfg.BaseConfig):
+    host = cfg.Option(type=str, required=True)
+    port = cfg.Option(type=int, default=80)
+
+    address = cfg.Lazy(lambda c: f"{c.host}:{c.port}")
+
+
+class ClusterConfig(cfg.BaseConfig):
+    servers = cfg.Option(type=[ServerConfig])
+
+    addresses = cfg.Lazy(lambda c: [server.address for server in c.servers])
+    count = cfg.Lazy(lambda c: len(c.addresses))
+
+
+DATA = {"servers": [{"host": "a"}, {"host": "b", "port": 8080}]}
+
+
+def test_precompute_lazies():
+    config = ClusterConfig(DATA)
+    timings = config.precompute_lazies()
+    assert set(timings) == {"servers[0].address", "servers[1].address", "addresses", "count"}
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert vars(config)["addresses"] == ["a:80", "b:8080"]
+    assert vars(config)["count"] == 2
+    assert config.precompute_lazies() == {}
+
+
+def test_load_with_precompute():
+    config = ClusterConfig()
+    timings = config.load(cfg.DictConfigLoader(DATA), precompute=True)
+    assert "count" in timings
+    assert "addresses" in vars(config)
+
+
+def test_computed_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait(config):
+        barrier.wait()  # fails unless both are computed at the same time
+        return time.time()
+
+    class SubConfig(cfg.BaseConfig):
+        value = cfg.Lazy(wait)
+
+    class MyConfig(cfg.BaseConfig):
+        first = cfg.Option(type=SubConfig, default={})
+        second = cfg.Option(type=SubConfig, default={})
+
+    timings = cfg.precompute_lazies(MyConfig({}), max_workers=2)
+    assert set(timings) == {"first.value", "second.value"}
+
+
+def test_exception_is_raised():
+    class FailingConfig(cfg.BaseConfig):
+        value = cfg.Lazy(lambda c: 1 / 0)
+
+    with pytest.raises(ZeroDivisionError):
+        FailingConfig().precompute_lazies()
+
+
+def test_lazies_of_a_config_are_computed_concurrently():
+    barrier = threading.Barrier(4, timeout=5)
+
+    class MyConfig(cfg.BaseConfig):
+        a = cfg.Lazy(lambda c: barrier.wait())
+        b = cfg.Lazy(lambda c: barrier.wait())
+        c = cfg.Lazy(lambda c: barrier.wait())
+        d = cfg.Lazy(lambda c: barrier.wait())
+
+    assert set(MyConfig({}).precompute_lazies(max_workers=4)) == {"a", "b", "c", "d"}
+
+
+def test_shared_lazies_are_computed_once():
+    calls = []
+
+    def slow(config):
+        calls.append(config)
+        time.sleep(0.05)
+        return 1
+
+    class SubConfig(cfg.BaseConfig):
+        value = cfg.Lazy(slow)
+
+    class MyConfig(cfg.BaseConfig):
+        sub = cfg.Option(type=SubConfig, default={})
+
+        first = cfg.Lazy(lambda c: c.sub.value + 1)
+        second = cfg.Lazy(lambda c: c.sub.value + 2)
+        third = cfg.Lazy(lambda c: c.first + c.second)
+
+    config = MyConfig({})
+    timings = config.precompute_lazies(max_workers=4)
+    assert len(calls) == 1
+    assert config.third == 5
+    assert set(timings) <= {"sub.value", "first", "second", "third"} and "third" in timings
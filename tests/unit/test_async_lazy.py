@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from fancy import config as cfg
+
+
+class SubConfig(cfg.BaseConfig):
+    a = cfg.Option(type=int, default=1)
+
+    async def _double(self):
+        await asyncio.sleep(0)
+        return self.a * 2
+
+    doubled = cfg.AsyncLazy[int](_double)
+
+
+class MyConfig(cfg.BaseConfig):
+    calls = 0
+
+    async def _load(self):
+        type(self).calls += 1
+        await asyncio.sleep(0.01)
+        return "secret"
+
+    secret = cfg.AsyncLazy[str](_load)
+    length = cfg.AsyncLazy[int](lambda c: 6)
+    subs = cfg.Option(type=[SubConfig], default=[{"a": 1}, {"a": 2}])
+
+
+def test_computed_once_for_concurrent_awaiters():
+    MyConfig.calls = 0
+    config = MyConfig({})
+
+    async def main():
+        return await asyncio.gather(*(config.secret for _ in range(5)))
+
+    assert asyncio.run(main()) == ["secret"] * 5
+    assert MyConfig.calls == 1
+    assert asyncio.run(_get(config, "secret")) == "secret"
+    assert MyConfig.calls == 1
+
+
+def test_exception_is_not_cached():
+    attempts = []
+
+    async def fail(config):
+        attempts.append(config)
+        raise ValueError("failed")
+
+    class FailingConfig(cfg.BaseConfig):
+        value = cfg.AsyncLazy(fail)
+
+    config = FailingConfig()
+
+    async def main():
+        return await asyncio.gather(config.value, config.value, return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(attempts) == 1
+    assert not FailingConfig.value.is_computed(config)
+    with pytest.raises(ValueError):
+        asyncio.run(_get(config, "value"))
+    assert len(attempts) == 2
+
+
+def test_resolve_async_lazies():
+    config = MyConfig({})
+    assert config.to_dict() == {"subs": [{"a": 1}, {"a": 2}]}
+    asyncio.run(cfg.resolve_async_lazies(config))
+    assert MyConfig.secret.get_computed(config) == "secret"
+    assert config.to_dict() == {
+        "secret": "secret",
+        "length": 6,
+        "subs": [{"a": 1, "doubled": 2}, {"a": 2, "doubled": 4}],
+    }
+    assert "'secret': 'secret'" in repr(config)
+
+
+def test_access_without_event_loop():
+    with pytest.raises(RuntimeError):
+        _ = MyConfig({}).secret
+
+
+async def _get(config, name):
+    return await getattr(config, name)
+
+
+class PathConfig(cfg.BaseConfig):
+    path = cfg.Option(type=str, default="a")
+
+    async def _read(self):
+        path = self.path
+        await asyncio.sleep(0.01)
+        return path.upper()
+
+    content = cfg.AsyncLazy[str](_read)
+
+
+def test_invalidated_when_dependency_changes():
+    config, other = PathConfig({}), PathConfig({})
+
+    async def main():
+        assert await config.content == "A"
+        config.path = "b"
+        assert await config.content == "B"
+
+        await asyncio.gather(config.content, other.content)
+        other.path = "c"  # the reads of concurrent tasks are not mixed up
+        assert PathConfig.content.is_computed(config)
+        assert not PathConfig.content.is_computed(other)
+
+    asyncio.run(main())
+
+
+def test_change_while_computing_is_not_cached():
+    config = PathConfig({})
+
+    async def main():
+        awaitable = config.content
+        await asyncio.sleep(0)  # the path is read
+        config.path = "b"
+        assert await awaitable == "A"
+        assert not PathConfig.content.is_computed(config)
+        assert await config.content == "B"
+
+    asyncio.run(main())
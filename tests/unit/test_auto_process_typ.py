@@ -0,0 +1,41 @@
+from fancy import config as cfg
+from fancy.config.process import auto_process_typ
+
+
+class SubConfig(cfg.BaseConfig):
+    a = cfg.Option(type=int)
+
+
+class MyConfig(cfg.BaseConfig):
+    subs = cfg.Option(type=[SubConfig])
+    matrix = cfg.Option(type=[[int]])
+
+
+def test_processors_are_memoized():
+    assert auto_process_typ(SubConfig) is auto_process_typ(SubConfig)
+    assert auto_process_typ([SubConfig]) is auto_process_typ([SubConfig])
+    assert auto_process_typ([[SubConfig]]) is auto_process_typ([[SubConfig]])
+    assert auto_process_typ([SubConfig]) is not auto_process_typ([[SubConfig]])
+    assert auto_process_typ(bool) is cfg.process.boolean
+    assert auto_process_typ(int) is int
+
+
+def test_element_processor_is_shared_by_list_instances():
+    c1 = MyConfig(subs=[{"a": 1}], matrix=[[1, 2], [3]])
+    c2 = MyConfig(subs=[{"a": 2}], matrix=[[4]])
+    assert c1.subs._config_typ is c2.subs._config_typ
+    assert c1.matrix[0]._config_typ is c1.matrix[1]._config_typ is c2.matrix[0]._config_typ
+    assert c1.to_dict() == {"subs": [{"a": 1}], "matrix": [[1, 2], [3]]}
+
+
+def test_unhashable_callable():
+    class Converter:
+        __hash__ = None
+
+        def __call__(self, val):
+            return int(val) * 2
+
+    class Config(cfg.BaseConfig):
+        values = cfg.Option(type=[Converter()])
+
+    assert Config(values=["1", "2"]).values == [2, 4]
@@ -0,0 +1,57 @@
+import copy
+import pickle
+
+import pytest
+
+from fancy import config as cfg
+from fancy.config.process import BooleanConverter, boolean, is_scalar
+
+
+def test_make_boolean_compiles_converter():
+    converter = cfg.make_boolean({"enabled", "Y"}, {"disabled", "n"})
+    assert isinstance(converter, BooleanConverter)
+    assert is_scalar(converter)
+    assert converter("enabled") is True
+    assert converter(" ENABLED ") is True
+    assert converter("y") is True
+    assert converter("N") is False
+    assert converter(0) is False
+    assert converter([1]) is True
+    with pytest.raises(ValueError, match="unexpected value: yes"):
+        converter("yes")
+
+
+def test_default_choices():
+    assert cfg.make_boolean() is cfg.make_boolean()
+    assert cfg.make_boolean()(" Yes") is True
+    assert boolean("==FALSE==") is False
+    assert boolean("on", false_choices={"on"}) is True  # true choices take precedence
+    assert boolean("x", true_choices={"x"}) is True
+    assert boolean("no", true_choices={"x"}) is False
+
+
+def test_choices_are_frozen():
+    true_choices = {"a"}
+    converter = cfg.make_boolean(true_choices, {"b"})
+    true_choices.add("c")
+    assert converter.true_choices == frozenset({"a"})
+    assert converter.false_choices == frozenset({"b"})
+    with pytest.raises(ValueError):
+        converter("c")
+    with pytest.raises(AttributeError):
+        converter.args = ()
+
+
+class FlagsConfig(cfg.BaseConfig):
+    flags = cfg.Option(type=[cfg.make_boolean({"a"}, {"b"})], default=[])
+
+
+def test_converters_are_copied_and_pickled():
+    converter = cfg.make_boolean({"a"}, {"b"})
+    for copied in (copy.deepcopy(converter), pickle.loads(pickle.dumps(converter))):
+        assert isinstance(copied, BooleanConverter)
+        assert copied.true_choices == {"a"} and copied.false_choices == {"b"}
+        assert copied("A") is True and copied("b") is False
+
+    config = copy.deepcopy(FlagsConfig({"flags": ["a", "b"]}))
+    assert config.flags == [True, False]
@@ -0,0 +1,75 @@
+import pytest
+
+from fancy import config as cfg
+
+
+class ServerConfig(cfg.BaseConfig):
+    host = cfg.Option(type=str, required=True)
+    port = cfg.Option(type=int, default=80)
+
+    address = cfg.Lazy[str](lambda c: f"{c.host}:{c.port}")
+
+
+class ClusterConfig(cfg.BaseConfig):
+    name = cfg.Option(type=str, default="cluster")
+    servers = cfg.Option(type=[ServerConfig], default=[])
+    labels = cfg.Option(type={str: str}, default={})
+    weights = cfg.Option(type=cfg.numeric_array(float), default=[])
+    primary = cfg.Option(type=ServerConfig, nullable=True)
+
+
+def _make_cluster() -> ClusterConfig:
+    return ClusterConfig({
+        "servers": [{"host": "a"}, {"host": "b", "port": 8080}],
+        "labels": {"env": "prod"},
+        "weights": [0.5, 0.5],
+        "primary": {"host": "a"},
+    })
+
+
+def test_clone_is_independent():
+    config = _make_cluster()
+    clone = config.clone()
+    assert clone.to_dict() == config.to_dict()
+    assert clone.get_loader() is config.get_loader()
+
+    clone.servers[0].port = 81
+    clone.servers.append(ServerConfig(host="c"))
+    clone.labels["env"] = "dev"
+    clone.weights[0] = 1.0
+    clone.primary.host = "b"
+    assert config.to_dict() == _make_cluster().to_dict()
+
+
+def test_clone_with_overrides():
+    config = _make_cluster()
+    assert config.primary.address == "a:80"
+    clone = config.clone(name="other", primary={"host": "b", "port": "81"})
+    assert clone.name == "other"
+    assert clone.primary.address == "b:81"  # converted, and lazy values computed again
+    assert config.name == "cluster" and config.primary.address == "a:80"
+    with pytest.raises(KeyError):
+        config.clone(not_an_option=1)
+
+
+def test_clone_shares_frozen_structures():
+    config = _make_cluster().freeze()
+    clone = config.clone(name="other")
+    assert clone.frozen and clone.name == "other"
+    assert clone.servers is config.servers and clone.primary is config.primary
+    assert config.clone() == config
+
+
+def test_clone_doesnt_share_bookkeeping():
+    class TimedConfig(cfg.BaseConfig):
+        value = cfg.Option(type=int, default=1)
+        doubled = cfg.TimedLazy(lambda c: c.value * 2, ttl=60)
+
+    config = TimedConfig({})
+    assert config.doubled == 2
+    expires = dict(vars(config)["_lazy_expires"])
+    clone = config.clone(value=2)
+    assert "_lazy_expires" not in vars(clone)
+    assert clone.doubled == 4
+    assert vars(config)["_lazy_expires"] == expires
+    assert vars(clone)["_lazy_expires"] is not vars(config)["_lazy_expires"]
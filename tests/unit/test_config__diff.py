@@ -0,0 +1,76 @@
+import pytest
+
+from fancy import config as cfg
+from fancy.config.diff import MISSING
+
+
+class ServerConfig(cfg.BaseConfig):
+    host = cfg.Option(type=str, required=True)
+    port = cfg.Option(type=int, default=80)
+
+    address = cfg.Lazy[str](lambda c: f"{c.host}:{c.port}")
+
+
+class ClusterConfig(cfg.BaseConfig):
+    name = cfg.Option(type=str, default="cluster")
+    servers = cfg.Option(type=[ServerConfig], default=[])
+    labels = cfg.Option(type={str: str}, default={})
+    primary = cfg.Option(type=ServerConfig, nullable=True)
+
+
+def _make_cluster(**overrides) -> ClusterConfig:
+    options = {
+        "servers": [{"host": "a"}, {"host": "b", "port": 8080}],
+        "labels": {"env": "prod"},
+        "primary": {"host": "a"},
+        **overrides,
+    }
+    return ClusterConfig(options)
+
+
+def test_diff_of_equal_configs():
+    assert _make_cluster().diff(_make_cluster()) == []
+
+
+def test_diff_reports_paths_of_changed_values():
+    old = _make_cluster()
+    new = _make_cluster(
+        name="other",
+        servers=[{"host": "a", "port": 81}, {"host": "b", "port": 8080}, {"host": "c"}],
+        labels={"zone": "eu"},
+        primary=None,
+    )
+    changes = old.diff(new)
+    assert [change.path for change in changes] == [
+        "name", "servers[0].port", "servers[2]", "labels[env]", "labels[zone]", "primary"
+    ]
+    changes = {change.path: change for change in changes}
+    assert changes["name"] == ("name", "cluster", "other")
+    assert changes["servers[0].port"] == ("servers[0].port", 80, 81)
+    assert changes["servers[2]"].old is MISSING and changes["servers[2]"].new is new.servers[2]
+    assert changes["labels[env]"] == ("labels[env]", "prod", MISSING)
+    assert changes["primary"].new is None
+
+
+def test_diff_skips_frozen_subtrees_with_cached_fingerprints():
+    old, new = _make_cluster().freeze(), _make_cluster().freeze()
+    old.fingerprint()
+    new.fingerprint()
+    vars(new.primary)["host"] = "changed"  # bypasses the frozen flag
+    assert old.diff(new) == []
+
+
+def test_diff_doesnt_trust_fingerprints_of_mutable_subtrees():
+    class TaggedConfig(cfg.BaseConfig):
+        tags = cfg.Option(type=list, default=[])
+
+    old, new = TaggedConfig(tags=[1]), TaggedConfig(tags=[1])
+    old.fingerprint()
+    new.fingerprint()
+    new.tags.append(3)  # not invalidating the fingerprint
+    assert [change.path for change in old.diff(new)] == ["tags"]
+
+
+def test_diff_of_configs_of_different_classes():
+    with pytest.raises(TypeError):
+        ServerConfig(host="a").diff(_make_cluster())
@@ -0,0 +1,85 @@
+import copy
+
+import pytest
+
+from fancy import config as cfg
+
+
+class ServerConfig(cfg.BaseConfig):
+    host = cfg.Option(type=str, required=True)
+    port = cfg.Option(type=int, default=80)
+    token = cfg.Option(type=str, nullable=True, hidden=True)
+
+    address = cfg.Lazy[str](lambda c: f"{c.host}:{c.port}")
+
+
+class ClusterConfig(cfg.BaseConfig):
+    servers = cfg.Option(type=[ServerConfig], default=[])
+    labels = cfg.Option(type={str: str}, default={})
+    primary = cfg.Option(type=ServerConfig, nullable=True)
+
+
+def _make_cluster(labels=None) -> ClusterConfig:
+    return ClusterConfig({
+        "servers": [{"host": "a"}, {"host": "b", "port": 8080}],
+        "labels": labels or {"env": "prod", "zone": "eu"},
+        "primary": {"host": "a"},
+    })
+
+
+def test_fingerprint_depends_on_values_only():
+    config = _make_cluster()
+    assert config.fingerprint() == _make_cluster(labels={"zone": "eu", "env": "prod"}).fingerprint()
+    assert config.fingerprint() != _make_cluster(labels={"env": "dev"}).fingerprint()
+    assert len(config.fingerprint()) == 64
+
+    _ = config.primary.address
+    config.primary.token = "secret"  # neither lazy nor hidden values are included
+    assert config.fingerprint() == _make_cluster().fingerprint()
+
+
+def test_fingerprint_is_stable():
+    assert ServerConfig(host="a").fingerprint() == \
+        "9539bfab68c04bbd3c6ee0b3098a13d25e811422a98a5670b4e9030bb96d50b9"
+
+
+def test_fingerprint_is_invalidated_on_mutation():
+    config = _make_cluster()
+    original = config.fingerprint()
+    unchanged = vars(config.servers[1])["_fingerprint"]
+
+    config.servers[0].port = 81
+    assert config.fingerprint() != original
+    assert vars(config.servers[1])["_fingerprint"] is unchanged  # not hashed again
+    config.servers[0].port = 80
+    assert config.fingerprint() == original
+
+    config.servers.append(ServerConfig(host="c"))
+    assert config.fingerprint() != original
+    config.servers.pop()
+    assert config.fingerprint() == original
+
+    config.labels["env"] = "dev"
+    assert config.fingerprint() != original
+    config.labels["env"] = "prod"
+    assert config.fingerprint() == original
+
+    config.primary = {"host": "b"}
+    assert config.fingerprint() != original
+
+
+def test_fingerprint_of_unsupported_values():
+    class ObjectConfig(cfg.BaseConfig):
+        value = cfg.Option()
+
+    with pytest.raises(TypeError):
+        ObjectConfig(value=object()).fingerprint()
+
+
+def test_fingerprint_of_copies():
+    config = _make_cluster()
+    original = config.fingerprint()
+    copied = copy.deepcopy(config)
+    copied.primary.port = 81
+    assert copied.fingerprint() != original
+    assert config.fingerprint() == original
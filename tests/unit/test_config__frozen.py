@@ -0,0 +1,136 @@
+import copy
+import pickle
+
+import pytest
+
+from fancy import config as cfg
+from fancy.config import exc
+
+
+class ServerConfig(cfg.BaseConfig):
+    host = cfg.Option(type=str, required=True)
+    port = cfg.Option(type=int, default=80)
+
+
+class ClusterConfig(cfg.BaseConfig):
+    name = cfg.Option(type=str, default="cluster")
+    servers = cfg.Option(type=[ServerConfig], default=[])
+    labels = cfg.Option(type={str: str}, default={})
+    primary = cfg.Option(type=ServerConfig, nullable=True)
+
+    server_count = cfg.Lazy[int](lambda c: len(c.servers))
+
+
+class FrozenServerConfig(ServerConfig, frozen=True):
+    pass
+
+
+def _make_cluster(**overrides) -> ClusterConfig:
+    options = {
+        "servers": [{"host": "a"}, {"host": "b", "port": 8080}],
+        "labels": {"env": "prod"},
+        "primary": {"host": "a"},
+        **overrides,
+    }
+    return ClusterConfig(options)
+
+
+def test_freeze_prevents_modifications():
+    config = _make_cluster().freeze()
+    assert config.frozen
+    assert config.servers.frozen and config.labels.frozen and config.primary.frozen
+
+    with pytest.raises(exc.FrozenConfigError):
+        config.name = "other"
+    with pytest.raises(exc.FrozenConfigError):
+        config["name"] = "other"
+    with pytest.raises(exc.FrozenConfigError):
+        del config.name
+    with pytest.raises(exc.FrozenConfigError):
+        config.clear()
+    with pytest.raises(exc.FrozenConfigError):
+        config.load(cfg.DictConfigLoader({"name": "other"}))
+    with pytest.raises(exc.FrozenConfigError):
+        config.primary.port = 1
+    with pytest.raises(exc.FrozenConfigError):
+        config.servers.append(ServerConfig(host="c"))
+    with pytest.raises(exc.FrozenConfigError):
+        config.servers[0] = ServerConfig(host="c")
+    with pytest.raises(exc.FrozenConfigError):
+        config.servers += []
+    with pytest.raises(exc.FrozenConfigError):
+        config.labels["env"] = "dev"
+    with pytest.raises(exc.FrozenConfigError):
+        config.labels.update(env="dev")
+
+    assert config.name == "cluster"
+    assert config.server_count == 2  # lazy values are still computed
+    assert config.to_dict()["labels"] == {"env": "prod"}
+
+
+def test_frozen_configs_are_hashable_and_equal_by_values():
+    config = _make_cluster().freeze()
+    same = _make_cluster().freeze()
+    other = _make_cluster(labels={"env": "dev"}).freeze()
+
+    assert config == same and hash(config) == hash(same)
+    assert config != other
+    assert {config: 1}[same] == 1
+    assert vars(config)["_frozen_hash"] == hash(config)  # cached
+
+
+def test_unfrozen_configs_are_compared_by_identity():
+    config = _make_cluster()
+    assert config != _make_cluster()
+    assert config == config
+    assert config != _make_cluster().freeze()
+    assert hash(config) == object.__hash__(config)
+
+
+def test_frozen_class():
+    config = FrozenServerConfig(host="a")
+    assert config.frozen and config.port == 80
+    assert config == FrozenServerConfig(host="a")
+    with pytest.raises(exc.FrozenConfigError):
+        config.port = 1
+
+    assert not FrozenServerConfig().frozen  # frozen when loaded
+    assert not ServerConfig(host="a").frozen
+
+
+def test_copies_of_frozen_structures():
+    config = _make_cluster().freeze()
+    assert copy.deepcopy(config) == config
+    assert copy.copy(config.servers).frozen
+    assert copy.deepcopy(config.labels) == {"env": "prod"}
+    assert pickle.loads(pickle.dumps(config.primary)) == config.primary
+
+
+def test_pickled_frozen_configs_drop_the_cached_hash():
+    config = FrozenServerConfig(host="a")
+    hash(config)
+    restored = pickle.loads(pickle.dumps(config))
+    assert "_frozen_hash" not in vars(restored)
+    assert restored == FrozenServerConfig(host="a")
+    assert restored in {FrozenServerConfig(host="a")}
+
+
+class PlainConfig(cfg.BaseConfig):
+    tags = cfg.Option(type=list, default=[])
+    options = cfg.Option(type=dict, default={})
+    values = cfg.Option(type=cfg.numeric_array("i"), default=[])
+
+
+def test_freeze_converts_plain_mutable_values():
+    config = PlainConfig(tags=[1, [2]], options={"a": [1]}).freeze()
+    assert config.tags == (1, (2,))
+    assert config.options == {"a": (1,)}
+    with pytest.raises(exc.FrozenConfigError):
+        config.options["b"] = 2
+    assert config == PlainConfig(tags=[1, [2]], options={"a": [1]}).freeze()
+    assert copy.deepcopy(config) == config
+    assert pickle.loads(pickle.dumps(config)).options == {"a": (1,)}
+    assert config.fingerprint() == PlainConfig(tags=[1, [2]], options={"a": [1]}).fingerprint()
+
+    hash(config)
+    assert "_frozen_hash" not in vars(config)  # numeric arrays can still change
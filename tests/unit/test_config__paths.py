@@ -0,0 +1,87 @@
+import pytest
+
+from fancy import config as cfg
+from fancy.config.paths import compile_path
+
+
+class ReplicaConfig(cfg.BaseConfig):
+    host = cfg.Option(type=str, required=True)
+    port = cfg.Option(type=int, default=5432)
+
+
+class DbConfig(cfg.BaseConfig):
+    replicas = cfg.Option(type=[ReplicaConfig], default=[])
+    weights = cfg.Option(type={str: float}, default={})
+    timeouts = cfg.Option(type=[int], default=[])
+
+
+class AppConfig(cfg.BaseConfig):
+    db = cfg.Option(type=DbConfig, default={})
+    debug = cfg.Option(type=bool, default=False, name="debug-mode")
+    extra = cfg.Option(default={})
+
+
+def _make_app() -> AppConfig:
+    return AppConfig({
+        "db": {
+            "replicas": [{"host": "a"}, {"host": "b"}, {"host": "c", "port": 5433}],
+            "weights": {"a": 0.5, "b.c": 0.5},
+            "timeouts": [1, 2],
+        },
+        "extra": {"flags": {"beta": True}},
+    })
+
+
+def test_get_path():
+    config = _make_app()
+    assert config.get_path("db.replicas[2].host") == "c"
+    assert config.get_path("db.replicas[-1].port") == 5433
+    assert config.get_path("db.weights[a]") == 0.5
+    assert config.get_path('db.weights["b.c"]') == 0.5
+    assert config.get_path("debug-mode") is False
+    assert config.get_path("extra[flags][beta]") is True
+    assert config.get_path("db") is config.db
+
+    with pytest.raises(KeyError):
+        config.get_path("db.not_an_option")
+    with pytest.raises(KeyError):
+        config.get_path("debug")  # by configuration name
+    with pytest.raises(IndexError):
+        config.get_path("db.replicas[3]")
+    with pytest.raises(ValueError):
+        config.get_path("db..replicas")
+
+
+def test_set_path_converts_values():
+    config = _make_app()
+    config.set_path("db.replicas[0].port", "6000")
+    assert config.db.replicas[0].port == 6000
+    config.set_path("db.replicas[1]", {"host": "d"})
+    assert isinstance(config.db.replicas[1], ReplicaConfig) and config.db.replicas[1].host == "d"
+    config.set_path("db.timeouts[0]", "10")
+    assert config.db.timeouts == [10, 2]
+    config.set_path("db.weights[a]", "0.25")
+    assert config.db.weights == {"a": 0.25, "b.c": 0.5}
+    config.set_path("debug-mode", "yes")
+    assert config.debug is True
+
+    frozen = _make_app().freeze()
+    with pytest.raises(cfg.exc.FrozenConfigError):
+        frozen.set_path("db.timeouts[0]", 10)
+
+
+def test_compiled_paths_are_cached():
+    assert compile_path(AppConfig, "db.replicas[2].host") is compile_path(AppConfig, "db.replicas[2].host")
+    with pytest.raises(KeyError):
+        compile_path(AppConfig, "not_an_option.host")
+
+
+@pytest.mark.parametrize("path", [
+    "db.replicas.host", "db.replicas[a]", "db.weights.a", "db[replicas]", "extra.flags", "db.replicas[0].port[0]",
+])
+def test_steps_which_dont_apply(path):
+    config = _make_app()
+    with pytest.raises(KeyError, match="can't apply"):
+        config.get_path(path)
+    with pytest.raises(KeyError, match="can't apply"):
+        config.set_path(path, "1")
@@ -0,0 +1,68 @@
+import timeit
+
+from fancy import config as cfg
+
+
+class SubConfig(cfg.BaseConfig):
+    x = cfg.Option(type=int, default=1)
+    y = cfg.Lazy[int](lambda c: c.x + 1)
+
+
+class MyConfig(cfg.BaseConfig):
+    a = cfg.Option(type=[int], default=[])
+    sub = cfg.Option(type=SubConfig, default={})
+    text = cfg.Option(type=str, default="text")
+
+
+def test_repr_of_small_config_matches_dict():
+    c = MyConfig(a=[1, 2, 3])
+    _ = c.sub.y
+    assert repr(c) == str(c.to_dict())
+    assert str(c) == repr(c)
+
+
+def test_repr_does_not_compute_lazies():
+    calls = []
+
+    class Config(cfg.BaseConfig):
+        a = cfg.Option(type=int, default=1)
+        b = cfg.Lazy[int](lambda c: calls.append(c) or 2)
+
+    c = Config()
+    assert repr(c) == "{'a': 1, 'b': <lazy>}"
+    assert calls == []
+    assert c.b == 2
+    assert repr(c) == "{'a': 1, 'b': 2}"
+
+
+def test_repr_is_bounded():
+    c = MyConfig(a=list(range(100_000)), text="x" * 100_000)
+    result = repr(c)
+    assert len(result) <= 1024
+    assert "...<99984 more>" in result
+    assert result.endswith("...")
+
+
+def test_to_str_limits():
+    c = MyConfig(a=list(range(5)))
+    assert c.to_str(max_items=2) == "{'a': [0, 1, ...<3 more>], 'sub': {'x': 1, 'y': <lazy>}, ...}"
+    assert c.to_str(max_depth=1) == "{'a': [...], 'sub': {...}, 'text': 'text'}"
+    assert c.to_str(max_length=10) == "{'a': [..."
+    assert c.to_str() == "{'a': [0, 1, 2, 3, 4], 'sub': {'x': 1, 'y': <lazy>}, 'text': 'text'}"
+
+
+def test_repr_of_circular_config():
+    class Config(cfg.BaseConfig):
+        other = cfg.PlaceHolder()
+
+    c = Config()
+    c.other = c
+    assert repr(c) == "{'other': {...}}"
+
+
+def test_repr_time_is_independent_of_list_size():
+    small = MyConfig(a=list(range(100)))
+    large = MyConfig(a=list(range(200_000)))
+    small_time = min(timeit.repeat(lambda: repr(small), number=20, repeat=5))
+    large_time = min(timeit.repeat(lambda: repr(large), number=20, repeat=5))
+    assert large_time < small_time * 5
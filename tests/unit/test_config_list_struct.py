@@ -0,0 +1,46 @@
+import pytest
+
+from fancy import config as cfg
+from fancy.config.process import scalar, is_scalar
+
+
+class SubConfig(cfg.BaseConfig):
+    a = cfg.Option(type=int)
+
+
+@scalar
+def double(value):
+    return int(value) * 2
+
+
+def test_is_scalar():
+    assert is_scalar(int)
+    assert is_scalar(str)
+    assert is_scalar(cfg.process.boolean)
+    assert is_scalar(cfg.make_boolean({"y"}, {"n"}))
+    assert is_scalar(cfg.identical)
+    assert is_scalar(double)
+    assert not is_scalar(lambda value: value)
+    assert not is_scalar(SubConfig)
+    assert not is_scalar(cfg.process.auto_process_typ(SubConfig))
+    assert not is_scalar(cfg.process.auto_process_typ([int]))
+
+
+def test_scalar_list_conversion():
+    class Config(cfg.BaseConfig):
+        ints = cfg.Option(type=[int])
+        flags = cfg.Option(type=[bool])
+        doubled = cfg.Option(type=[double])
+        subs = cfg.Option(type=[SubConfig], default=[])
+
+    config = Config(ints=["1", 2], flags=["yes", 0], doubled=[1, "2"], subs=[{"a": 1}])
+    assert config.ints._is_scalar
+    assert not config.subs._is_scalar
+    assert config.to_dict() == {"ints": [1, 2], "flags": [True, False], "doubled": [2, 4], "subs": [{"a": 1}]}
+
+
+def test_scalar_list_conversion_failure_keeps_list_empty():
+    structure = cfg.ConfigListStructure(int)
+    with pytest.raises(ValueError):
+        structure.load_by_context(SubConfig(), ["1", "x"])
+    assert structure == []
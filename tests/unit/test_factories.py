@@ -0,0 +1,95 @@
+import gc
+import types
+
+import pytest
+
+from fancy import config as cfg
+from fancy.config import exc
+from fancy.config.utils.registry import ClassRegistry
+
+
+class FactoryServiceConfig(cfg.BaseConfig):
+    port = cfg.Option(type=int, default=80)
+
+
+class DatabaseConfig(cfg.BaseConfig, aliases=["db"]):
+    host = cfg.Option(type=str, default="localhost")
+
+
+def test_create_config_by_name():
+    for name in ["FactoryServiceConfig", "FactoryService", "factoryService"]:
+        assert type(cfg.ConfigFactory.create_config(name, cfg.DictConfigLoader({}))) is FactoryServiceConfig
+    assert type(cfg.ConfigFactory.create_config("db", cfg.DictConfigLoader({}))) is DatabaseConfig
+    with pytest.raises(exc.ClassNotFoundException):
+        cfg.ConfigFactory.create_config("missing", cfg.DictConfigLoader({}))
+
+
+def test_classes_defined_after_lookup_are_found():
+    with pytest.raises(exc.ClassNotFoundException):
+        cfg.ConfigFactory.create_config("late", cfg.DictConfigLoader({}))
+
+    class LateConfig(cfg.BaseConfig):
+        pass
+
+    assert type(cfg.ConfigFactory.create_config("late", cfg.DictConfigLoader({}))) is LateConfig
+
+
+class DuplicatedConfig(cfg.BaseConfig):
+    pass
+
+
+def test_duplicated_class_names():
+    first = DuplicatedConfig
+    second = types.new_class(
+        "DuplicatedConfig", (cfg.BaseConfig,), {"aliases": ["second_duplicated"]},
+        lambda namespace: namespace.update(__module__="other.module"),
+    )
+    with pytest.raises(exc.AmbiguousClassNameError) as exc_info:
+        cfg.ConfigFactory.create_config("duplicated", cfg.DictConfigLoader({}))
+    assert set(exc_info.value.classes) == {first, second}
+    assert type(cfg.ConfigFactory.create_config("second_duplicated", cfg.DictConfigLoader({}))) is second
+    assert type(cfg.ConfigFactory.create_config(f"{__name__}.DuplicatedConfig", cfg.DictConfigLoader({}))) is first
+    assert type(cfg.ConfigFactory.create_config("other.module.DuplicatedConfig", cfg.DictConfigLoader({}))) is second
+
+
+def test_create_loader_by_name():
+    class EnvConfigLoader(cfg.DictConfigLoader, aliases=["environment"]):
+        def __init__(self):
+            super().__init__({})
+
+    for name in ["env", "ENV", "Env", "EnvConfigLoader", "environment"]:
+        assert type(cfg.ConfigLoaderFactory.create_loader(name)) is EnvConfigLoader
+    assert "YamlConfigLoader" in cfg.ConfigLoaderFactory.get_all_loaders()
+
+
+def test_collected_classes_are_removed_from_the_tables():
+    registry = ClassRegistry(str.capitalize)
+
+    class Base:
+        pass
+
+    class TemporaryConfig(Base):
+        pass
+
+    registry.register(Base)
+    registry.register(TemporaryConfig, aliases=["tmp"])
+    assert registry.lookup("temporary", "Config") is TemporaryConfig
+    del TemporaryConfig
+    gc.collect()
+    table = registry._get_table("Config")
+    assert set(table.exact) == {"Base", f"{__name__}.{Base.__qualname__}"}
+    assert not table.normalized
+    with pytest.raises(exc.ClassNotFoundException):
+        registry.lookup("tmp", "Config")
+
+
+def test_deprecated_class_attributes():
+    with pytest.warns(DeprecationWarning):
+        configs = cfg.ConfigFactory.configs
+    assert configs["FactoryServiceConfig"] is FactoryServiceConfig
+    with pytest.warns(DeprecationWarning):
+        assert cfg.ConfigLoaderFactory.loaders["YamlConfigLoader"] is cfg.YamlConfigLoader
+    with pytest.raises(TypeError):
+        configs["Other"] = FactoryServiceConfig
+    with pytest.raises(AttributeError):
+        cfg.ConfigFactory().configs = {}
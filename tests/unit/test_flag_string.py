@@ -0,0 +1,82 @@
+import functools
+
+import pytest
+
+from fancy import config as cfg
+from fancy.config.process import flag_string, flag_container, iter_flag_container, register_flag_type, get_flag_type
+
+
+class SubConfig(cfg.BaseConfig):
+    a = cfg.Option(type=int)
+
+
+def test_flag_string_builtin_types():
+    assert flag_string("text") == "text"
+    assert flag_string(1) == 1
+    assert flag_string("!int:42") == 42
+    assert flag_string("!float:1.5") == 1.5
+    assert flag_string("!str:!int:1") == "!int:1"
+    assert flag_string("!bool:yes") is True
+    assert flag_string("!bool:off") is False
+
+
+def test_flag_string_is_not_evaluated():
+    with pytest.raises(TypeError):
+        flag_string("!__import__('os').getcwd:")
+    with pytest.raises(TypeError):
+        flag_string("!boolean:yes")
+    with pytest.raises(ValueError):
+        flag_string("!int")
+
+
+def test_registered_flag_types():
+    @cfg.process.scalar
+    def upper(value):
+        return value.upper()
+
+    register_flag_type(upper)
+    register_flag_type(functools.partial(int, base=2), name="binary")
+    register_flag_type(bool, name="flag")
+    assert flag_string("!upper:abc") == "ABC"
+    assert flag_string("!binary:101") == 5
+    assert flag_string("!flag:on") is True
+    assert flag_container({"a": ["!upper:x", {"b": "!int:1"}]}) == {"a": ["X", {"b": 1}]}
+    with pytest.raises(ValueError):
+        register_flag_type(functools.partial(int, base=2))
+
+
+def test_structures_are_not_flag_types():
+    for typ in (SubConfig, [int], {str: int}):
+        with pytest.raises(TypeError):
+            register_flag_type(typ, name="structure")
+    with pytest.raises(TypeError):
+        get_flag_type("structure")
+
+
+def test_flag_container_copy_on_write():
+    untouched = {"x": [1, 2, {"y": "plain"}]}
+    container = {"a": untouched, "b": [{"c": "!int:1"}, ["plain"]], "d": "!float:2"}
+    result = flag_container(container)
+    assert result == {"a": untouched, "b": [{"c": 1}, ["plain"]], "d": 2.0}
+    assert container == {"a": untouched, "b": [{"c": "!int:1"}, ["plain"]], "d": "!float:2"}
+    assert result is not container
+    assert result["a"] is untouched
+    assert result["b"] is not container["b"]
+    assert result["b"][1] is container["b"][1]
+    assert flag_container(untouched) is untouched
+
+
+def test_flag_container_inplace():
+    inner = {"c": "!int:1"}
+    container = {"a": [inner, "!bool:no"], "b": "plain"}
+    assert flag_container(container, inplace=True) is container
+    assert container == {"a": [{"c": 1}, False], "b": "plain"}
+    assert container["a"][0] is inner
+
+
+def test_iter_flag_container():
+    container = {"a": [{"c": "!int:1"}, "!bool:no"], "b": "plain", "d": {}}
+    assert list(iter_flag_container(container)) == [(("a", 0, "c"), 1), (("a", 1), False)]
+    assert container == {"a": [{"c": "!int:1"}, "!bool:no"], "b": "plain", "d": {}}
+    with pytest.raises(TypeError):
+        list(iter_flag_container("!int:1"))
@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from fancy import config as cfg
+
+SRC_DIR = Path(__file__).parents[2] / "src"
+
+IMPORT_TIME_BUDGET_US = int(os.environ.get("FANCY_CONFIG_IMPORT_BUDGET_US", "0"))
+"""
+An absolute budget of the cumulative import time of fancy.config, in microseconds, e.g. 150000.
+Wall-clock times depend on the machine, so it is only checked when it is set.
+"""
+
+IMPORT_TIME_RATIO_BUDGET = 4
+"""
+The budget of the import time of fancy.config relative to the one of dataclasses, imported
+first in the same process. It is about 2.5 now, and importing yaml and asyncio eagerly
+would bring it to about 5.
+"""
+
+ATTEMPTS = 3
+
+DEFERRED_MODULES = [
+    "yaml",
+    "argparse",
+    "asyncio",
+    "concurrent.futures",
+    "fancy.config.visitors",
+    "fancy.config.config_factory",
+    "fancy.config.config_loader_factory",
+]
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True, check=True)
+
+
+def test_heavy_modules_are_not_imported():
+    code = f"import sys, fancy.config; print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+    assert _run_python("-c", code).stdout.strip() == "[]"
+
+
+def _cumulative_import_times(code: str) -> Dict[str, int]:
+    stderr = _run_python("-X", "importtime", "-c", code).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time_budget():
+    attempts = [_cumulative_import_times("import dataclasses; import fancy.config") for _ in range(ATTEMPTS)]
+    # the best attempts, the others may be slowed down by the machine
+    assert min(times["fancy.config"] / times["dataclasses"] for times in attempts) < IMPORT_TIME_RATIO_BUDGET
+    if IMPORT_TIME_BUDGET_US:
+        assert min(times["fancy.config"] for times in attempts) < IMPORT_TIME_BUDGET_US
+
+
+@pytest.mark.parametrize("name", cfg.__all__)
+def test_public_names_are_available(name):
+    assert getattr(cfg, name) is not None
+    assert name in dir(cfg)
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        cfg.NotAName
@@ -0,0 +1,148 @@
+import copy
+import gc
+import pickle
+import threading
+
+from fancy import config as cfg
+
+
+class SubConfig(cfg.BaseConfig):
+    host = cfg.Option(type=str, default="localhost")
+
+
+class MyConfig(cfg.BaseConfig):
+    port = cfg.Option(type=int, default=80)
+    name = cfg.Option(type=str, default="app")
+    sub = cfg.Option(type=SubConfig, default={})
+    extra = cfg.PlaceHolder()
+
+    calls = None
+
+    def _address(self):
+        self.calls.append("address")
+        return f"{self.sub.host}:{self.port}"
+
+    def _url(self):
+        self.calls.append("url")
+        return f"http://{self.address}/"
+
+    def _title(self):
+        self.calls.append("title")
+        return self.name.title()
+
+    address = cfg.Lazy(_address)
+    url = cfg.Lazy(_url)
+    title = cfg.Lazy(_title)
+    with_extra = cfg.Lazy(lambda c: c.extra * 2)
+
+
+def _new_config():
+    config = MyConfig({})
+    config.calls = []
+    return config
+
+
+def test_recomputed_after_dependency_is_set():
+    config = _new_config()
+    assert config.address == "localhost:80"
+    config.port = 8081
+    assert config.address == "localhost:8081"
+    assert config.calls == ["address", "address"]
+
+
+def test_invalidated_transitively():
+    config = _new_config()
+    assert config.url == "http://localhost:80/"
+    assert config.title == "App"
+    config.port = 8081
+    assert config.url == "http://localhost:8081/"
+    assert config.title == "App"
+    assert config.calls == ["url", "address", "title", "url", "address"]
+
+
+def test_invalidated_by_sub_config():
+    config = _new_config()
+    assert config.url == "http://localhost:80/"
+    config.sub.host = "example.com"
+    assert config.url == "http://example.com:80/"
+
+
+def test_invalidated_by_delete_and_placeholders():
+    config = _new_config()
+    config.extra = 1
+    assert config.with_extra == 2
+    config.extra = 2
+    assert config.with_extra == 4
+
+    assert config.address == "localhost:80"
+    config.port = 8081
+    del config.port
+    assert config.address == "localhost:80"
+
+
+def test_unrelated_changes_keep_cached_values():
+    config = _new_config()
+    assert config.address == "localhost:80"
+    config.name = "other"
+    assert config.address == "localhost:80"
+    assert config.calls == ["address"]
+
+
+def test_readers_are_not_kept_alive():
+    class ReaderConfig(cfg.BaseConfig):
+        value = cfg.Lazy(lambda c: GLOBAL_CONFIG.port + 1)
+
+    for _ in range(100):
+        assert ReaderConfig({}).value == 81
+    gc.collect()
+    assert len(vars(GLOBAL_CONFIG)["_lazy_dependents"]["port"]) == 0
+
+    reader = ReaderConfig({})
+    assert reader.value == 81
+    GLOBAL_CONFIG.port = 90
+    assert reader.value == 91
+    GLOBAL_CONFIG.port = 80
+
+    assert "_lazy_dependents" not in vars(copy.deepcopy(GLOBAL_CONFIG))
+    assert pickle.loads(pickle.dumps(GLOBAL_CONFIG)).port == 80
+
+
+class StructureConfig(cfg.BaseConfig):
+    hosts = cfg.Option(type=[str], default=[])
+    matrix = cfg.Option(type=[[int]], default=[])
+    labels = cfg.Option(type={str: str}, default={})
+
+    count = cfg.Lazy(lambda c: len(c.hosts))
+    total = cfg.Lazy(lambda c: sum(map(sum, c.matrix)))
+    keys = cfg.Lazy(lambda c: sorted(c.labels))
+
+
+def test_invalidated_by_structure_mutations():
+    config = StructureConfig(hosts=["a"], matrix=[[1, 2]], labels={"env": "prod"})
+    assert (config.count, config.total, config.keys) == (1, 3, ["env"])
+    config.hosts.append("b")
+    config.matrix[0].append(3)
+    config.labels["zone"] = "eu"
+    assert (config.count, config.total, config.keys) == (2, 6, ["env", "zone"])
+
+
+GLOBAL_CONFIG = MyConfig({})
+
+
+def test_reads_in_other_threads_are_not_recorded():
+    started, release = threading.Event(), threading.Event()
+
+    class BlockingConfig(cfg.BaseConfig):
+        value = cfg.Lazy(lambda c: started.set() or release.wait(5))
+
+    thread = threading.Thread(target=lambda: BlockingConfig({}).value)
+    thread.start()
+    started.wait(5)
+    try:
+        config = StructureConfig(hosts=["a"], matrix=[[1]])
+        assert config.hosts == ["a"] and config.matrix == [[1]]
+        assert "_lazy_dependents" not in vars(config.hosts)
+        assert "_lazy_dependents" not in vars(config.matrix[0])
+    finally:
+        release.set()
+        thread.join()
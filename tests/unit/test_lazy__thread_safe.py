@@ -0,0 +1,76 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fancy import config as cfg
+
+N_THREADS = 8
+
+
+def _access_concurrently(config, name):
+    barrier = threading.Barrier(N_THREADS)
+
+    def access():
+        barrier.wait()
+        return getattr(config, name)
+
+    with ThreadPoolExecutor(N_THREADS) as executor:
+        futures = [executor.submit(access) for _ in range(N_THREADS)]
+    return futures
+
+
+def _slow(result):
+    calls = []
+
+    def compute(config):
+        calls.append(config)
+        threading.Event().wait(0.05)  # let the other threads arrive
+        return result(config)
+    return compute, calls
+
+
+def test_computed_once():
+    compute, calls = _slow(lambda c: object())
+
+    class MyConfig(cfg.BaseConfig):
+        value = cfg.Lazy(compute, thread_safe=True)
+
+    config = MyConfig()
+    results = [future.result() for future in _access_concurrently(config, "value")]
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert config.value is results[0]
+    assert MyConfig.value.thread_safe
+
+
+def test_exception_is_propagated_to_all_waiters():
+    def fail(config):
+        raise ValueError("failed")
+    compute, calls = _slow(fail)
+
+    class MyConfig(cfg.BaseConfig):
+        value = cfg.Lazy(compute, thread_safe=True)
+
+    config = MyConfig()
+    for future in _access_concurrently(config, "value"):
+        with pytest.raises(ValueError, match="failed"):
+            future.result()
+    assert "value" not in vars(config)
+
+
+def test_computed_per_instance():
+    class MyConfig(cfg.BaseConfig):
+        value = cfg.Lazy(lambda c: id(c), thread_safe=True)
+
+    first, second = MyConfig(), MyConfig()
+    assert first.value == id(first)
+    assert second.value == id(second)
+
+
+def test_recursive_computation():
+    class MyConfig(cfg.BaseConfig):
+        value = cfg.Lazy(lambda c: c.value, thread_safe=True)
+
+    with pytest.raises(RuntimeError):
+        _ = MyConfig().value
@@ -0,0 +1,102 @@
+import gc
+
+import pytest
+
+from fancy import config as cfg
+
+
+class Model:
+    def __init__(self, path):
+        self.path = path
+
+
+def _make_config_class(cache, calls):
+    def load(config):
+        calls.append(config.path)
+        return Model(config.path)
+
+    class ModelConfig(cfg.BaseConfig):
+        path = cfg.Option(type=str, required=True)
+        batch_size = cfg.Option(type=int, default=32)
+
+        model = cfg.MemoizedLazy(load, depends_on=["path"], cache=cache)
+        size = cfg.MemoizedLazy(lambda c: len(c.path) * c.batch_size, cache=cache)
+
+    return ModelConfig
+
+
+def test_shared_by_instances_with_same_inputs():
+    cache, calls = cfg.LazyCache(), []
+    ModelConfig = _make_config_class(cache, calls)
+    first = ModelConfig(path="a", batch_size=1)
+    second = ModelConfig(path="a", batch_size=2)
+    third = ModelConfig(path="b")
+    assert first.model is second.model
+    assert third.model is not first.model
+    assert calls == ["a", "b"]
+    assert (first.size, second.size) == (1, 2)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 4, 4)
+
+
+def test_invalidated_when_dependency_changes():
+    cache, calls = cfg.LazyCache(), []
+    ModelConfig = _make_config_class(cache, calls)
+    config = ModelConfig(path="a")
+    model = config.model
+    config.path = "b"
+    assert config.model.path == "b"
+    config.path = "a"
+    assert config.model is model
+    assert calls == ["a", "b"]
+
+
+def test_eviction():
+    cache, calls = cfg.LazyCache(maxsize=2), []
+    ModelConfig = _make_config_class(cache, calls)
+    configs = [ModelConfig(path=path) for path in "abc"]
+    models = [config.model for config in configs]
+    assert cache.cache_info().evictions == 1
+    assert ModelConfig(path="a").model is not models[0]
+    assert calls == ["a", "b", "c", "a"]
+
+
+def test_weak_values_are_not_pinned():
+    cache, calls = cfg.LazyCache(), []
+    ModelConfig = _make_config_class(cache, calls)
+    assert ModelConfig(path="a").model.path == "a"
+    gc.collect()
+    assert ModelConfig(path="a").model.path == "a"
+    assert calls == ["a", "a"]
+
+    strong_cache = cfg.LazyCache(weak=False)
+    ModelConfig = _make_config_class(strong_cache, calls)
+    assert ModelConfig(path="b").model.path == "b"
+    gc.collect()
+    assert ModelConfig(path="b").model.path == "b"
+    assert calls == ["a", "a", "b"]
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        cfg.LazyCache(maxsize=0)
+
+
+def test_keyed_by_options_of_sub_configs():
+    cache, calls = cfg.LazyCache(), []
+
+    class SubConfig(cfg.BaseConfig):
+        path = cfg.Option(type=str, default="a")
+
+        unhashable = cfg.Lazy(lambda c: calls.append("lazy") or [])
+
+    class MyConfig(cfg.BaseConfig):
+        sub = cfg.Option(type=SubConfig, default={})
+
+        model = cfg.MemoizedLazy(lambda c: Model(c.sub.path), cache=cache)
+
+    first, second = MyConfig({}), MyConfig({})
+    assert first.model is second.model
+    assert calls == []  # the lazy values of the sub-configs are not computed
+    second.sub.path = "b"
+    assert second.model.path == "b"
@@ -0,0 +1,36 @@
+import pytest
+
+from fancy import config as cfg
+
+
+class SubConfig(cfg.BaseConfig):
+    a: int = cfg.Option(default=0)
+
+
+class MyConfig(cfg.BaseConfig):
+    count = cfg.Option(type=int, default=0)
+    ratio = cfg.Option(type=float, nullable=True)
+    sub = cfg.Option(type=SubConfig, nullable=True)
+
+
+def test_scalar_option_converts_directly():
+    assert MyConfig.count._setter == MyConfig.count._set_scalar
+    config = MyConfig()
+    config.count = "42"
+    assert config.count == 42
+
+
+def test_structure_option_loads_value():
+    assert MyConfig.sub._setter == MyConfig.sub._set_structure
+    config = MyConfig({})
+    config.sub = {"a": 3}
+    assert config.sub.loaded
+    assert config.sub.a == 3
+
+
+def test_none_value():
+    config = MyConfig()
+    config.ratio = None
+    assert config.ratio is None
+    with pytest.raises(ValueError):
+        config.count = None
@@ -0,0 +1,117 @@
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fancy import config as cfg
+
+TTL = 0.05
+
+
+def _make_config_class(compute, executor, errors=None):
+    class InventoryConfig(cfg.BaseConfig):
+        hosts = cfg.TimedLazy(
+            compute, ttl=TTL, executor=executor,
+            on_refresh_error=None if errors is None else lambda c, e: errors.append(e),
+        )
+    return InventoryConfig
+
+
+def test_refreshed_in_background_after_ttl():
+    versions = iter(range(100))
+    release = threading.Event()
+
+    def compute(config):
+        version = next(versions)
+        if version > 0:
+            release.wait(5)
+        return version
+
+    executor = ThreadPoolExecutor(1)
+    InventoryConfig = _make_config_class(compute, executor)
+    config = InventoryConfig()
+    assert config.hosts == 0
+    assert config.hosts == 0
+
+    time.sleep(TTL * 2)
+    for _ in range(5):
+        assert config.hosts == 0  # the stale value is served while refreshing
+    release.set()
+    executor.shutdown(wait=True)
+    assert config.hosts == 1  # only one refresh
+
+
+def test_refresh_failure_keeps_last_good_value():
+    results = iter([["a"], ValueError("unreadable")])
+
+    def compute(config):
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    errors = []
+    executor = ThreadPoolExecutor(1)
+    InventoryConfig = _make_config_class(compute, executor, errors)
+    config = InventoryConfig()
+    assert config.hosts == ["a"]
+    time.sleep(TTL * 2)
+    assert config.hosts == ["a"]
+    executor.shutdown(wait=True)
+    assert config.hosts == ["a"]
+    assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+
+def test_default_refresh_error_warns():
+    with pytest.warns(RuntimeWarning):
+        cfg.timed_lazy.warn_refresh_error(cfg.BaseConfig(), ValueError("unreadable"))
+
+
+def test_invalid_ttl():
+    with pytest.raises(ValueError):
+        cfg.TimedLazy(lambda c: 1, ttl=0)
+
+
+def test_copies_are_refreshed_on_first_access():
+    versions = iter(range(100))
+    executor = ThreadPoolExecutor(1)
+    InventoryConfig = _make_config_class(lambda c: next(versions), executor)
+    config = InventoryConfig()
+    assert config.hosts == 0
+
+    copied = copy.deepcopy(config)
+    assert "_lazy_expires" not in vars(copied)  # monotonic times are specific to the process
+    assert copied.hosts == 0
+    executor.shutdown(wait=True)
+    assert copied.hosts == 1
+    assert vars(config)["hosts"] == 0  # without starting a refresh after the shutdown
+
+
+def test_refresh_from_old_values_is_dropped():
+    computing, release = threading.Event(), threading.Event()
+
+    def compute(config):
+        value = config.x * 10
+        if config.refreshes:
+            computing.set()
+            release.wait(5)
+        config.refreshes.append(value)
+        return value
+
+    class ScaledConfig(cfg.BaseConfig):
+        x = cfg.Option(type=int, default=1)
+        y = cfg.TimedLazy(compute, ttl=TTL)
+
+    config = ScaledConfig({})
+    config.refreshes = []
+    assert config.y == 10
+    config.refreshes.append("refresh")
+    time.sleep(TTL * 2)
+    assert config.y == 10  # starts a refresh
+    computing.wait(5)
+    config.x = 2
+    release.set()
+    time.sleep(TTL)
+    assert config.y == 20